@@ -5,9 +5,19 @@ This module provides a user-friendly widget-based interface for data scientists
 to interact with the experimentation platform without needing to use command-line tools.
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
+import os
 import subprocess
+import sys
 import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Coroutine
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 
@@ -15,15 +25,39 @@ import ipywidgets as widgets
 import yaml
 from IPython.display import clear_output
 
+# orjson decodes/encodes results rows several times faster than the stdlib when present
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YDumper
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+    from yaml import SafeLoader as _YLoader
+
 # Import the CLI components directly
 try:
+    import click
     from exp_platform_cli.cli import (
+        arun_experiment_with_resilience,
         discover_config_files,
-        load_and_validate_config,
+        run_directory,
         run_experiment_with_resilience,
     )
     from exp_platform_cli.models import ExperimentConfig
     from exp_platform_cli.services import ConfigLoader, DatasetService
+    from pydantic import ValidationError
 
     DIRECT_IMPORT = True
 except ImportError:
@@ -32,6 +66,295 @@ except ImportError:
     print("⚠️  Direct import failed, falling back to subprocess calls")
 
 
+_DATASETS_ROOT = Path("data/datasets")
+_EXPERIMENTS_ROOT = Path("data/experiments")
+
+
+# Temp config files written by any widget in this kernel, removed at interpreter
+# exit by a single hook so the hook does not keep the widgets themselves alive.
+_TMP_CONFIG_PATHS: set[Path] = set()
+
+
+@atexit.register
+def _remove_tmp_configs() -> None:
+    while _TMP_CONFIG_PATHS:
+        _TMP_CONFIG_PATHS.pop().unlink(missing_ok=True)
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create ``path`` (and parents) if needed and return it.
+
+    Not cached: the paths are relative to the notebook's working directory,
+    which may change or have the directory removed between runs.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+_DEFAULT_TUTORIAL_INFO = "<p>Select a tutorial to see more information.</p>"
+
+_TUTORIAL_INFO: dict[str, str] = {
+    "tutorials/01-quickstart": """
+    <div style='padding: 10px; background-color: #f0f8ff; border-left: 4px solid #007acc;'>
+    <h4>📖 Quickstart Tutorial (5 minutes)</h4>
+    <p><strong>What you'll learn:</strong></p>
+    <ul>
+        <li>How to install and verify the platform</li>
+        <li>Run your first conversation quality experiment</li>
+        <li>View and understand results</li>
+    </ul>
+    <p><strong>Prerequisites:</strong> None - perfect for beginners!</p>
+    </div>
+    """,
+    "tutorials/04-simple-experiment": """
+    <div style='padding: 10px; background-color: #f0fff0; border-left: 4px solid #28a745;'>
+    <h4>🏗️ Simple Experiment Tutorial</h4>
+    <p><strong>What you'll learn:</strong></p>
+    <ul>
+        <li>Build experiments from scratch</li>
+        <li>Create custom text summarization modules</li>
+        <li>Use multiple evaluators (relevance + quality)</li>
+        <li>Understand configuration patterns</li>
+    </ul>
+    <p><strong>Prerequisites:</strong> Basic Python knowledge</p>
+    </div>
+    """,
+    "tutorials/03-basic-concepts": """
+    <div style='padding: 10px; background-color: #fff8f0; border-left: 4px solid #fd7e14;'>
+    <h4>📚 Basic Concepts Guide</h4>
+    <p><strong>What you'll learn:</strong></p>
+    <ul>
+        <li>Platform architecture and components</li>
+        <li>Dataset, execution, and evaluation concepts</li>
+        <li>Configuration file structure</li>
+        <li>Best practices and workflows</li>
+    </ul>
+    <p><strong>Prerequisites:</strong> Completed quickstart tutorial</p>
+    </div>
+    """,
+}
+
+
+# RingOutputs receiving ``sys.stdout`` writes made in the current context, innermost
+# last. Context variables are per asyncio task and are copied into threads started
+# with ``asyncio.to_thread``, so a running handler never captures other cells' output.
+_stdout_route: ContextVar[tuple["RingOutput", ...]] = ContextVar("_stdout_route", default=())
+
+
+class _RoutedStdout:
+    """``sys.stdout`` stand-in writing to the RingOutput routed in the current context."""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+
+    def _target(self) -> Any:
+        route = _stdout_route.get()
+        return route[-1] if route else self._stream
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def _install_routed_stdout() -> None:
+    """Wrap the current ``sys.stdout`` so writes can be routed per context."""
+    if not isinstance(sys.stdout, _RoutedStdout):
+        sys.stdout = _RoutedStdout(sys.stdout)
+
+
+class RingOutput(widgets.Output):
+    """Output widget that keeps only the most recent ``max_lines`` lines of printed text.
+
+    While used as a context manager, ``sys.stdout`` writes from the same context (the
+    handler's task and the threads it starts) go into a bounded deque and the widget
+    content is replaced with the retained lines, so long-running handlers cannot
+    grow the rendered log without limit. Each render resends every retained
+    line, so renders are throttled to one per ``render_interval`` seconds and the
+    remainder is rendered when the context exits.
+    """
+
+    def __init__(self, max_lines: int = 2000, render_interval: float = 0.25, **kwargs):
+        super().__init__(**kwargs)
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._partial = ""
+        self._lock = threading.Lock()
+        self._render_interval = render_interval
+        self._last_render = 0.0
+        self._dirty = False
+
+    def write(self, text: str) -> int:
+        """File-like ``write`` used while the widget is routed ``sys.stdout``."""
+        with self._lock:
+            *complete, self._partial = (self._partial + text).split("\n")
+            if complete:
+                self._lines.extend(complete)
+                self._dirty = True
+                if time.monotonic() - self._last_render >= self._render_interval:
+                    self._render()
+        return len(text)
+
+    def flush(self) -> None:
+        """File-like ``flush``; rendering is throttled, see :meth:`write`."""
+
+    def clear_output(self, *args, **kwargs) -> None:
+        """Drop all retained lines and clear the widget."""
+        self._lines.clear()
+        self._partial = ""
+        self._dirty = False
+        self.outputs = ()
+
+    def _render(self) -> None:
+        self._dirty = False
+        self._last_render = time.monotonic()
+        text = "\n".join(self._lines) + "\n"
+        self.outputs = ({"output_type": "stream", "name": "stdout", "text": text},)
+
+    def __enter__(self):
+        super().__enter__()
+        _install_routed_stdout()
+        _stdout_route.set((*_stdout_route.get(), self))
+        return self
+
+    def __exit__(self, etype, evalue, tb):
+        _stdout_route.set(_stdout_route.get()[:-1])
+        with self._lock:
+            if self._partial:
+                self._lines.append(self._partial)
+                self._partial = ""
+                self._dirty = True
+            if self._dirty:
+                self._render()
+        return super().__exit__(etype, evalue, tb)
+
+
+def _set_if_changed(widget: widgets.Widget, name: str, value: Any) -> None:
+    """Assign a widget trait only when it differs, avoiding a redundant comms sync."""
+    if getattr(widget, name) != value:
+        setattr(widget, name, value)
+
+
+def _stream_command(cmd: list[str], flush_every: int = 20) -> int:
+    """Run a command, echoing its combined stdout/stderr line by line as it arrives."""
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, cwd="."
+    )
+    for count, line in enumerate(proc.stdout, 1):
+        print(line, end="")
+        if count % flush_every == 0:
+            sys.stdout.flush()
+    return proc.wait()
+
+
+def _run_experiment_subprocess(config_path: Path) -> None:
+    """Run a config through the ``exp-cli run`` executable."""
+    returncode = _stream_command(["exp-cli", "run", str(config_path)])
+    if returncode != 0:
+        raise RuntimeError(f"exp-cli run exited with code {returncode}")
+
+
+async def _stream_command_async(cmd: list[str], output: widgets.Output) -> int:
+    """Run a command without blocking the kernel, appending each output line to ``output``."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    try:
+        async for line in proc.stdout:
+            with output:
+                print(line.decode(errors="replace"), end="")
+        return await proc.wait()
+    except asyncio.CancelledError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+
+def _schedule(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Schedule ``coro`` on the running event loop (the kernel's), or run it to completion."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    return asyncio.ensure_future(coro)
+
+
+async def _run_experiment_in_process(config_path: Path, output: widgets.Output) -> None:
+    """Run a config in this interpreter without blocking the kernel's event loop."""
+    with output:
+        await arun_experiment_with_resilience(config_path)
+
+
+async def _run_experiment_subprocess_async(config_path: Path, output: widgets.Output) -> None:
+    """Run a config through the ``exp-cli run`` executable without blocking the kernel."""
+    returncode = await _stream_command_async(["exp-cli", "run", str(config_path)], output)
+    if returncode != 0:
+        raise RuntimeError(f"exp-cli run exited with code {returncode}")
+
+
+def _invoke_run_directory(args: list[str]) -> int:
+    """Run the ``run-directory`` command and return its exit code."""
+    try:
+        result = run_directory.main(args, standalone_mode=False)
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+    except click.exceptions.Abort:
+        print("Aborted!")
+        return 1
+    except click.ClickException as exc:
+        print(f"Error: {exc.format_message()}")
+        return exc.exit_code
+    return result if isinstance(result, int) else 0
+
+
+async def _run_directory_in_process(
+    directory: str, install_deps: bool, output: widgets.Output
+) -> int:
+    """Invoke ``run-directory`` in a worker thread and return its exit code."""
+    args = [directory, "--install-deps"] if install_deps else [directory]
+    with output:
+        return await asyncio.to_thread(_invoke_run_directory, args)
+
+
+async def _run_directory_subprocess(
+    directory: str, install_deps: bool, output: widgets.Output
+) -> int:
+    """Invoke ``exp-cli run-directory`` in a child process and return its exit code."""
+    cmd = ["exp-cli", "run-directory", directory]
+    if install_deps:
+        cmd.append("--install-deps")
+    return await _stream_command_async(cmd, output)
+
+
+# DIRECT_IMPORT is fixed at import time, so pick the runners once. The widget
+# handlers await the *_ASYNC runners; quick_experiment uses the blocking one.
+if DIRECT_IMPORT:
+    _RUN_EXPERIMENT = run_experiment_with_resilience
+    _RUN_EXPERIMENT_ASYNC = _run_experiment_in_process
+    _RUN_DIRECTORY_ASYNC = _run_directory_in_process
+else:
+    _RUN_EXPERIMENT = _run_experiment_subprocess
+    _RUN_EXPERIMENT_ASYNC = _run_experiment_subprocess_async
+    _RUN_DIRECTORY_ASYNC = _run_directory_subprocess
+
+
+def _scan_experiment_dir(path: Path) -> dict[str, os.DirEntry]:
+    """List an experiment directory once, keyed by entry name."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _find_config_entry(entries: dict[str, os.DirEntry]) -> os.DirEntry | None:
+    """Return the first ``config.*`` entry from a directory listing."""
+    return next((entries[name] for name in sorted(entries) if name.startswith("config.")), None)
+
+
 class ExperimentPlatformWidget:
     """Main widget interface for the Experimentation Platform."""
 
@@ -39,6 +362,8 @@ class ExperimentPlatformWidget:
         self.config_data = {}
         self.current_config_path = None
         self.experiment_results = []
+        self._tmp_cfg: tuple[str, Path] | None = None
+        self._task: asyncio.Future | None = None
 
         # Create all widgets
         self._create_widgets()
@@ -83,7 +408,7 @@ class ExperimentPlatformWidget:
         ]
 
         # Output area
-        self.output = widgets.Output(layout=widgets.Layout(height="300px", overflow="scroll"))
+        self.output = RingOutput(layout=widgets.Layout(height="300px", overflow="scroll"))
 
     def _create_experiment_designer(self):
         """Create the experiment designer interface."""
@@ -126,7 +451,7 @@ class ExperimentPlatformWidget:
         # Output settings
         self.output_path = widgets.Text(
             description="Output Path:",
-            value="data/experiments",
+            value=str(_EXPERIMENTS_ROOT),
             style={"description_width": "120px"},
         )
 
@@ -208,7 +533,7 @@ class ExperimentPlatformWidget:
         # Results directory browser
         self.results_dir = widgets.Text(
             description="Results Dir:",
-            value="data/experiments",
+            value=str(_EXPERIMENTS_ROOT),
             style={"description_width": "100px"},
         )
 
@@ -258,7 +583,7 @@ class ExperimentPlatformWidget:
         )
 
         # Tutorial info
-        self.tutorial_info = widgets.HTML(value="<p>Select a tutorial to see more information.</p>")
+        self.tutorial_info = widgets.HTML(value=_DEFAULT_TUTORIAL_INFO)
 
         # Layout
         controls = widgets.HBox([self.tutorial_selector, self.install_deps, self.run_tutorial_btn])
@@ -305,7 +630,7 @@ class ExperimentPlatformWidget:
     def _on_generate_config(self, button):
         """Generate configuration from form inputs."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
             print("🔧 Generating configuration...")
 
             try:
@@ -337,12 +662,12 @@ class ExperimentPlatformWidget:
                         for eval_name in self.evaluator_selector.value
                     ],
                     "local_mode": self.local_mode.value,
-                    "output_path": self.output_path.value or "data/experiments",
+                    "output_path": self.output_path.value or str(_EXPERIMENTS_ROOT),
                 }
 
                 # Update config editor
-                yaml_config = yaml.dump(config, default_flow_style=False, indent=2)
-                self.config_editor.value = yaml_config
+                yaml_config = yaml.dump(config, default_flow_style=False, indent=2, Dumper=_YDumper)
+                _set_if_changed(self.config_editor, "value", yaml_config)
 
                 # Create dataset if data provided
                 if input_data:
@@ -358,60 +683,74 @@ class ExperimentPlatformWidget:
             except Exception as e:
                 print(f"❌ Error generating config: {e}")
 
+    def _materialize_config(self) -> Path:
+        """Write the editor contents to a temp file, reusing it while the text is unchanged."""
+        text = self.config_editor.value
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        if self._tmp_cfg is not None:
+            cached_digest, cached_path = self._tmp_cfg
+            if cached_digest == digest and cached_path.exists():
+                return cached_path
+            self._cleanup_tmp_config()
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(text)
+            config_path = Path(f.name)
+
+        _TMP_CONFIG_PATHS.add(config_path)
+        self._tmp_cfg = (digest, config_path)
+        return config_path
+
+    def _cleanup_tmp_config(self):
+        """Remove the cached temp config file, if any."""
+        if self._tmp_cfg is not None:
+            path = self._tmp_cfg[1]
+            _TMP_CONFIG_PATHS.discard(path)
+            path.unlink(missing_ok=True)
+            self._tmp_cfg = None
+
     def _create_dataset(self, name: str, version: str, data: list[dict]):
         """Create a dataset from input data."""
-        dataset_dir = Path("data/datasets") / name / version
-        dataset_dir.mkdir(parents=True, exist_ok=True)
+        dataset_dir = _ensure_dir(_DATASETS_ROOT / name / version)
 
         dataset_file = dataset_dir / "data.jsonl"
         with dataset_file.open("w") as f:
             for item in data:
-                f.write(json.dumps(item) + "\\n")
+                f.write(_dumps(item) + "\n")
 
     def _on_run_experiment(self, button):
         """Run the experiment."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
             print("🚀 Running experiment...")
 
-            try:
-                if not self.config_editor.value.strip():
-                    print("❌ No configuration available. Generate config first.")
-                    return
-
-                # Save config to temporary file
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                    f.write(self.config_editor.value)
-                    config_path = f.name
-
-                try:
-                    if DIRECT_IMPORT:
-                        # Use direct function call
-                        result = run_experiment_with_resilience(Path(config_path))
-                        print("✅ Experiment completed successfully!")
-                    else:
-                        # Use subprocess
-                        result = subprocess.run(
-                            ["exp-cli", "run", config_path], capture_output=True, text=True, cwd="."
-                        )
+            if not self.config_editor.value.strip():
+                print("❌ No configuration available. Generate config first.")
+                return
 
-                        if result.returncode == 0:
-                            print("✅ Experiment completed successfully!")
-                            print(result.stdout)
-                        else:
-                            print(f"❌ Experiment failed: {result.stderr}")
+            try:
+                config_path = self._materialize_config()
+            except Exception as e:
+                print(f"❌ Error running experiment: {e}")
+                return
 
-                finally:
-                    # Clean up temp file
-                    Path(config_path).unlink(missing_ok=True)
+        self._task = _schedule(self._run_experiment_task(config_path))
 
-            except Exception as e:
+    async def _run_experiment_task(self, config_path: Path):
+        """Run the experiment without blocking the kernel's event loop."""
+        try:
+            await _RUN_EXPERIMENT_ASYNC(config_path, self.output)
+            with self.output:
+                print("✅ Experiment completed successfully!")
+        except Exception as e:
+            with self.output:
                 print(f"❌ Error running experiment: {e}")
 
     def _on_load_config(self, button):
         """Load configuration from file."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
             print(f"📁 Loading config from {self.config_file_path.value}...")
 
             try:
@@ -423,9 +762,8 @@ class ExperimentPlatformWidget:
                 with config_path.open() as f:
                     if config_path.suffix.lower() in [".yaml", ".yml"]:
                         content = f.read()
-                    else:  # JSON
-                        data = json.load(f)
-                        content = yaml.dump(data, default_flow_style=False, indent=2)
+                    else:  # JSON is a YAML subset, so the editor accepts it as-is
+                        content = json.dumps(json.load(f), indent=2)
 
                 self.config_editor.value = content
                 self.current_config_path = config_path
@@ -437,7 +775,7 @@ class ExperimentPlatformWidget:
     def _on_save_config(self, button):
         """Save configuration to file."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
 
             if not self.config_file_path.value.strip():
                 print("❌ Please specify a file path")
@@ -458,7 +796,7 @@ class ExperimentPlatformWidget:
     def _on_validate_config(self, button):
         """Validate the current configuration."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
             print("🔍 Validating configuration...")
 
             try:
@@ -467,62 +805,80 @@ class ExperimentPlatformWidget:
                     return
 
                 # Parse YAML
-                config_data = yaml.safe_load(self.config_editor.value)
+                config_data = yaml.load(self.config_editor.value, Loader=_YLoader)
 
-                # Basic validation
-                required_fields = ["dataset", "executable"]
-                missing_fields = [field for field in required_fields if field not in config_data]
-
-                if missing_fields:
-                    print(f"❌ Missing required fields: {missing_fields}")
-                    self.validation_output.value = (
-                        f"<div style='color: red;'>❌ Missing: {', '.join(missing_fields)}</div>"
-                    )
-                    return
-
-                # More detailed validation if direct import available
+                # Validate against the pydantic model if direct import available
                 if DIRECT_IMPORT:
-                    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                        f.write(self.config_editor.value)
-                        temp_path = f.name
-
                     try:
-                        config = load_and_validate_config(Path(temp_path))
+                        ExperimentConfig.model_validate(config_data)
                         print("✅ Configuration is valid!")
-                        self.validation_output.value = (
-                            "<div style='color: green;'>✅ Configuration is valid!</div>"
+                        _set_if_changed(
+                            self.validation_output,
+                            "value",
+                            "<div style='color: green;'>✅ Configuration is valid!</div>",
+                        )
+                    except ValidationError as e:
+                        problems = [
+                            f"{'.'.join(str(part) for part in error['loc']) or 'config'}: "
+                            f"{error['msg']}"
+                            for error in e.errors()
+                        ]
+                        print(f"❌ Validation error: {'; '.join(problems)}")
+                        _set_if_changed(
+                            self.validation_output,
+                            "value",
+                            f"<div style='color: red;'>❌ {'<br>'.join(problems)}</div>",
                         )
-                    except Exception as e:
-                        print(f"❌ Validation error: {e}")
-                        self.validation_output.value = f"<div style='color: red;'>❌ {str(e)}</div>"
-                    finally:
-                        Path(temp_path).unlink(missing_ok=True)
                 else:
+                    required_fields = ["dataset", "executable"]
+                    missing_fields = [
+                        field
+                        for field in required_fields
+                        if not isinstance(config_data, dict) or field not in config_data
+                    ]
+                    if missing_fields:
+                        print(f"❌ Missing required fields: {missing_fields}")
+                        _set_if_changed(
+                            self.validation_output,
+                            "value",
+                            "<div style='color: red;'>"
+                            f"❌ Missing: {', '.join(missing_fields)}</div>",
+                        )
+                        return
+
                     print("✅ Basic validation passed!")
-                    self.validation_output.value = (
-                        "<div style='color: green;'>✅ Basic validation passed!</div>"
+                    _set_if_changed(
+                        self.validation_output,
+                        "value",
+                        "<div style='color: green;'>✅ Basic validation passed!</div>",
                     )
 
             except yaml.YAMLError as e:
                 print(f"❌ YAML parsing error: {e}")
-                self.validation_output.value = (
-                    f"<div style='color: red;'>❌ YAML Error: {str(e)}</div>"
+                _set_if_changed(
+                    self.validation_output,
+                    "value",
+                    f"<div style='color: red;'>❌ YAML Error: {str(e)}</div>",
                 )
             except Exception as e:
                 print(f"❌ Validation error: {e}")
-                self.validation_output.value = f"<div style='color: red;'>❌ Error: {str(e)}</div>"
+                _set_if_changed(
+                    self.validation_output,
+                    "value",
+                    f"<div style='color: red;'>❌ Error: {str(e)}</div>",
+                )
 
     def _on_refresh_results(self, button):
         """Refresh the results list."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
             print("🔄 Refreshing results...")
 
             try:
                 results_dir = Path(self.results_dir.value)
                 if not results_dir.exists():
                     print(f"❌ Results directory not found: {results_dir}")
-                    self.results_list.options = []
+                    _set_if_changed(self.results_list, "options", ())
                     return
 
                 # Find experiment directories
@@ -534,7 +890,7 @@ class ExperimentPlatformWidget:
                         experiments.append((str(rel_path), str(path)))
 
                 experiments.sort(key=lambda x: x[1], reverse=True)  # Most recent first
-                self.results_list.options = experiments
+                _set_if_changed(self.results_list, "options", tuple(experiments))
 
                 print(f"✅ Found {len(experiments)} experiments")
 
@@ -555,10 +911,12 @@ class ExperimentPlatformWidget:
                 print(f"📊 Experiment: {experiment_path.name}")
                 print("=" * 50)
 
+                entries = _scan_experiment_dir(experiment_path)
+
                 # Load config if available
-                config_files = list(experiment_path.glob("config.*"))
-                if config_files:
-                    config_file = config_files[0]
+                config_entry = _find_config_entry(entries)
+                if config_entry is not None:
+                    config_file = Path(config_entry.path)
                     print(f"\\n⚙️ Configuration ({config_file.name}):")
                     if config_file.suffix.lower() in [".yaml", ".yml"]:
                         with config_file.open() as f:
@@ -570,10 +928,10 @@ class ExperimentPlatformWidget:
                         )
 
                 # Load results if available
-                results_file = experiment_path / "local_metrics_summary.json"
-                if results_file.exists():
-                    with results_file.open() as f:
-                        results = json.load(f)
+                metrics_entry = entries.get("local_metrics_summary.json")
+                if metrics_entry is not None:
+                    with open(metrics_entry.path) as f:
+                        results = _loads(f.read())
 
                     print("\\n📈 Results Summary:")
                     for evaluator, metrics in results.items():
@@ -585,17 +943,22 @@ class ExperimentPlatformWidget:
                                 print(f"    {metric}: {value}")
 
                 # Load execution data
-                data_file = experiment_path / "data.jsonl"
-                if data_file.exists():
+                data_entry = entries.get("data.jsonl")
+                if data_entry is not None:
                     print("\\n📋 Execution Data:")
-                    with data_file.open() as f:
-                        lines = f.readlines()
-                    print(f"  Total rows: {len(lines)}")
+                    # Count rows and keep a short preview in a single streaming pass
+                    preview, total = [], 0
+                    with open(data_entry.path) as f:
+                        for i, line in enumerate(f):
+                            total = i + 1
+                            if i < 3:
+                                preview.append(line)
+                    print(f"  Total rows: {total}")
 
                     # Show first few results
-                    for i, line in enumerate(lines[:3]):
+                    for i, line in enumerate(preview):
                         try:
-                            row_data = json.loads(line)
+                            row_data = _loads(line)
                             print(f"  Row {i+1}: {row_data.get('id', 'unknown')}")
                             if "data_output" in row_data:
                                 output = str(row_data["data_output"])
@@ -607,8 +970,8 @@ class ExperimentPlatformWidget:
                         except Exception:
                             pass
 
-                    if len(lines) > 3:
-                        print(f"    ... and {len(lines) - 3} more rows")
+                    if total > 3:
+                        print(f"    ... and {total - 3} more rows")
 
             except Exception as e:
                 print(f"❌ Error loading results: {e}")
@@ -616,80 +979,47 @@ class ExperimentPlatformWidget:
     def _on_run_tutorial(self, button):
         """Run the selected tutorial."""
         with self.output:
-            clear_output(wait=True)
+            self.output.clear_output(wait=True)
             tutorial_path = self.tutorial_selector.value
             print(f"🎓 Running tutorial: {tutorial_path}")
 
-            try:
-                cmd = ["exp-cli", "run-directory", tutorial_path]
-                if self.install_deps.value:
-                    cmd.append("--install-deps")
+            print("\\n📋 Output:")
 
-                result = subprocess.run(cmd, capture_output=True, text=True, cwd=".")
+        self._task = _schedule(self._run_tutorial_task(tutorial_path, self.install_deps.value))
 
-                if result.returncode == 0:
+    async def _run_tutorial_task(self, tutorial_path: str, install_deps: bool):
+        """Run the tutorial directory without blocking the kernel's event loop."""
+        try:
+            returncode = await _RUN_DIRECTORY_ASYNC(tutorial_path, install_deps, self.output)
+            with self.output:
+                if returncode == 0:
                     print("✅ Tutorial completed successfully!")
-                    print("\\n📋 Output:")
-                    print(result.stdout)
                 else:
-                    print("❌ Tutorial failed:")
-                    print(result.stderr)
-
-            except Exception as e:
+                    print(f"❌ Tutorial failed with exit code {returncode}")
+        except Exception as e:
+            with self.output:
                 print(f"❌ Error running tutorial: {e}")
 
     def _on_tutorial_selected(self, change):
         """Update tutorial information when selection changes."""
-        tutorial_info = {
-            "tutorials/01-quickstart": """
-            <div style='padding: 10px; background-color: #f0f8ff; border-left: 4px solid #007acc;'>
-            <h4>📖 Quickstart Tutorial (5 minutes)</h4>
-            <p><strong>What you'll learn:</strong></p>
-            <ul>
-                <li>How to install and verify the platform</li>
-                <li>Run your first conversation quality experiment</li>
-                <li>View and understand results</li>
-            </ul>
-            <p><strong>Prerequisites:</strong> None - perfect for beginners!</p>
-            </div>
-            """,
-            "tutorials/04-simple-experiment": """
-            <div style='padding: 10px; background-color: #f0fff0; border-left: 4px solid #28a745;'>
-            <h4>🏗️ Simple Experiment Tutorial</h4>
-            <p><strong>What you'll learn:</strong></p>
-            <ul>
-                <li>Build experiments from scratch</li>
-                <li>Create custom text summarization modules</li>
-                <li>Use multiple evaluators (relevance + quality)</li>
-                <li>Understand configuration patterns</li>
-            </ul>
-            <p><strong>Prerequisites:</strong> Basic Python knowledge</p>
-            </div>
-            """,
-            "tutorials/03-basic-concepts": """
-            <div style='padding: 10px; background-color: #fff8f0; border-left: 4px solid #fd7e14;'>
-            <h4>📚 Basic Concepts Guide</h4>
-            <p><strong>What you'll learn:</strong></p>
-            <ul>
-                <li>Platform architecture and components</li>
-                <li>Dataset, execution, and evaluation concepts</li>
-                <li>Configuration file structure</li>
-                <li>Best practices and workflows</li>
-            </ul>
-            <p><strong>Prerequisites:</strong> Completed quickstart tutorial</p>
-            </div>
-            """,
-        }
-
         selected = change["new"]
-        self.tutorial_info.value = tutorial_info.get(
-            selected, "<p>Select a tutorial to see more information.</p>"
+        _set_if_changed(
+            self.tutorial_info, "value", _TUTORIAL_INFO.get(selected, _DEFAULT_TUTORIAL_INFO)
         )
 
     def display(self):
         """Display the main widget interface."""
         return self.main_container
 
+    def close(self):
+        """Remove the temp config file and close every widget in the interface."""
+        self._cleanup_tmp_config()
+        pending = [self.main_container]
+        while pending:
+            widget = pending.pop()
+            pending.extend(getattr(widget, "children", ()))
+            widget.close()
+
 
 def create_experiment_interface():
     """Create and return the experiment interface widget."""
@@ -727,7 +1057,7 @@ def quick_experiment(
     data: list[dict[str, Any]],
     evaluators: list[str] = None,
     dataset_name: str = "quick_experiment",
-    output_path: str = "data/experiments",
+    output_path: str = str(_EXPERIMENTS_ROOT),
 ) -> str:
     """
     Run a quick experiment with minimal setup.
@@ -761,31 +1091,21 @@ def quick_experiment(
     }
 
     # Create dataset
-    dataset_dir = Path("data/datasets") / dataset_name / "1.0"
-    dataset_dir.mkdir(parents=True, exist_ok=True)
+    dataset_dir = _ensure_dir(_DATASETS_ROOT / dataset_name / "1.0")
 
     dataset_file = dataset_dir / "data.jsonl"
     with dataset_file.open("w") as f:
         for item in data:
-            f.write(json.dumps(item) + "\\n")
+            f.write(_dumps(item) + "\n")
 
     # Create and run config
     with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(config, f, default_flow_style=False, indent=2)
+        yaml.dump(config, f, default_flow_style=False, indent=2, Dumper=_YDumper)
         config_path = f.name
 
     try:
-        if DIRECT_IMPORT:
-            result = run_experiment_with_resilience(Path(config_path))
-            print("✅ Experiment completed successfully!")
-        else:
-            result = subprocess.run(["exp-cli", "run", config_path], capture_output=True, text=True)
-
-            if result.returncode == 0:
-                print("✅ Experiment completed successfully!")
-                print(result.stdout)
-            else:
-                print(f"❌ Experiment failed: {result.stderr}")
+        _RUN_EXPERIMENT(Path(config_path))
+        print("✅ Experiment completed successfully!")
 
     finally:
         Path(config_path).unlink(missing_ok=True)
@@ -805,31 +1125,32 @@ def load_results(experiment_path: str) -> dict[str, Any]:
         Dictionary containing results, config, and metadata
     """
     exp_path = Path(experiment_path)
+    entries = _scan_experiment_dir(exp_path)
     results = {}
 
     # Load metrics
-    metrics_file = exp_path / "local_metrics_summary.json"
-    if metrics_file.exists():
-        with metrics_file.open() as f:
-            results["metrics"] = json.load(f)
+    metrics_entry = entries.get("local_metrics_summary.json")
+    if metrics_entry is not None:
+        with open(metrics_entry.path) as f:
+            results["metrics"] = _loads(f.read())
 
     # Load config
-    config_files = list(exp_path.glob("config.*"))
-    if config_files:
-        config_file = config_files[0]
+    config_entry = _find_config_entry(entries)
+    if config_entry is not None:
+        config_file = Path(config_entry.path)
         with config_file.open() as f:
             if config_file.suffix.lower() in [".yaml", ".yml"]:
-                results["config"] = yaml.safe_load(f)
+                results["config"] = yaml.load(f, Loader=_YLoader)
             else:
-                results["config"] = json.load(f)
+                results["config"] = _loads(f.read())
 
     # Load execution data
-    data_file = exp_path / "data.jsonl"
-    if data_file.exists():
+    data_entry = entries.get("data.jsonl")
+    if data_entry is not None:
         results["rows"] = []
-        with data_file.open() as f:
+        with open(data_entry.path) as f:
             for line in f:
                 if line.strip():
-                    results["rows"].append(json.loads(line))
+                    results["rows"].append(_loads(line))
 
     return results
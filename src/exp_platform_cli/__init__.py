@@ -1,27 +1,57 @@
 """Experimentation platform CLI package."""
 
-from importlib import metadata
+from __future__ import annotations
 
-from .evaluators import BaseEvaluator, EvaluatorOutput, load_evaluators, register_evaluator
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from ._version import __version__
 from .logger import SUCCESS_LEVEL, ExperimentLogger, get_logger
-from .models import (
-    DataModel,
-    DataModelRow,
-    DataModelRowError,
-    DatasetModel,
-    DataType,
-    EvaluatorConfig,
-    ExperimentConfig,
-    ModuleExecutableConfig,
-)
-from .orchestrator import Orchestrator
-from .services import (
-    CloudEvaluationService,
-    ConfigLoader,
-    DatasetService,
-    EvaluationService,
-    LocalEvaluationService,
-)
+
+if TYPE_CHECKING:
+    from .evaluators import BaseEvaluator, EvaluatorOutput, load_evaluators, register_evaluator
+    from .models import (
+        DataModel,
+        DataModelRow,
+        DataModelRowError,
+        DatasetModel,
+        DataType,
+        EvaluatorConfig,
+        ExperimentConfig,
+        ModuleExecutableConfig,
+    )
+    from .orchestrator import Orchestrator
+    from .services import (
+        CloudEvaluationService,
+        ConfigLoader,
+        DatasetService,
+        EvaluationService,
+        LocalEvaluationService,
+    )
+
+# Heavy re-exports are resolved on first attribute access (PEP 562) so that
+# importing the package, e.g. for ``exp-cli --help``, does not pull in pandas,
+# pydantic models, and every evaluator up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    "BaseEvaluator": ".evaluators",
+    "EvaluatorOutput": ".evaluators",
+    "load_evaluators": ".evaluators",
+    "register_evaluator": ".evaluators",
+    "Orchestrator": ".orchestrator",
+    "ConfigLoader": ".services",
+    "DatasetService": ".services",
+    "EvaluationService": ".services",
+    "LocalEvaluationService": ".services",
+    "CloudEvaluationService": ".services",
+    "DataModel": ".models",
+    "DataModelRow": ".models",
+    "DataModelRowError": ".models",
+    "DatasetModel": ".models",
+    "DataType": ".models",
+    "EvaluatorConfig": ".models",
+    "ExperimentConfig": ".models",
+    "ModuleExecutableConfig": ".models",
+}
 
 __all__ = [
     "__version__",
@@ -46,18 +76,17 @@ __all__ = [
     "EvaluatorConfig",
     "ExperimentConfig",
     "ModuleExecutableConfig",
-    "load_evaluators",
-    "register_evaluator",
-    "BaseEvaluator",
-    "EvaluatorOutput",
 ]
 
 
-def _load_version() -> str:
-    try:
-        return metadata.version("exp-platform-cli")
-    except metadata.PackageNotFoundError:
-        return "0.0.0"
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
-__version__ = _load_version()
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
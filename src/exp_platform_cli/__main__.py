@@ -1,9 +1,4 @@
-from .cli import cli
-
-
-def main() -> None:
-    cli()
-
+from .entrypoint import main
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,3 @@
+"""Package version; the single source read by hatchling at build time."""
+
+__version__ = "0.1.0"
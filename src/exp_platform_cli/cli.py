@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
+import hashlib
+import importlib
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import os
+import random
+import re
+import shutil
+import stat
+import subprocess
 import sys
 import time
-import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import click
+import yaml
+from pydantic import ValidationError
+from rich.markup import escape
 
+from ._version import __version__
 from .logger import get_logger
-from .orchestrator import Orchestrator
 from .services.config_loader import ConfigLoader
-from .services.dataset_service import DatasetService
 from .utils import ensure_directories
 
 logger = get_logger()
@@ -42,21 +59,47 @@ class ExecutionError(ExperimentError):
     pass
 
 
+# Failures that will recur on every attempt; retrying them only adds latency.
+_DETERMINISTIC_ERRORS = (
+    yaml.YAMLError,
+    json.JSONDecodeError,
+    ValidationError,
+    UnicodeDecodeError,
+    PermissionError,
+    IsADirectoryError,
+)
+# Failures that may clear up on their own (file system races, network hiccups).
+_TRANSIENT_ERRORS = (OSError, TimeoutError)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Return True when *error* is worth retrying."""
+    return isinstance(error, _TRANSIENT_ERRORS) and not isinstance(error, _DETERMINISTIC_ERRORS)
+
+
+def _backoff_delay(base: float, attempt: int, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff so concurrent retries do not synchronise."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
 def validate_config_file(config_path: Path) -> None:
-    """Validate configuration file exists and is readable."""
-    if not config_path.exists():
-        raise ConfigurationError(f"Configuration file not found: {config_path}")
+    """Validate configuration file exists and is a regular file.
+
+    Readability and encoding are checked by the real open in
+    ``load_and_validate_config`` rather than by reading the file twice.
+    """
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError as e:
+        raise ConfigurationError(f"Configuration file not found: {config_path}") from e
+    except OSError as e:
+        raise ConfigurationError(f"Cannot access configuration file {config_path}: {e}") from e
 
-    if not config_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ConfigurationError(f"Configuration path is not a file: {config_path}")
 
     if config_path.suffix.lower() not in [".yaml", ".yml", ".json"]:
-        logger.warning(f"Configuration file has unexpected extension: {config_path.suffix}")
-
-    try:
-        config_path.read_text(encoding="utf-8")
-    except Exception as e:
-        raise ConfigurationError(f"Cannot read configuration file {config_path}: {e}")
+        logger.warning("Configuration file has unexpected extension: %s", config_path.suffix)
 
 
 def validate_dataset_root(dataset_root: Path | None) -> Path | None:
@@ -66,15 +109,20 @@ def validate_dataset_root(dataset_root: Path | None) -> Path | None:
 
     resolved_path = dataset_root.expanduser().resolve()
 
-    if not resolved_path.exists():
-        logger.warning(f"Dataset root does not exist, will be created: {resolved_path}")
+    try:
+        st = os.stat(resolved_path)
+    except FileNotFoundError:
+        logger.warning("Dataset root does not exist, will be created: %s", resolved_path)
         try:
-            resolved_path.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created dataset root directory: {resolved_path}")
+            os.makedirs(resolved_path, exist_ok=True)
+            st = os.stat(resolved_path)
+            logger.info("Created dataset root directory: %s", resolved_path)
         except Exception as e:
-            raise DatasetError(f"Cannot create dataset root directory {resolved_path}: {e}")
+            raise DatasetError(f"Cannot create dataset root directory {resolved_path}: {e}") from e
+    except OSError as e:
+        raise DatasetError(f"Cannot access dataset root {resolved_path}: {e}") from e
 
-    if not resolved_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise DatasetError(f"Dataset root is not a directory: {resolved_path}")
 
     return resolved_path
@@ -86,47 +134,63 @@ def setup_experiment_environment() -> None:
         ensure_directories()
         logger.debug("Experiment environment setup completed")
     except Exception as e:
-        logger.error(f"Failed to setup experiment environment: {e}")
+        logger.error("Failed to setup experiment environment: %s", e)
         raise ExecutionError(f"Environment setup failed: {e}")
 
 
 def load_and_validate_config(config_path: Path) -> object:
-    """Load and validate experiment configuration with retries."""
+    """Load and validate experiment configuration, retrying transient I/O errors."""
     max_retries = 3
     retry_delay = 1.0
 
     last_error = None
     for attempt in range(max_retries):
         try:
-            logger.debug(f"Loading configuration (attempt {attempt + 1}/{max_retries})")
+            logger.debug("Loading configuration (attempt %s/%s)", attempt + 1, max_retries)
             config = ConfigLoader.load_config(config_path)
-            logger.info(f"Configuration loaded successfully: {config.describe()}")
+            logger.info("Configuration loaded successfully: %s", config.describe())
             return config
         except Exception as e:
+            if not _is_transient(e):
+                raise ConfigurationError(f"Invalid configuration {config_path}: {e}") from e
             last_error = e
-            logger.warning(f"Configuration load attempt {attempt + 1} failed: {e}")
+            logger.warning("Configuration load attempt %s failed: %s", attempt + 1, e)
             if attempt < max_retries - 1:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
+                delay = _backoff_delay(retry_delay, attempt)
+                logger.info("Retrying in %.1f seconds...", delay)
+                time.sleep(delay)
 
     raise ConfigurationError(
         f"Failed to load configuration after {max_retries} attempts: {last_error}"
     )
 
 
-def run_experiment_with_resilience(
-    config_path: Path, dataset_root: Path | None = None, dry_run: bool = False, max_retries: int = 1
-) -> str:
-    """Execute experiment with comprehensive error handling and retries."""
+def _prepare_experiment(
+    config_path: Path,
+    dataset_root: Path | None,
+    dry_run: bool,
+    setup_environment: bool,
+    preloaded_config=None,
+):
+    """Validate inputs and load the config; returns ``(config, dataset_service)``.
+
+    ``dataset_service`` is ``None`` for dry runs, which stop after validation.
+    When ``preloaded_config`` is given the config file is not read again.
+    """
+    # Deferred so that validate/info/--help do not pay for pandas and the evaluator stack
+    from .services.dataset_service import DatasetService
 
     # Setup and validation
-    setup_experiment_environment()
-    validate_config_file(config_path)
+    if setup_environment:
+        setup_experiment_environment()
+    if preloaded_config is None:
+        validate_config_file(config_path)
     dataset_root = validate_dataset_root(dataset_root)
 
     # Load configuration
-    config = load_and_validate_config(config_path)
+    config = preloaded_config
+    if config is None:
+        config = load_and_validate_config(config_path)
 
     if dry_run:
         logger.info(
@@ -135,7 +199,7 @@ def run_experiment_with_resilience(
             config.dataset.version,
         )
         logger.info("Dry run mode - no experiment execution performed")
-        return "dry-run"
+        return config, None
 
     # Create services with error handling
     try:
@@ -145,42 +209,130 @@ def run_experiment_with_resilience(
     except Exception as e:
         raise DatasetError(f"Failed to initialize dataset service: {e}")
 
+    return config, dataset_service
+
+
+def _retry_delay_after(error: Exception, attempt: int, max_retries: int) -> float | None:
+    """Log a failed execution attempt; return the backoff delay, or None to give up."""
+    logger.error("💥 Experiment execution failed (attempt %s): %s", attempt + 1, error)
+    logger.debug("Full error details", exc_info=True)
+
+    if not _is_transient(error):
+        logger.error("❌ Failure is not transient; not retrying")
+        return None
+    if attempt >= max_retries - 1:
+        logger.error("❌ All %s execution attempts failed", max_retries)
+        return None
+
+    retry_delay = _backoff_delay(2.0, attempt)
+    logger.info("🔄 Retrying experiment in %.1f seconds...", retry_delay)
+    return retry_delay
+
+
+def _log_experiment_success(config, experiment_id: str) -> None:
+    logger.success("🎉 Experiment completed successfully: %s", experiment_id)
+    logger.info("Experiment metadata: dataset=%s:%s", config.dataset.name, config.dataset.version)
+
+
+def _run_attempt(
+    config, dataset_service, config_path: Path, attempt: int, max_retries: int
+) -> tuple[str | None, float]:
+    """Run one orchestrator attempt for the sync and async runners.
+
+    Returns ``(experiment_id, 0.0)`` on success, or ``(None, delay)`` when the
+    caller should wait ``delay`` seconds and try again. Raises
+    :class:`ExecutionError` once retrying is pointless.
+    """
+    from .orchestrator import Orchestrator
+
+    logger.info("🚀 Starting experiment execution (attempt %s/%s)", attempt + 1, max_retries)
+    try:
+        orchestrator = Orchestrator(dataset_service=dataset_service)
+        experiment_id = orchestrator.run(str(config_path))
+    except KeyboardInterrupt:
+        logger.warning("⚠️  Experiment interrupted by user")
+        raise
+    except Exception as e:
+        retry_delay = _retry_delay_after(e, attempt, max_retries)
+        if retry_delay is None:
+            raise ExecutionError(
+                f"Experiment execution failed after {attempt + 1} attempts: {e}"
+            ) from e
+        return None, retry_delay
+
+    _log_experiment_success(config, experiment_id)
+    return experiment_id, 0.0
+
+
+def run_experiment_with_resilience(
+    config_path: Path,
+    dataset_root: Path | None = None,
+    dry_run: bool = False,
+    max_retries: int = 1,
+    setup_environment: bool = True,
+    preloaded_config=None,
+) -> str:
+    """Execute experiment with comprehensive error handling and retries."""
+    config, dataset_service = _prepare_experiment(
+        config_path, dataset_root, dry_run, setup_environment, preloaded_config
+    )
+    if dataset_service is None:
+        return "dry-run"
+
     # Execute experiment with retries
-    last_error = None
     for attempt in range(max_retries):
-        try:
-            logger.info(f"🚀 Starting experiment execution (attempt {attempt + 1}/{max_retries})")
+        experiment_id, retry_delay = _run_attempt(
+            config, dataset_service, config_path, attempt, max_retries
+        )
+        if experiment_id is not None:
+            return experiment_id
+        time.sleep(retry_delay)
 
-            orchestrator = Orchestrator(dataset_service=dataset_service)
-            experiment_id = orchestrator.run(str(config_path))
+    raise ExecutionError(f"Experiment execution failed after {max_retries} attempts")
 
-            logger.success(f"🎉 Experiment completed successfully: {experiment_id}")
-            logger.info(
-                f"Experiment metadata: dataset={config.dataset.name}:{config.dataset.version}"
-            )
 
-            return experiment_id
+async def arun_experiment_with_resilience(
+    config_path: Path,
+    dataset_root: Path | None = None,
+    dry_run: bool = False,
+    max_retries: int = 1,
+    setup_environment: bool = True,
+    preloaded_config=None,
+) -> str:
+    """Async variant of :func:`run_experiment_with_resilience`.
 
-        except KeyboardInterrupt:
-            logger.warning("⚠️  Experiment interrupted by user")
-            raise
+    The orchestrator is synchronous, so loading and each run attempt execute in a
+    worker thread while backoff waits use ``asyncio.sleep``; the caller's event
+    loop (e.g. a notebook kernel) stays responsive throughout.
+    """
+    config, dataset_service = await asyncio.to_thread(
+        _prepare_experiment,
+        config_path,
+        dataset_root,
+        dry_run,
+        setup_environment,
+        preloaded_config,
+    )
+    if dataset_service is None:
+        return "dry-run"
 
-        except Exception as e:
-            last_error = e
-            logger.error(f"💥 Experiment execution failed (attempt {attempt + 1}): {e}")
-            logger.debug(f"Full error details: {traceback.format_exc()}")
+    for attempt in range(max_retries):
+        experiment_id, retry_delay = await asyncio.to_thread(
+            _run_attempt, config, dataset_service, config_path, attempt, max_retries
+        )
+        if experiment_id is not None:
+            return experiment_id
+        await asyncio.sleep(retry_delay)
+
+    raise ExecutionError(f"Experiment execution failed after {max_retries} attempts")
 
-            if attempt < max_retries - 1:
-                retry_delay = 2.0 * (2**attempt)  # Exponential backoff
-                logger.info(f"🔄 Retrying experiment in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"❌ All {max_retries} execution attempts failed")
 
-    raise ExecutionError(f"Experiment execution failed after {max_retries} attempts: {last_error}")
+# -v/-vv keep the default INFO level; -vvv and beyond enable DEBUG.
+_VERBOSITY_LEVELS = {0: logging.INFO, 1: logging.INFO, 2: logging.INFO, 3: logging.DEBUG}
 
 
 @click.group(invoke_without_command=True)
+@click.version_option(__version__, prog_name="exp-cli", message="%(prog)s %(version)s")
 @click.option("--verbose", "-v", count=True, help="Increase verbosity (use -v, -vv, or -vvv)")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error output")
 @click.pass_context
@@ -195,16 +347,8 @@ def cli(ctx: click.Context, verbose: int, quiet: bool):
     """
 
     # Configure logging based on verbosity
-    import logging
-
-    if quiet:
-        logger._logger.setLevel(logging.WARNING)
-    elif verbose >= 3:
-        logger._logger.setLevel(logging.DEBUG)
-    elif verbose >= 2:
-        logger._logger.setLevel(logging.INFO)
-    elif verbose >= 1:
-        logger._logger.setLevel(logging.INFO)
+    level = logging.WARNING if quiet else _VERBOSITY_LEVELS.get(verbose, logging.DEBUG)
+    logger._logger.setLevel(level)
 
     # If no command specified, run the default run command
     if ctx.invoked_subcommand is None:
@@ -212,9 +356,12 @@ def cli(ctx: click.Context, verbose: int, quiet: bool):
 
 
 @cli.command()
-@click.argument("config", type=click.Path(exists=True, path_type=Path))
+@click.argument("config", type=click.Path(exists=True, path_type=Path, resolve_path=True))
 @click.option(
-    "--dataset-root", "-d", type=click.Path(path_type=Path), help="Override dataset root directory"
+    "--dataset-root",
+    "-d",
+    type=click.Path(path_type=Path, resolve_path=True),
+    help="Override dataset root directory",
 )
 @click.option("--dry-run", is_flag=True, help="Validate configuration without executing experiment")
 @click.option(
@@ -227,7 +374,7 @@ def cli(ctx: click.Context, verbose: int, quiet: bool):
 @click.option(
     "--output-path",
     "-o",
-    type=click.Path(path_type=Path),
+    type=click.Path(path_type=Path, resolve_path=True),
     help="Override output path for experiment results",
 )
 def run(
@@ -249,20 +396,20 @@ def run(
 
     try:
         logger.banner("Experiment Execution")
-        logger.info(f"📋 Configuration: [bold]{config.absolute()}[/]")
+        logger.info("📋 Configuration: [bold]%s[/]", config)
 
         if dataset_root:
-            logger.info(f"📁 Dataset root: [bold]{dataset_root.absolute()}[/]")
+            logger.info("📁 Dataset root: [bold]%s[/]", dataset_root)
 
         if output_path:
-            logger.info(f"💾 Output path: [bold]{output_path.absolute()}[/]")
+            logger.info("💾 Output path: [bold]%s[/]", output_path)
             # TODO: Integrate output_path override with configuration
 
         if dry_run:
             logger.info("🔍 Running in dry-run mode")
 
         if max_retries > 1:
-            logger.info(f"🔄 Max retries configured: {max_retries}")
+            logger.info("🔄 Max retries configured: %s", max_retries)
 
         start_time = time.time()
 
@@ -271,27 +418,27 @@ def run(
         )
 
         execution_time = time.time() - start_time
-        logger.success(f"⏱️  Total execution time: {execution_time:.2f} seconds")
+        logger.success("⏱️  Total execution time: %.2f seconds", execution_time)
 
         if not dry_run:
-            logger.info(f"🔗 Experiment ID: [bold]{experiment_id}[/]")
+            logger.info("🔗 Experiment ID: [bold]%s[/]", experiment_id)
 
     except KeyboardInterrupt:
         logger.warning("🛑 Execution interrupted by user")
         sys.exit(130)  # Standard exit code for Ctrl+C
 
     except (ConfigurationError, DatasetError, ExecutionError) as e:
-        logger.error(f"❌ {e.__class__.__name__}: {e}")
+        logger.error("❌ %s: %s", e.__class__.__name__, e)
         sys.exit(1)
 
     except Exception as e:
-        logger.error(f"💥 Unexpected error: {e}")
-        logger.debug(f"Full traceback: {traceback.format_exc()}")
+        logger.error("💥 Unexpected error: %s", e)
+        logger.debug("Full traceback", exc_info=True)
         sys.exit(1)
 
 
 @cli.command()
-@click.argument("config", type=click.Path(exists=True, path_type=Path))
+@click.argument("config", type=click.Path(exists=True, path_type=Path, resolve_path=True))
 def validate(config: Path):
     """✅ Validate experiment configuration without execution.
 
@@ -300,37 +447,91 @@ def validate(config: Path):
 
     try:
         logger.banner("Configuration Validation")
-        logger.info(f"📋 Validating: [bold]{config.absolute()}[/]")
+        logger.info("📋 Validating: [bold]%s[/]", config)
 
         # File validation
         validate_config_file(config)
-        logger.success("✅ Configuration file is valid and readable")
+        logger.success("✅ Configuration file found")
 
         # Configuration loading validation
         experiment_config = load_and_validate_config(config)
         logger.success("✅ Configuration syntax and structure are valid")
 
-        logger.info(f"📊 Experiment details: {experiment_config.describe()}")
-        logger.info(f"🏃 Execution mode: {'Local' if experiment_config.local_mode else 'Cloud'}")
-        logger.info(f"📈 Evaluators configured: {len(experiment_config.evaluators)}")
+        logger.info("📊 Experiment details: %s", experiment_config.describe())
+        logger.info("🏃 Execution mode: %s", "Local" if experiment_config.local_mode else "Cloud")
+        logger.info("📈 Evaluators configured: %s", len(experiment_config.evaluators))
 
         for i, evaluator in enumerate(experiment_config.evaluators, 1):
-            logger.info(f"   {i}. {evaluator.name} (id: {evaluator.id})")
+            logger.info("   %s. %s (id: %s)", i, evaluator.name, evaluator.id)
 
         logger.success("🎉 Configuration validation completed successfully")
 
     except (ConfigurationError, DatasetError) as e:
-        logger.error(f"❌ Validation failed: {e}")
+        logger.error("❌ Validation failed: %s", e)
         sys.exit(1)
 
     except Exception as e:
-        logger.error(f"💥 Unexpected validation error: {e}")
-        logger.debug(f"Full traceback: {traceback.format_exc()}")
+        logger.error("💥 Unexpected validation error: %s", e)
+        logger.debug("Full traceback", exc_info=True)
         sys.exit(1)
 
 
+class _RunSummary:
+    """Running tally of ``run-directory`` outcomes with bounded detail lists."""
+
+    max_details = 20
+
+    def __init__(self) -> None:
+        self.successful = 0
+        self.failed = 0
+        self.success_details: list[str] = []
+        self.failure_details: list[str] = []
+
+    @property
+    def total(self) -> int:
+        return self.successful + self.failed
+
+    def record_success(self, config_file: Path, experiment_id: str) -> None:
+        self.successful += 1
+        logger.info("✅ %s → %s", config_file.name, experiment_id)
+        if len(self.success_details) < self.max_details:
+            self.success_details.append(f"{config_file.name} → {experiment_id}")
+
+    def record_failure(self, config_file: Path, error: Exception) -> None:
+        self.failed += 1
+        logger.error("Failed to execute %s: %s", config_file.name, error)
+        if len(self.failure_details) < self.max_details:
+            self.failure_details.append(f"{config_file.name}: {error}")
+
+    def report(self) -> None:
+        logger.banner("Execution Summary")
+        logger.info("📊 Total configurations: %s", self.total)
+        logger.info("✅ Successful: %s", self.successful)
+        logger.info("❌ Failed: %s", self.failed)
+
+        if self.successful > 0:
+            logger.info("🎉 Successful experiments:")
+            for detail in self.success_details:
+                logger.info("   • %s", detail)
+            if self.successful > len(self.success_details):
+                logger.info("   ... and %s more", self.successful - len(self.success_details))
+
+        if self.failed > 0:
+            logger.warning("⚠️  Failed experiments:")
+            for detail in self.failure_details:
+                logger.warning("   • %s", detail)
+            if self.failed > len(self.failure_details):
+                logger.warning("   ... and %s more", self.failed - len(self.failure_details))
+
+        logger.success(
+            "🏁 Directory execution completed: %s/%s successful", self.successful, self.total
+        )
+
+
 @cli.command("run-directory")
-@click.argument("directory", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument(
+    "directory", type=click.Path(exists=True, file_okay=False, path_type=Path, resolve_path=True)
+)
 @click.option(
     "--install-deps", is_flag=True, help="Install dependencies from requirements.txt in directory"
 )
@@ -350,6 +551,14 @@ def validate(config: Path):
     type=click.IntRange(1, 10),
     help="Maximum number of execution retry attempts (1-10)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of configurations to run in parallel worker processes",
+)
 def run_directory(
     directory: Path,
     install_deps: bool,
@@ -357,6 +566,7 @@ def run_directory(
     config_pattern: str,
     dry_run: bool,
     max_retries: int,
+    jobs: int,
 ):
     """🚀 Run experiments from a directory with automatic dependency management.
 
@@ -375,7 +585,7 @@ def run_directory(
 
     try:
         logger.banner("Directory-Based Experiment Execution")
-        logger.info(f"📁 Target directory: [bold]{directory.absolute()}[/]")
+        logger.info("📁 Target directory: [bold]%s[/]", directory)
 
         # Install dependencies if requested
         if install_deps:
@@ -387,73 +597,132 @@ def run_directory(
 
         # Discover configuration files
         config_files = discover_config_files(directory, config_pattern)
-        logger.info(f"📋 Found {len(config_files)} configuration files")
+        logger.info("📋 Found %s configuration files", len(config_files))
 
         if not config_files:
             logger.warning("No configuration files found matching pattern")
             return
 
-        # Execute each configuration
-        results = []
-        for i, config_file in enumerate(config_files, 1):
-            logger.info(f"🔄 Processing configuration {i}/{len(config_files)}: {config_file.name}")
-
-            try:
-                experiment_id = run_experiment_with_resilience(
-                    config_path=config_file,
-                    dataset_root=directory / "datasets"
-                    if (directory / "datasets").exists()
-                    else None,
-                    dry_run=dry_run,
-                    max_retries=max_retries,
-                )
-                results.append(
-                    {
-                        "config": config_file.name,
-                        "experiment_id": experiment_id,
-                        "status": "success",
-                    }
+        # Let the kernel read the configs in while the environment is set up
+        _prefetch_files(config_files)
+
+        # Shared, idempotent setup happens once here rather than per configuration
+        setup_experiment_environment()
+        dataset_root = directory / "datasets"
+        if not dataset_root.is_dir():
+            dataset_root = None
+        run_kwargs = {
+            "dataset_root": dataset_root,
+            "dry_run": dry_run,
+            "max_retries": max_retries,
+            "setup_environment": False,
+        }
+
+        # Execute configurations, in parallel worker processes when there is more than one
+        summary = _RunSummary()
+        workers = min(jobs, len(config_files))
+        preloaded = {}
+        if dry_run and workers > 1:
+            # A dry run is only parsing and validation, so do that across processes
+            # up front and report the results from here.
+            preloaded = _preload_configs(config_files, workers)
+            workers = 1
+        if workers == 1:
+            for i, config_file in enumerate(config_files, 1):
+                logger.info(
+                    "🔄 Processing configuration %s/%s: %s", i, len(config_files), config_file.name
                 )
+                try:
+                    experiment_id = run_experiment_with_resilience(
+                        config_file, preloaded_config=preloaded.get(config_file), **run_kwargs
+                    )
+                except Exception as e:
+                    summary.record_failure(config_file, e)
+                else:
+                    summary.record_success(config_file, experiment_id)
+        else:
+            logger.info(
+                "⚡ Running %s configurations across %s workers", len(config_files), workers
+            )
+            with _worker_pool(workers) as executor:
+                futures = {
+                    executor.submit(run_experiment_with_resilience, config_file, **run_kwargs): (
+                        config_file
+                    )
+                    for config_file in config_files
+                }
+                try:
+                    for done, future in enumerate(as_completed(futures), 1):
+                        config_file = futures.pop(future)
+                        try:
+                            experiment_id = future.result()
+                        except Exception as e:
+                            summary.record_failure(config_file, e)
+                        else:
+                            summary.record_success(config_file, experiment_id)
+                        logger.info(
+                            "🔄 Finished configuration %s/%s: %s",
+                            done,
+                            len(config_files),
+                            config_file.name,
+                        )
+                except KeyboardInterrupt:
+                    # Drop queued configurations instead of waiting for them to run
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        summary.report()
 
-            except Exception as e:
-                logger.error(f"Failed to execute {config_file.name}: {e}")
-                results.append(
-                    {
-                        "config": config_file.name,
-                        "experiment_id": None,
-                        "status": "failed",
-                        "error": str(e),
-                    }
-                )
+    except KeyboardInterrupt:
+        logger.warning("🛑 Directory execution interrupted by user")
+        sys.exit(130)  # Standard exit code for Ctrl+C
 
-        # Summary report
-        successful = sum(1 for r in results if r["status"] == "success")
-        failed = len(results) - successful
+    except Exception as e:
+        logger.error("💥 Directory execution failed: %s", e)
+        sys.exit(1)
 
-        logger.banner("Execution Summary")
-        logger.info(f"📊 Total configurations: {len(results)}")
-        logger.info(f"✅ Successful: {successful}")
-        logger.info(f"❌ Failed: {failed}")
 
-        if successful > 0:
-            logger.info("🎉 Successful experiments:")
-            for result in results:
-                if result["status"] == "success":
-                    logger.info(f"   • {result['config']} → {result['experiment_id']}")
+def _init_worker(module_dirs: list[str], log_level: int) -> None:
+    """Give a run-directory worker the parent's module paths and log level.
 
-        if failed > 0:
-            logger.warning("⚠️  Failed experiments:")
-            for result in results:
-                if result["status"] == "failed":
-                    logger.warning(
-                        f"   • {result['config']}: {result.get('error', 'Unknown error')}"
-                    )
+    Under the spawn start method (macOS, Windows) workers begin in a fresh
+    interpreter and inherit neither.
+    """
+    for module_dir in module_dirs:
+        if module_dir not in sys.path:
+            sys.path.insert(0, module_dir)
+    logger.logger.setLevel(log_level)
+
+
+def _worker_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool whose workers are set up like this process by ``_init_worker``."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(sorted(_added_module_dirs), logger.logger.level),
+    )
 
-        logger.success(f"🏁 Directory execution completed: {successful}/{len(results)} successful")
 
-    except Exception as e:
-        logger.error(f"💥 Directory execution failed: {e}")
-        sys.exit(1)
+def _preload_configs(config_files: list[Path], workers: int) -> dict[Path, object]:
+    """Parse and validate *config_files* in worker processes.
+
+    Each worker makes a single attempt without retries or backoff. Only
+    successfully loaded configs are returned; the others are left for the
+    caller to load again so their errors surface (and are retried) as usual.
+    """
+    preloaded = {}
+    with _worker_pool(workers) as executor:
+        futures = {
+            executor.submit(ConfigLoader.load_config, config_file): config_file
+            for config_file in config_files
+        }
+        for future in as_completed(futures):
+            config_file = futures.pop(future)
+            try:
+                preloaded[config_file] = future.result()
+            except Exception as e:
+                logger.debug("Could not preload %s: %s", config_file, e)
+    return preloaded
 
 
 @cli.command()
@@ -464,114 +733,225 @@ def info():
         logger.banner("Platform Information")
 
         # Platform info
-        from . import __version__
+        logger.info("🏷️  Version: [bold]%s[/]", __version__)
 
-        logger.info(f"🏷️  Version: [bold]{__version__}[/]")
+        yaml_backend = "libyaml (C)" if yaml.__with_libyaml__ else "pure Python (slow)"
+        logger.info("📄 YAML parser: %s", yaml_backend)
 
         # Available evaluators
         from .evaluators import enhanced_registry
 
-        available_evaluators = list(enhanced_registry.available())
-        logger.info(f"🔧 Available evaluators: {len(available_evaluators)}")
+        available_evaluators = sorted(enhanced_registry.available())
+        logger.info("🔧 Available evaluators: %s", len(available_evaluators))
 
-        for evaluator in sorted(set(available_evaluators)):  # Remove duplicates
-            logger.info(f"   • {evaluator}")
+        for evaluator in available_evaluators:
+            logger.info("   • %s", evaluator)
 
         # Environment info
-        import os
-
-        artifact_root = os.getenv("EXP_CLI_ARTIFACT_ROOT", str(Path.cwd() / "data" / "experiments"))
-        logger.info(f"📁 Artifact root: {artifact_root}")
-
-        dataset_root = os.getenv("EXP_CLI_DATASET_ROOT", str(Path.cwd() / "data" / "datasets"))
-        logger.info(f"📂 Dataset root: {dataset_root}")
-
-        # Cloud configuration
-        foundry_endpoint = os.getenv("FOUNDRY_PROJECT_ENDPOINT", "Not configured")
-        logger.info(f"☁️  Foundry endpoint: {foundry_endpoint}")
+        cwd = Path.cwd()
+        env = {
+            "EXP_CLI_ARTIFACT_ROOT": ("📁 Artifact root", cwd / "data" / "experiments"),
+            "EXP_CLI_DATASET_ROOT": ("📂 Dataset root", cwd / "data" / "datasets"),
+            "FOUNDRY_PROJECT_ENDPOINT": ("☁️  Foundry endpoint", "Not configured"),
+        }
+        for name, (label, default) in env.items():
+            logger.info("%s: %s", label, os.environ.get(name, default))
 
         logger.success("ℹ️  Platform information displayed")
 
     except Exception as e:
-        logger.error(f"💥 Failed to retrieve platform information: {e}")
+        logger.error("💥 Failed to retrieve platform information: %s", e)
         sys.exit(1)
 
 
+# sha256 digests of requirements files already installed by this process.
+_installed_requirements: set[str] = set()
+
+
+def _pip_install_command(requirements_file: Path, hashed: bool = False) -> list[str]:
+    """Build the install command, using uv's much faster resolver when opted into.
+
+    uv is only used when ``EXP_CLI_USE_UV`` is set (``1``/``true``/``yes``) and
+    it is on PATH: ``uv pip install`` ignores ``pip.conf`` and the
+    ``PIP_INDEX_URL``/``PIP_EXTRA_INDEX_URL`` variables, so picking it silently
+    would bypass private package indexes. pip switches to hash-checking mode by
+    itself when a requirement carries a ``--hash``; uv has to be asked
+    explicitly via ``--require-hashes``.
+    """
+    use_uv = os.getenv("EXP_CLI_USE_UV", "").strip().lower() in ("1", "true", "yes")
+    uv = shutil.which("uv") if use_uv else None
+    if uv:
+        cmd = [uv, "pip", "install", "--python", sys.executable, "-r", str(requirements_file)]
+        return cmd + ["--require-hashes"] if hashed else cmd
+    return [
+        sys.executable,
+        "-m",
+        "pip",
+        "install",
+        "--no-input",
+        "--prefer-binary",
+        "--no-compile",
+        "-r",
+        str(requirements_file),
+    ]
+
+
 def install_directory_dependencies(directory: Path) -> None:
     """Install dependencies from requirements.txt in the specified directory."""
     requirements_file = directory / "requirements.txt"
 
-    if not requirements_file.exists():
+    try:
+        requirements = requirements_file.read_bytes()
+    except FileNotFoundError:
         logger.info("📦 No requirements.txt found, skipping dependency installation")
         return
 
-    logger.info(f"📦 Installing dependencies from {requirements_file}")
+    digest = hashlib.sha256(requirements).hexdigest()
+    if digest in _installed_requirements:
+        logger.info("📦 Requirements in %s already installed, skipping", requirements_file)
+        return
 
-    try:
-        import subprocess
-        import sys
+    logger.info("📦 Installing dependencies from %s", requirements_file)
 
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)],
-            capture_output=True,
+    try:
+        cmd = _pip_install_command(requirements_file, hashed=b"--hash=" in requirements)
+        # Stream the installer's output as it arrives, keeping the tail for error reporting
+        tail: deque[str] = deque(maxlen=200)
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
+            errors="replace",
+            bufsize=1,
             cwd=directory,
-        )
-
-        if result.returncode == 0:
+        ) as proc:
+            for line in proc.stdout:
+                # Installer output contains "[notice]"-style text Rich would treat as markup
+                line = escape(line.rstrip())
+                tail.append(line)
+                logger.debug("%s", line)
+        returncode = proc.wait()
+
+        if returncode == 0:
+            _installed_requirements.add(digest)
             logger.success("✅ Dependencies installed successfully")
         else:
-            logger.error(f"❌ Failed to install dependencies: {result.stderr}")
-            raise RuntimeError(f"Dependency installation failed: {result.stderr}")
+            output = "\n".join(tail)
+            logger.error("❌ Failed to install dependencies: %s", output)
+            raise RuntimeError(f"Dependency installation failed: {output}")
 
     except Exception as e:
-        logger.error(f"💥 Error installing dependencies: {e}")
+        logger.error("💥 Error installing dependencies: %s", e)
         raise
 
 
+# Directories already prepended to sys.path by setup_module_path.
+_added_module_dirs: set[str] = set()
+
+
 def setup_module_path(directory: Path, module_path: str) -> None:
-    """Add directory to Python path and validate module path."""
-    logger.info(f"🐍 Setting up module path: {module_path}")
+    """Add directory to Python path and check the module can be located."""
+    logger.info("🐍 Setting up module path: %s", module_path)
 
     # Add directory to Python path
-    import sys
+    module_dir = str(directory.absolute())
+    if module_dir not in _added_module_dirs:
+        if module_dir not in sys.path:
+            sys.path.insert(0, module_dir)
+            logger.debug("Added %s to Python path", module_dir)
+        _added_module_dirs.add(module_dir)
+
+    # Locate the module without executing it; the orchestrator imports it later
+    try:
+        spec = _find_module_spec(module_path)
+    except (ImportError, ValueError) as e:
+        spec = None
+        reason = str(e)
+    else:
+        reason = "module not found"
+
+    if spec is not None:
+        logger.success("✅ Module %s is importable", module_path)
+    else:
+        logger.warning("⚠️  Module %s cannot be imported: %s", module_path, reason)
+        logger.info("💡 Module will be resolved at execution time")
 
-    if str(directory.absolute()) not in sys.path:
-        sys.path.insert(0, str(directory.absolute()))
-        logger.debug(f"Added {directory.absolute()} to Python path")
 
-    # Validate module can be imported
-    try:
-        import importlib
+def _find_module_spec(module_path: str):
+    """Return the spec for *module_path* without importing any of its parents.
 
-        importlib.import_module(module_path)
-        logger.success(f"✅ Module {module_path} is importable")
-    except ImportError as e:
-        logger.warning(f"⚠️  Module {module_path} cannot be imported: {e}")
-        logger.info("💡 Module will be resolved at execution time")
+    ``importlib.util.find_spec("a.b.c")`` imports ``a`` and ``a.b`` and so runs
+    their ``__init__`` code; walking each package's search locations does not.
+    """
+    top, *submodules = module_path.split(".")
+    spec = importlib.util.find_spec(top)
+    for part in submodules:
+        if spec is None or spec.submodule_search_locations is None:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(
+            f"{spec.name}.{part}", spec.submodule_search_locations
+        )
+    return spec
 
 
 def discover_config_files(directory: Path, pattern: str) -> list[Path]:
     """Discover configuration files in directory matching the pattern."""
-    logger.info(f"🔍 Searching for configuration files with pattern: {pattern}")
+    logger.info("🔍 Searching for configuration files with pattern: %s", pattern)
+
+    if "/" in pattern or os.sep in pattern:
+        config_files = sorted(p for p in directory.rglob(pattern) if p.is_file())
+    else:
+        config_files = sorted(_scan_matching_files(str(directory), pattern))
 
-    config_files = []
+    if logger._logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found configuration files: %s", [f.name for f in config_files])
+    return config_files
 
-    # Search in directory and subdirectories
-    for pattern_variant in [pattern, f"**/{pattern}"]:
-        matches = list(directory.glob(pattern_variant))
-        config_files.extend(matches)
 
-    # Remove duplicates and sort
-    config_files = sorted(set(config_files))
+def _prefetch_files(paths: list[Path]) -> None:
+    """Ask the OS to start reading *paths* into the page cache (Linux only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
 
-    # Filter to only include files (not directories)
-    config_files = [f for f in config_files if f.is_file()]
 
-    logger.debug(f"Found configuration files: {[f.name for f in config_files]}")
-    return config_files
+def _scan_matching_files(root: str, pattern: str) -> list[Path]:
+    """Walk *root* with ``os.scandir`` collecting files whose name matches *pattern*.
+
+    ``DirEntry.is_file()`` reuses the type reported by ``readdir``, so unlike
+    ``Path.is_file()`` it does not need a ``stat`` call per entry. The pattern is
+    compiled once and matches are kept as strings until the walk is done.
+    """
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    matches_name = re.compile(fnmatch.translate(pattern), flags).match
+    matches: list[str] = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif matches_name(entry.name) and entry.is_file():
+                        matches.append(entry.path)
+        except OSError as e:
+            logger.debug("Skipping unreadable directory: %s", e)
+    return [Path(match) for match in matches]
 
 
 def app_main() -> None:
     """Entry-point used by uv script mapping."""
-    cli()
+    from .entrypoint import main
+
+    main()
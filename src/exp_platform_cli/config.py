@@ -11,7 +11,17 @@ class MissingConfigError(RuntimeError):
     """Raised when required environment configuration is absent."""
 
 
-@dataclass(frozen=True)
+# Required variables, in ``EnvironmentConfig`` field order.
+_REQUIRED_KEYS = (
+    "SUBSCRIPTION_NAME",
+    "RESOURCE_GROUP_NAME",
+    "WORKSPACE_NAME",
+    "FOUNDRY_PROJECT_ENDPOINT",
+    "AZURE_FOUNDRY_CONNECTION_STRING",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class EnvironmentConfig:
     """Configuration sourced from environment variables or .env files."""
 
@@ -26,19 +36,15 @@ class EnvironmentConfig:
     def from_mapping(cls, values: Mapping[str, str]) -> EnvironmentConfig:
         """Build a config from a mapping, validating required keys."""
 
-        def _lookup(key: str) -> str:
-            value = values.get(key)
-            if not value:
-                raise MissingConfigError(f"Environment variable '{key}' is required")
-            return value
+        required = tuple(values.get(key) for key in _REQUIRED_KEYS)
+        if not all(required):
+            missing = ", ".join(
+                f"'{key}'" for key, value in zip(_REQUIRED_KEYS, required, strict=True) if not value
+            )
+            raise MissingConfigError(f"Environment variable(s) {missing} required")
 
         return cls(
-            subscription=_lookup("SUBSCRIPTION_NAME"),
-            resource_group_name=_lookup("RESOURCE_GROUP_NAME"),
-            workspace_name=_lookup("WORKSPACE_NAME"),
-            project_endpoint=_lookup("FOUNDRY_PROJECT_ENDPOINT"),
-            connection_string=_lookup("AZURE_FOUNDRY_CONNECTION_STRING"),
-            connection_name=values.get("CONNECTION_NAME", "ads-foundry-connection"),
+            *required, connection_name=values.get("CONNECTION_NAME", "ads-foundry-connection")
         )
 
     @classmethod
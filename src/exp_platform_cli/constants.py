@@ -3,28 +3,65 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
 PROJECT_ROOT = PACKAGE_ROOT.parent
 
 
-def _resolve_artifact_root() -> Path:
-    env_value = os.getenv("EXP_CLI_ARTIFACT_ROOT")
+_ARTIFACT_ROOT_ENV = "EXP_CLI_ARTIFACT_ROOT"
+_UNSET = object()
+# Key (see ``_env_key``) the current roots were computed from.
+_last_env_key: object = _UNSET
+
+
+def _env_key() -> tuple[str | None, str | None]:
+    """The artifact root variable, plus the working directory when it is relative."""
+    env_value = os.getenv(_ARTIFACT_ROOT_ENV)
+    if env_value and not os.path.isabs(os.path.expanduser(env_value)):
+        return env_value, os.getcwd()
+    return env_value, None
+
+
+@lru_cache(maxsize=4)
+def _resolve_env_root(env_value: str, cwd: str | None) -> Path:
+    path = Path(env_value).expanduser()
+    return (Path(cwd) / path if cwd else path).resolve()
+
+
+def _resolve_artifact_root(env_value: str | None, cwd: str | None) -> Path:
     if env_value:
-        return Path(env_value).expanduser().resolve()
+        return _resolve_env_root(env_value, cwd)
     return PROJECT_ROOT / "artifacts"
 
 
 def refresh_paths() -> None:
-    """Recompute filesystem roots from the current environment."""
+    """Recompute filesystem roots from the current environment.
+
+    A no-op when ``EXP_CLI_ARTIFACT_ROOT`` is unchanged since the last call
+    and, for a relative value, so is the working directory it resolves against.
+    """
 
-    global ARTIFACT_ROOT, DATASET_ROOT, EXPERIMENT_ROOT
-    ARTIFACT_ROOT = _resolve_artifact_root()
+    global ARTIFACT_ROOT, DATASET_ROOT, EXPERIMENT_ROOT, _last_env_key
+    env_key = _env_key()
+    if env_key == _last_env_key:
+        return
+    _last_env_key = env_key
+    ARTIFACT_ROOT = _resolve_artifact_root(*env_key)
     DATASET_ROOT = ARTIFACT_ROOT / "datasets"
     EXPERIMENT_ROOT = ARTIFACT_ROOT / "experiments"
 
 
+def cache_root() -> Path:
+    """Directory for caches shared across CLI invocations.
+
+    Honours ``EXP_CLI_CACHE_DIR`` and defaults to ``~/.cache/exp-cli``.
+    """
+    base = os.getenv("EXP_CLI_CACHE_DIR")
+    return Path(base).expanduser() if base else Path.home() / ".cache" / "exp-cli"
+
+
 # Initialize module-level paths on import.
 refresh_paths()
 
@@ -34,5 +71,6 @@ __all__ = [
     "ARTIFACT_ROOT",
     "DATASET_ROOT",
     "EXPERIMENT_ROOT",
+    "cache_root",
     "refresh_paths",
 ]
@@ -0,0 +1,52 @@
+"""Console entry point with a fast path for trivial invocations.
+
+``exp-cli``, ``exp-cli --help`` and ``exp-cli --version`` are answered with
+:mod:`argparse` before Click, Rich, pandas or the evaluator stack are imported.
+Every other invocation is handed to the Click application in :mod:`.cli`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+_FAST_PATH_ARGS = {"-h", "--help", "--version"}
+
+# Mirrors the commands registered on ``cli.cli`` (checked by the test suite) so
+# that help needs no Click import.
+_COMMAND_SUMMARIES = (
+    ("run", "🚀 Run an experiment from configuration file."),
+    ("validate", "✅ Validate experiment configuration without execution."),
+    ("run-directory", "🚀 Run experiments from a directory with automatic dependency management."),
+    ("info", "ℹ️  Display platform information and available evaluators."),
+)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    from . import __version__
+
+    commands = "\n".join(f"  {name:<15}{summary}" for name, summary in _COMMAND_SUMMARIES)
+    parser = argparse.ArgumentParser(
+        prog="exp-cli",
+        description="🧪 Experimentation Platform CLI",
+        epilog=f"commands:\n{commands}\n\nRun 'exp-cli COMMAND --help' for command options.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("-v", "--verbose", action="count", help="Increase verbosity")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Suppress non-error output")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the CLI, short-circuiting help/version requests."""
+    args = list(sys.argv[1:] if argv is None else argv)
+
+    if not args or (len(args) == 1 and args[0] in _FAST_PATH_ARGS):
+        _build_parser().parse_args(args or ["--help"])
+        return
+
+    from .cli import cli
+
+    cli.main(args=args, prog_name="exp-cli")
@@ -1,22 +1,33 @@
 """Evaluator collection used by the experimentation CLI."""
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 # Import built-in evaluators so they register themselves.
-from . import (
-    agent_evaluators,  # noqa: F401
-    equivalent,  # noqa: F401
-)
-
-# Import agent evaluators for direct access
-from .agent_evaluators import (
-    AgentToAgentCommunicationEvaluator,
-    ConversationQualityEvaluator,
-    SemanticKernelPerformanceEvaluator,
-    ToolCallAccuracyEvaluator,
-)
+from . import equivalent  # noqa: F401
 from .base import BaseEvaluator, EvaluatorOutput
 from .enhanced_registry import enhanced_registry, load_evaluators
 from .registry import register_evaluator, registry
 
+if TYPE_CHECKING:
+    from .agent_evaluators import (
+        AgentToAgentCommunicationEvaluator,
+        ConversationQualityEvaluator,
+        SemanticKernelPerformanceEvaluator,
+        ToolCallAccuracyEvaluator,
+    )
+
+# The agent evaluators do not register themselves, so they are only imported
+# when accessed rather than on every ``import exp_platform_cli.evaluators``.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ToolCallAccuracyEvaluator": ".agent_evaluators",
+    "ConversationQualityEvaluator": ".agent_evaluators",
+    "SemanticKernelPerformanceEvaluator": ".agent_evaluators",
+    "AgentToAgentCommunicationEvaluator": ".agent_evaluators",
+}
+
 __all__ = [
     "BaseEvaluator",
     "EvaluatorOutput",
@@ -29,3 +40,16 @@ __all__ = [
     "SemanticKernelPerformanceEvaluator",
     "AgentToAgentCommunicationEvaluator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
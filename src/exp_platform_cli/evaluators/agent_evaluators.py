@@ -2,9 +2,184 @@
 
 from __future__ import annotations
 
-from ..models import AgentRole, DataModelRow, EvaluationResult, ToolCallStatus
+import re
+from abc import abstractmethod
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Hashable, Sequence
+from functools import lru_cache
+
+from ..models import (
+    AgentRole,
+    DataModelRow,
+    EvaluationResult,
+    EvaluatorConfig,
+    RowColumns,
+    ToolCallStatus,
+)
 from .base import BaseEvaluator, EvaluatorOutput
 
+_COLLABORATION_PHRASES = (
+    "let me help",
+    "working together",
+    "collaborating",
+    "building on",
+    "continuing from",
+    "following up",
+)
+_TOOL_CONTEXT_PHRASES = ("using", "calling", "invoking", "executing")
+
+# One alternation per phrase list, so each message is scanned once per list
+_COLLABORATION_RE = re.compile("|".join(map(re.escape, _COLLABORATION_PHRASES)))
+_TOOL_CONTEXT_RE = re.compile("|".join(map(re.escape, _TOOL_CONTEXT_PHRASES)))
+
+
+# Piecewise-linear scores as (band upper bounds, (start, value at start, slope) per
+# band). A band includes its upper bound; the last band is open-ended.
+_PiecewiseTable = tuple[tuple[float, ...], tuple[tuple[float, float, float], ...]]
+
+# Optimal completion ratio is 20-60% of the total tokens
+_COMPLETION_RATIO_SCORE: _PiecewiseTable = (
+    (0.2, 0.6),
+    ((0.0, 0.0, 5.0), (0.2, 1.0, 0.0), (0.6, 1.0, -2.5)),
+)
+# Seconds: very fast up to 1s, acceptable up to 5s, slow up to 15s, then too slow
+_DURATION_SCORE: _PiecewiseTable = (
+    (1.0, 5.0, 15.0),
+    ((0.0, 1.0, 0.0), (1.0, 1.0, -0.05), (5.0, 0.8, -0.04), (15.0, 0.4, -0.01)),
+)
+
+
+def _piecewise(
+    x: float, bounds: tuple[float, ...], bands: tuple[tuple[float, float, float], ...]
+) -> float:
+    """Evaluate a piecewise-linear score, locating the band with a binary search."""
+    start, value, slope = bands[bisect_left(bounds, x)]
+    return value + (x - start) * slope
+
+
+def _token_efficiency(
+    prompt_tokens: int | None, completion_tokens: int | None, total_tokens: int | None
+) -> float:
+    """Calculate token usage efficiency."""
+    if not total_tokens:
+        return 1.0  # No token usage is perfectly efficient
+
+    # Efficiency based on token usage patterns
+    prompt_tokens = prompt_tokens or 0
+    completion_tokens = completion_tokens or 0
+
+    # Good efficiency if completion tokens are reasonable relative to prompt
+    if prompt_tokens > 0:
+        completion_ratio = completion_tokens / total_tokens
+        return max(0.0, _piecewise(completion_ratio, *_COMPLETION_RATIO_SCORE))
+
+    # Penalize very high token usage
+    if total_tokens > 4000:  # Assuming GPT-4 context
+        return max(0.1, 4000 / total_tokens)
+
+    return 1.0
+
+
+def _execution_efficiency(duration_ms: float | None) -> float:
+    """Calculate execution time efficiency."""
+    if not duration_ms:
+        return 1.0
+
+    # Efficiency based on execution time
+    return max(0.1, _piecewise(duration_ms / 1000, *_DURATION_SCORE))
+
+
+@lru_cache(maxsize=128)
+def _model_factor(model_name: str | None) -> float:
+    """Resource multiplier for a model; cached as rows share a handful of models."""
+    if not model_name:
+        return 1.0
+    model_name = model_name.lower()
+    if "gpt-4" in model_name:
+        return 0.8  # GPT-4 is expensive but high quality
+    elif "gpt-3.5" in model_name or "gpt-35" in model_name:
+        return 1.0  # Good balance
+    elif "text-" in model_name:
+        return 0.9  # Older models
+    return 1.0
+
+
+def _resource_usage(total_cost: float | None, model_name: str | None) -> float:
+    """Calculate resource usage efficiency."""
+    score = 1.0
+
+    # Factor in cost if available
+    if total_cost:
+        # Penalize high costs (assuming reasonable cost thresholds)
+        if total_cost > 0.10:  # $0.10
+            score *= max(0.1, 0.10 / total_cost)
+
+    # Factor in model efficiency
+    score *= _model_factor(model_name)
+
+    return min(1.0, score)
+
+
+class _CachedRowEvaluator(BaseEvaluator):
+    """Evaluator that memoises ``_evaluate_single_row`` results per instance.
+
+    Re-running :meth:`evaluate` over the same rows (for example while iterating
+    on metrics) reuses earlier scores. Entries are keyed by ``_row_key``, built
+    from exactly the columns the metric reads, so edits to those columns are
+    picked up and no reference to the row itself is kept. Only metrics that cost
+    noticeably more to score than to key use this. The cache is dropped whenever
+    the evaluator config changes. Rows without the data a metric needs share one
+    default result.
+    """
+
+    _max_cached_rows = 10_000
+
+    def __init__(
+        self, config: EvaluatorConfig, features_cache: dict[str, RowColumns] | None = None
+    ) -> None:
+        super().__init__(config, features_cache)
+        self._row_cache: OrderedDict[Hashable, EvaluationResult] = OrderedDict()
+        self._cached_config = config.model_copy(deep=True)
+        self._empty_result: EvaluationResult | None = None
+
+    @abstractmethod
+    def _evaluate_single_row(self, row: DataModelRow) -> EvaluationResult:
+        """Score a single row."""
+
+    @abstractmethod
+    def _has_data(self, row: DataModelRow) -> bool:
+        """Whether ``row`` carries the fields this metric scores."""
+
+    @abstractmethod
+    def _row_key(self, row: DataModelRow) -> Hashable:
+        """Everything about ``row`` that ``_evaluate_single_row`` reads."""
+
+    def _sync_config(self) -> None:
+        """Drop cached scores if the config changed; called once per :meth:`evaluate`."""
+        if self.config != self._cached_config:
+            self._row_cache.clear()
+            self._cached_config = self.config.model_copy(deep=True)
+            self._empty_result = None
+
+    def _score_row(self, row: DataModelRow) -> EvaluationResult:
+        if not self._has_data(row):
+            if self._empty_result is None:
+                self._empty_result = self._evaluate_single_row(row)
+            return self._empty_result
+
+        key = self._row_key(row)
+        cached = self._row_cache.get(key)
+        if cached is not None:
+            self._row_cache.move_to_end(key)
+            return cached
+
+        result = self._evaluate_single_row(row)
+        self._row_cache[key] = result
+        if len(self._row_cache) > self._max_cached_rows:
+            self._row_cache.popitem(last=False)
+        return result
+
 
 class ToolCallAccuracyEvaluator(BaseEvaluator):
     """Evaluate the accuracy and success rate of tool calls."""
@@ -12,20 +187,24 @@ class ToolCallAccuracyEvaluator(BaseEvaluator):
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
         """Evaluate tool call accuracy across multiple rows."""
         per_row_results = {}
-        total_accuracy = 0.0
         total_calls = 0
         successful_calls = 0
 
+        # Only the success tally is needed here, so skip building the full
+        # per-row metadata and read it from the row's columns.
+        success = ToolCallStatus.SUCCESS
         for row in rows:
-            result = self._evaluate_single_row(row)
+            columns = self._columns(row)
+            row_calls = len(columns.tool_statuses)
+            row_successful = columns.tool_status_counts[success]
             per_row_results[row.id] = {
-                "tool_call_accuracy": result.metric_value,
-                "total_calls": result.metadata.get("total_calls", 0),
-                "successful_calls": result.metadata.get("successful_calls", 0),
+                "tool_call_accuracy": row_successful / row_calls if row_calls else 1.0,
+                "total_calls": row_calls,
+                "successful_calls": row_successful,
             }
 
-            total_calls += result.metadata.get("total_calls", 0)
-            successful_calls += result.metadata.get("successful_calls", 0)
+            total_calls += row_calls
+            successful_calls += row_successful
 
         overall_accuracy = successful_calls / total_calls if total_calls > 0 else 1.0
 
@@ -49,22 +228,16 @@ class ToolCallAccuracyEvaluator(BaseEvaluator):
                 metadata={"reason": "no_tool_calls", "total_calls": 0},
             )
 
-        successful_calls = sum(
-            1 for call in row.tool_calls if call.status == ToolCallStatus.SUCCESS
-        )
-        total_calls = len(row.tool_calls)
-        accuracy = successful_calls / total_calls if total_calls > 0 else 1.0
-
-        # Calculate additional metrics
-        failed_calls = sum(1 for call in row.tool_calls if call.status == ToolCallStatus.FAILED)
-        timeout_calls = sum(1 for call in row.tool_calls if call.status == ToolCallStatus.TIMEOUT)
-        cancelled_calls = sum(
-            1 for call in row.tool_calls if call.status == ToolCallStatus.CANCELLED
-        )
+        # Tally from the row's column view
+        columns = self._columns(row)
+        status_counts = columns.tool_status_counts
+        tools_used = set(columns.tool_names)
+        functions_used = set(zip(columns.tool_names, columns.function_names, strict=True))
+        times = [time_ms for time_ms in columns.tool_times_ms if time_ms is not None]
 
-        # Analyze tool usage patterns
-        tools_used = set(call.tool_name for call in row.tool_calls)
-        functions_used = set(f"{call.tool_name}.{call.function_name}" for call in row.tool_calls)
+        total_calls = len(row.tool_calls)
+        successful_calls = status_counts[ToolCallStatus.SUCCESS]
+        accuracy = successful_calls / total_calls
 
         return EvaluationResult(
             metric_name="tool_call_accuracy",
@@ -72,24 +245,18 @@ class ToolCallAccuracyEvaluator(BaseEvaluator):
             metadata={
                 "total_calls": total_calls,
                 "successful_calls": successful_calls,
-                "failed_calls": failed_calls,
-                "timeout_calls": timeout_calls,
-                "cancelled_calls": cancelled_calls,
+                "failed_calls": status_counts[ToolCallStatus.FAILED],
+                "timeout_calls": status_counts[ToolCallStatus.TIMEOUT],
+                "cancelled_calls": status_counts[ToolCallStatus.CANCELLED],
                 "unique_tools": len(tools_used),
                 "unique_functions": len(functions_used),
-                "tools_used": list(tools_used),
-                "functions_used": list(functions_used),
-                "average_execution_time_ms": self._calculate_avg_execution_time(row.tool_calls),
+                # Sets are kept as-is; pydantic serializes them as JSON lists
+                "tools_used": tools_used,
+                "functions_used": {f"{tool}.{function}" for tool, function in functions_used},
+                "average_execution_time_ms": sum(times) / len(times) if times else None,
             },
         )
 
-    def _calculate_avg_execution_time(self, tool_calls: list) -> float | None:
-        """Calculate average execution time for tool calls."""
-        times = [
-            call.execution_time_ms for call in tool_calls if call.execution_time_ms is not None
-        ]
-        return sum(times) / len(times) if times else None
-
 
 class ConversationQualityEvaluator(BaseEvaluator):
     """Evaluate the quality of agent conversations."""
@@ -97,21 +264,23 @@ class ConversationQualityEvaluator(BaseEvaluator):
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
         """Evaluate conversation quality across multiple rows."""
         per_row_results = {}
-        total_quality = 0.0
-        total_messages = 0
+        qualities: list[float] = []
+        message_counts: list[int] = []
 
         for row in rows:
             result = self._evaluate_single_row(row)
+            metadata = result.metadata
+            message_count = metadata.get("total_messages", 0)
             per_row_results[row.id] = {
                 "conversation_quality": result.metric_value,
-                "message_count": result.metadata.get("total_messages", 0),
-                "balance_score": result.metadata.get("balance_score", 0.0),
+                "message_count": message_count,
+                "balance_score": metadata.get("balance_score", 0.0),
             }
+            qualities.append(result.metric_value)
+            message_counts.append(message_count)
 
-            total_quality += result.metric_value
-            total_messages += result.metadata.get("total_messages", 0)
-
-        avg_quality = total_quality / len(rows) if rows else 0.0
+        total_messages = sum(message_counts)
+        avg_quality = sum(qualities) / len(rows) if rows else 0.0
 
         return EvaluatorOutput(
             name="conversation_quality",
@@ -133,20 +302,23 @@ class ConversationQualityEvaluator(BaseEvaluator):
                 metadata={"reason": "no_conversation", "message_count": 0},
             )
 
-        messages = row.conversation_history
-
-        # Basic conversation metrics
-        total_messages = len(messages)
-        user_messages = sum(1 for msg in messages if msg.role == AgentRole.USER)
-        assistant_messages = sum(1 for msg in messages if msg.role == AgentRole.ASSISTANT)
-        system_messages = sum(1 for msg in messages if msg.role == AgentRole.SYSTEM)
+        # Derive every per-message metric from the row's column view
+        columns = self._columns(row)
+        role_counts = columns.message_role_counts
+        user_messages = role_counts[AgentRole.USER]
+        assistant_messages = role_counts[AgentRole.ASSISTANT]
+        system_messages = role_counts[AgentRole.SYSTEM]
+        lengths = columns.message_lengths
+        non_empty_messages = len(lengths) - lengths.count(0)
+        messages_with_tools = columns.message_has_tools.count(True)
+        total_messages = len(lengths)
 
         # Calculate conversation balance
         balance_score = self._calculate_balance_score(user_messages, assistant_messages)
 
         # Calculate response quality indicators
-        avg_response_length = self._calculate_avg_response_length(messages)
-        tool_usage_score = self._calculate_tool_usage_score(messages)
+        avg_response_length = sum(lengths) / non_empty_messages if non_empty_messages else 0.0
+        tool_usage_score = self._calculate_tool_usage_score(messages_with_tools, total_messages)
 
         # Calculate overall quality score (0-1)
         quality_score = (balance_score + tool_usage_score) / 2
@@ -163,7 +335,7 @@ class ConversationQualityEvaluator(BaseEvaluator):
                 "tool_usage_score": tool_usage_score,
                 "avg_response_length": avg_response_length,
                 "conversation_turns": (user_messages + assistant_messages) // 2,
-                "unique_agents": len(set(msg.agent_id for msg in messages if msg.agent_id)),
+                "unique_agents": len(columns.unique_agent_ids),
             },
         )
 
@@ -180,16 +352,8 @@ class ConversationQualityEvaluator(BaseEvaluator):
         ratio = min(user_messages, assistant_messages) / max(user_messages, assistant_messages)
         return ratio
 
-    def _calculate_avg_response_length(self, messages: list) -> float:
-        """Calculate average response length."""
-        lengths = [len(msg.content) for msg in messages if msg.content]
-        return sum(lengths) / len(lengths) if lengths else 0.0
-
-    def _calculate_tool_usage_score(self, messages: list) -> float:
+    def _calculate_tool_usage_score(self, messages_with_tools: int, total_messages: int) -> float:
         """Calculate tool usage effectiveness score."""
-        messages_with_tools = sum(1 for msg in messages if msg.tool_calls)
-        total_messages = len(messages)
-
         if total_messages == 0:
             return 0.0
 
@@ -211,24 +375,28 @@ class SemanticKernelPerformanceEvaluator(BaseEvaluator):
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
         """Evaluate Semantic Kernel performance across multiple rows."""
         per_row_results = {}
-        total_performance = 0.0
-        total_tokens = 0
-        total_duration = 0.0
+        performances: list[float] = []
+        token_counts: list[int] = []
+        durations: list[float] = []
 
         for row in rows:
             result = self._evaluate_single_row(row)
+            metadata = result.metadata
+            # Traces may report no token count or duration; count those as zero
+            duration = metadata.get("duration_ms") or 0.0
             per_row_results[row.id] = {
                 "sk_performance": result.metric_value,
-                "token_efficiency": result.metadata.get("token_efficiency", 0.0),
-                "execution_efficiency": result.metadata.get("execution_efficiency", 0.0),
-                "duration_ms": result.metadata.get("duration_ms", 0.0),
+                "token_efficiency": metadata.get("token_efficiency", 0.0),
+                "execution_efficiency": metadata.get("execution_efficiency", 0.0),
+                "duration_ms": duration,
             }
+            performances.append(result.metric_value)
+            token_counts.append(metadata.get("total_tokens") or 0)
+            durations.append(duration)
 
-            total_performance += result.metric_value
-            total_tokens += result.metadata.get("total_tokens", 0)
-            total_duration += result.metadata.get("duration_ms", 0.0)
-
-        avg_performance = total_performance / len(rows) if rows else 0.0
+        total_tokens = sum(token_counts)
+        total_duration = sum(durations)
+        avg_performance = sum(performances) / len(rows) if rows else 0.0
 
         return EvaluatorOutput(
             name="sk_performance",
@@ -254,9 +422,11 @@ class SemanticKernelPerformanceEvaluator(BaseEvaluator):
         interaction = row.agent_interaction
 
         # Calculate performance metrics
-        token_efficiency = self._calculate_token_efficiency(trace)
-        execution_efficiency = self._calculate_execution_efficiency(interaction)
-        resource_usage = self._calculate_resource_usage(trace, interaction)
+        token_efficiency = _token_efficiency(
+            trace.prompt_tokens, trace.completion_tokens, trace.total_tokens
+        )
+        execution_efficiency = _execution_efficiency(interaction.duration_ms)
+        resource_usage = _resource_usage(interaction.total_cost, trace.model_name)
 
         # Calculate overall performance score
         performance_score = (token_efficiency + execution_efficiency + resource_usage) / 3
@@ -278,99 +448,31 @@ class SemanticKernelPerformanceEvaluator(BaseEvaluator):
             },
         )
 
-    def _calculate_token_efficiency(self, trace) -> float:
-        """Calculate token usage efficiency."""
-        if not trace.total_tokens:
-            return 1.0  # No token usage is perfectly efficient
-
-        # Efficiency based on token usage patterns
-        prompt_tokens = trace.prompt_tokens or 0
-        completion_tokens = trace.completion_tokens or 0
-        total_tokens = trace.total_tokens or (prompt_tokens + completion_tokens)
-
-        if total_tokens == 0:
-            return 1.0
-
-        # Good efficiency if completion tokens are reasonable relative to prompt
-        if prompt_tokens > 0:
-            completion_ratio = completion_tokens / total_tokens
-            # Optimal completion ratio is 20-60%
-            if 0.2 <= completion_ratio <= 0.6:
-                return 1.0
-            elif completion_ratio < 0.2:
-                return completion_ratio / 0.2
-            else:
-                return max(0.0, (1.0 - completion_ratio) / 0.4)
-
-        # Penalize very high token usage
-        if total_tokens > 4000:  # Assuming GPT-4 context
-            return max(0.1, 4000 / total_tokens)
-
-        return 1.0
-
-    def _calculate_execution_efficiency(self, interaction) -> float:
-        """Calculate execution time efficiency."""
-        if not interaction.duration_ms:
-            return 1.0
-
-        # Efficiency based on execution time
-        duration_seconds = interaction.duration_ms / 1000
 
-        # Good performance thresholds
-        if duration_seconds <= 1.0:  # Very fast
-            return 1.0
-        elif duration_seconds <= 5.0:  # Acceptable
-            return 1.0 - (duration_seconds - 1.0) / 4.0 * 0.2
-        elif duration_seconds <= 15.0:  # Slow but acceptable
-            return 0.8 - (duration_seconds - 5.0) / 10.0 * 0.4
-        else:  # Too slow
-            return max(0.1, 0.4 - (duration_seconds - 15.0) / 30.0 * 0.3)
-
-    def _calculate_resource_usage(self, trace, interaction) -> float:
-        """Calculate resource usage efficiency."""
-        score = 1.0
-
-        # Factor in cost if available
-        if interaction.total_cost:
-            # Penalize high costs (assuming reasonable cost thresholds)
-            if interaction.total_cost > 0.10:  # $0.10
-                score *= max(0.1, 0.10 / interaction.total_cost)
-
-        # Factor in model efficiency
-        if trace.model_name:
-            model_name = trace.model_name.lower()
-            if "gpt-4" in model_name:
-                score *= 0.8  # GPT-4 is expensive but high quality
-            elif "gpt-3.5" in model_name or "gpt-35" in model_name:
-                score *= 1.0  # Good balance
-            elif "text-" in model_name:
-                score *= 0.9  # Older models
-
-        return min(1.0, score)
-
-
-class AgentToAgentCommunicationEvaluator(BaseEvaluator):
+class AgentToAgentCommunicationEvaluator(_CachedRowEvaluator):
     """Evaluate agent-to-agent communication effectiveness."""
 
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
         """Evaluate agent communication across multiple rows."""
         per_row_results = {}
-        total_communication = 0.0
-        multi_agent_conversations = 0
+        communications: list[float] = []
+        agent_counts: list[int] = []
 
+        self._sync_config()
         for row in rows:
-            result = self._evaluate_single_row(row)
+            result = self._score_row(row)
+            metadata = result.metadata
+            unique_agents = metadata.get("unique_agents", 0)
             per_row_results[row.id] = {
                 "agent_communication": result.metric_value,
-                "unique_agents": result.metadata.get("unique_agents", 0),
-                "multi_agent_turns": result.metadata.get("multi_agent_turns", 0),
+                "unique_agents": unique_agents,
+                "multi_agent_turns": metadata.get("multi_agent_turns", 0),
             }
+            communications.append(result.metric_value)
+            agent_counts.append(unique_agents)
 
-            total_communication += result.metric_value
-            if result.metadata.get("unique_agents", 0) > 1:
-                multi_agent_conversations += 1
-
-        avg_communication = total_communication / len(rows) if rows else 0.0
+        multi_agent_conversations = sum(count > 1 for count in agent_counts)
+        avg_communication = sum(communications) / len(rows) if rows else 0.0
 
         return EvaluatorOutput(
             name="agent_communication",
@@ -383,6 +485,13 @@ class AgentToAgentCommunicationEvaluator(BaseEvaluator):
             per_row=per_row_results,
         )
 
+    def _has_data(self, row: DataModelRow) -> bool:
+        return bool(row.conversation_history)
+
+    def _row_key(self, row: DataModelRow) -> Hashable:
+        columns = self._columns(row)
+        return (columns.message_agent_ids, columns.message_contents, columns.message_has_tools)
+
     def _evaluate_single_row(self, row: DataModelRow) -> EvaluationResult:
         """Evaluate agent-to-agent communication."""
         if not row.conversation_history:
@@ -392,22 +501,26 @@ class AgentToAgentCommunicationEvaluator(BaseEvaluator):
                 metadata={"reason": "no_conversation"},
             )
 
-        messages = row.conversation_history
+        columns = self._columns(row)
+        agent_ids = columns.message_agent_ids
 
         # Identify unique agents
-        agents = set(msg.agent_id for msg in messages if msg.agent_id)
+        agents = columns.unique_agent_ids
 
         if len(agents) < 2:
             return EvaluationResult(
                 metric_name="agent_communication",
                 metric_value=0.0,
-                metadata={"reason": "single_agent", "agents": list(agents)},
+                metadata={"reason": "single_agent", "agents": agents},
             )
 
+        # Lowercase each message once for both the handoff and collaboration checks
+        contents = [content.lower() for content in columns.message_contents]
+
         # Analyze communication patterns
-        communication_score = self._analyze_communication_patterns(messages, agents)
-        handoff_score = self._analyze_handoffs(messages)
-        collaboration_score = self._analyze_collaboration(messages)
+        communication_score = self._analyze_communication_patterns(agent_ids)
+        handoff_score, multi_agent_turns = self._analyze_turns(agent_ids, contents)
+        collaboration_score = self._analyze_collaboration(contents, columns.message_has_tools)
 
         overall_score = (communication_score + handoff_score + collaboration_score) / 3
 
@@ -419,22 +532,19 @@ class AgentToAgentCommunicationEvaluator(BaseEvaluator):
                 "communication_score": communication_score,
                 "handoff_score": handoff_score,
                 "collaboration_score": collaboration_score,
-                "agent_ids": list(agents),
-                "total_exchanges": len(messages),
-                "multi_agent_turns": self._count_multi_agent_turns(messages),
+                "agent_ids": agents,
+                "total_exchanges": len(agent_ids),
+                "multi_agent_turns": multi_agent_turns,
             },
         )
 
-    def _analyze_communication_patterns(self, messages: list, agents: set) -> float:
-        """Analyze communication patterns between agents."""
-        if len(messages) < 2:
+    def _analyze_communication_patterns(self, agent_ids: Sequence[str | None]) -> float:
+        """Analyze communication patterns between agents, given each message's agent."""
+        if len(agent_ids) < 2:
             return 0.0
 
         # Check for balanced communication
-        agent_message_counts = {}
-        for msg in messages:
-            if msg.agent_id:
-                agent_message_counts[msg.agent_id] = agent_message_counts.get(msg.agent_id, 0) + 1
+        agent_message_counts = Counter(filter(None, agent_ids))
 
         if not agent_message_counts:
             return 0.0
@@ -448,84 +558,70 @@ class AgentToAgentCommunicationEvaluator(BaseEvaluator):
 
         return balance_score
 
-    def _analyze_handoffs(self, messages: list) -> float:
-        """Analyze the quality of handoffs between agents."""
-        if len(messages) < 2:
-            return 0.0
+    def _analyze_turns(
+        self, agent_ids: Sequence[str | None], contents: Sequence[str]
+    ) -> tuple[float, int]:
+        """Score handoffs between agents and count agent changes in one pass.
+
+        Takes each message's agent id and lowercased content and returns
+        ``(handoff_score, multi_agent_turns)``.
+        """
+        if len(agent_ids) < 2:
+            return 0.0, 0
 
+        turns = 0
         handoffs = 0
         smooth_handoffs = 0
 
-        for i in range(1, len(messages)):
-            prev_msg = messages[i - 1]
-            curr_msg = messages[i]
-
-            if prev_msg.agent_id != curr_msg.agent_id and prev_msg.agent_id and curr_msg.agent_id:
-                handoffs += 1
-
-                # Check if handoff is smooth (no abrupt topic changes)
-                # This is a simplified check - in practice, you might use NLP
-                if self._is_smooth_handoff(prev_msg.content, curr_msg.content):
-                    smooth_handoffs += 1
-
-        return smooth_handoffs / handoffs if handoffs > 0 else 1.0
-
-    def _analyze_collaboration(self, messages: list) -> float:
-        """Analyze collaborative behavior between agents."""
+        # A message's word set is built at most once and carried over to the
+        # next pair, since consecutive handoffs share a message.
+        prev_words: frozenset[str] | None = None
+        for i in range(1, len(agent_ids)):
+            prev_agent, curr_agent = agent_ids[i - 1], agent_ids[i]
+            curr_words = None
+            if prev_agent != curr_agent:
+                turns += 1
+                if prev_agent and curr_agent:
+                    handoffs += 1
+                    if prev_words is None:
+                        prev_words = frozenset(contents[i - 1].split())
+                    curr_words = frozenset(contents[i].split())
+
+                    # Check if handoff is smooth (no abrupt topic changes)
+                    # This is a simplified check - in practice, you might use NLP
+                    if self._is_smooth_handoff(prev_words, curr_words):
+                        smooth_handoffs += 1
+            prev_words = curr_words
+
+        return (smooth_handoffs / handoffs if handoffs > 0 else 1.0), turns
+
+    def _analyze_collaboration(self, contents: Sequence[str], has_tools: Sequence[bool]) -> float:
+        """Analyze collaborative behavior, given lowercased contents and tool flags."""
         collaboration_indicators = 0
-        total_messages = len(messages)
+        total_messages = len(contents)
 
         if total_messages == 0:
             return 0.0
 
         # Look for collaboration indicators
-        for msg in messages:
-            content = msg.content.lower()
-
+        for content, used_tools in zip(contents, has_tools, strict=True):
             # Check for collaborative language
-            if any(
-                phrase in content
-                for phrase in [
-                    "let me help",
-                    "working together",
-                    "collaborating",
-                    "building on",
-                    "continuing from",
-                    "following up",
-                ]
-            ):
+            if _COLLABORATION_RE.search(content):
                 collaboration_indicators += 1
 
             # Check for tool usage in collaborative context
-            if msg.tool_calls and any(
-                phrase in content for phrase in ["using", "calling", "invoking", "executing"]
-            ):
+            if used_tools and _TOOL_CONTEXT_RE.search(content):
                 collaboration_indicators += 1
 
         return min(
             1.0, collaboration_indicators / (total_messages * 0.3)
         )  # Up to 30% collaborative messages is ideal
 
-    def _is_smooth_handoff(self, prev_content: str, curr_content: str) -> bool:
-        """Check if a handoff between agents is smooth."""
+    def _is_smooth_handoff(self, prev_words: frozenset[str], curr_words: frozenset[str]) -> bool:
+        """Check if a handoff between agents is smooth, given each message's words."""
         # Simplified implementation - in practice, use semantic similarity
-        prev_words = set(prev_content.lower().split())
-        curr_words = set(curr_content.lower().split())
-
         # Check for word overlap (indicates topic continuity)
-        overlap = len(prev_words.intersection(curr_words))
-        total_unique = len(prev_words.union(curr_words))
+        overlap = len(prev_words & curr_words)
+        total_unique = len(prev_words) + len(curr_words) - overlap
 
         return overlap / total_unique > 0.1 if total_unique > 0 else False
-
-    def _count_multi_agent_turns(self, messages: list) -> int:
-        """Count the number of multi-agent conversation turns."""
-        if len(messages) < 2:
-            return 0
-
-        turns = 0
-        for i in range(1, len(messages)):
-            if messages[i - 1].agent_id != messages[i].agent_id:
-                turns += 1
-
-        return turns
@@ -5,8 +5,12 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from ..models import DataModelRow, EvaluatorConfig
+from ..models import DataModelRow, EvaluatorConfig, RowColumns
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(slots=True)
@@ -17,12 +21,45 @@ class EvaluatorOutput:
     summary: Mapping[str, float]
     per_row: dict[str, Mapping[str, float]] = field(default_factory=dict)
 
+    def to_frame(self) -> pd.DataFrame:
+        """Return ``per_row`` as a DataFrame with one column per metric.
+
+        Rows are indexed by ``row_id``, so metrics can be aggregated or written
+        out column-wise instead of walking one dict per row.
+        """
+        # Deferred so importing the evaluators does not pull in pandas
+        import pandas as pd
+
+        frame = pd.DataFrame.from_dict(self.per_row, orient="index")
+        frame.index.name = "row_id"
+        return frame
+
 
 class BaseEvaluator(ABC):
-    """Abstract base class for evaluators."""
+    """Abstract base class for evaluators.
 
-    def __init__(self, config: EvaluatorConfig) -> None:
+    ``features_cache`` maps row ids to column views shared by every evaluator in
+    one evaluation run, so each row's columns are built once for the whole
+    suite. Without it, each :meth:`evaluate` call takes its own views.
+    """
+
+    features_cache: dict[str, RowColumns] | None = None
+
+    def __init__(
+        self, config: EvaluatorConfig, features_cache: dict[str, RowColumns] | None = None
+    ) -> None:
         self.config = config
+        self.features_cache = features_cache
+
+    def _columns(self, row: DataModelRow) -> RowColumns:
+        """Column view of ``row``, taken from ``features_cache`` when one is set."""
+        cache = self.features_cache
+        if cache is None:
+            return row.columns
+        columns = cache.get(row.id)
+        if columns is None or columns.row is not row:
+            columns = cache[row.id] = row.columns
+        return columns
 
     @abstractmethod
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
@@ -2,19 +2,107 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
-from collections.abc import Iterable
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, KeysView
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from ..constants import cache_root
 from ..models import DataModelRow, EvaluatorConfig
+from ..utils import atomic_write_bytes
 from .base import BaseEvaluator, EvaluatorOutput
 from .registry import registry as base_registry
 
+log = logging.getLogger(__name__)
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# (mtime_ns, size) of a file a cached flow evaluator was loaded from.
+_FileStamp = tuple[int, int]
+
+
+class _FlowStamp(NamedTuple):
+    flow: _FileStamp
+    module: _FileStamp
+    module_file: Path
+
+
+def _stamp(path: Path) -> _FileStamp:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _dir_mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_flow_data(flow_file: Path, stamp: _FileStamp) -> Any:
+    """Parse ``flow.flex.yaml``, reusing a JSON copy cached by an earlier run.
+
+    The copy lives under the shared cache directory rather than beside the
+    evaluator sources, and is only used while the file's stamp is unchanged.
+    """
+    cache_key = str(flow_file.resolve())
+    digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+    cache_path = cache_root() / "flows" / f"{digest}.json"
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["path"] == cache_key and tuple(cached["stamp"]) == stamp:
+            return cached["data"]
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # corrupt entry; fall back to parsing
+        log.debug("Ignoring unreadable flow cache for %s: %s", flow_file, exc)
+
+    with flow_file.open("rb") as f:
+        flow_data = yaml.load(f, Loader=_YamlLoader)
+
+    try:
+        entry = json.dumps({"path": cache_key, "stamp": stamp, "data": flow_data})
+        # Only cache data that survives JSON unchanged (no dates, non-string keys)
+        if json.loads(entry)["data"] == flow_data:
+            atomic_write_bytes(cache_path, entry.encode("utf-8"))
+    except (OSError, TypeError, ValueError) as exc:
+        log.debug("Could not write flow cache for %s: %s", flow_file, exc)
+    return flow_data
+
+
+def _default_max_workers() -> int:
+    """Rows scored concurrently when a flow does not set ``max_workers``."""
+    value = os.getenv("EXP_CLI_EVAL_WORKERS")
+    if not value:
+        return 1
+    try:
+        return max(1, int(value))
+    except ValueError:
+        log.warning("Ignoring non-integer EXP_CLI_EVAL_WORKERS=%r", value)
+        return 1
+
+
+# Platform keys a data mapping may use for row fields, with common aliases.
+_ROW_FIELD_ALIASES = {
+    "data_output": "data_output",
+    "expected_output": "expected_output",
+    "response": "data_output",
+    "ground_truth": "expected_output",
+}
+
 
 class FlowEvaluatorConfig(BaseModel):
     """Configuration for foundry-style flow evaluators."""
@@ -22,38 +110,65 @@ class FlowEvaluatorConfig(BaseModel):
     inputs: dict[str, Any]
     entry: str  # module:ClassName format
     environment: dict[str, str] = {}
+    # Rows scored concurrently. Only raise this for thread-safe evaluators that
+    # wait on I/O (e.g. model endpoints); pure-Python scoring gains nothing.
+    # Defaults to EXP_CLI_EVAL_WORKERS, or 1 when that is unset.
+    max_workers: int = Field(default_factory=_default_max_workers)
 
 
 class FlowEvaluatorWrapper(BaseEvaluator):
     """Wrapper to adapt foundry-style evaluators to platform interface."""
 
+    _max_error_results = 256
+
     def __init__(
         self, config: EvaluatorConfig, flow_config: FlowEvaluatorConfig, evaluator_instance: Any
     ):
         super().__init__(config)
         self.flow_config = flow_config
         self.evaluator_instance = evaluator_instance
+        self._mapping_plan = self._compile_mapping(config.data_mapping)
+        # Error message -> the (read-only) result shared by rows failing with it
+        self._error_results: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def _compile_mapping(data_mapping: dict[str, str]) -> list[tuple[str, str, str | None]]:
+        """Resolve ``data_mapping`` to (foundry key, platform key, row attribute) once.
+
+        The attribute names the row field a platform key aliases, used when the
+        key is not present in the row's ``data_input``.
+        """
+        return [
+            (foundry_key, platform_key, _ROW_FIELD_ALIASES.get(platform_key))
+            for foundry_key, platform_key in data_mapping.items()
+        ]
 
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
         """Process foundry evaluator row-by-row as intended by foundry design."""
+        # Pick up mapping edits made since construction
+        self._mapping_plan = self._compile_mapping(self.config.data_mapping)
         per_row: dict[str, dict[str, float]] = {}
-        summary_metrics: dict[str, float] = {}
+        # Numeric values per metric, summed once all rows are in
+        metric_values: dict[str, list[float]] = {}
+
+        max_workers = min(self.flow_config.max_workers, len(rows))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                row_results = list(executor.map(self._evaluate_single_row, rows))
+        else:
+            row_results = [self._evaluate_single_row(row) for row in rows]
 
-        for row in rows:
-            row_result = self._evaluate_single_row(row)
+        for row, row_result in zip(rows, row_results, strict=True):
             per_row[row.id] = row_result
 
-            # Accumulate metrics for summary
+            # Collect metrics for summary; failed rows also carry an error message
             for key, value in row_result.items():
-                if key not in summary_metrics:
-                    summary_metrics[key] = 0.0
-                summary_metrics[key] += value
+                if isinstance(value, int | float):
+                    metric_values.setdefault(key, []).append(value)
 
         # Calculate averages for summary (foundry-style aggregation)
         total_rows = len(rows)
-        if total_rows > 0:
-            for key in summary_metrics:
-                summary_metrics[key] /= total_rows
+        summary_metrics = {key: sum(values) / total_rows for key, values in metric_values.items()}
 
         return EvaluatorOutput(
             name=self.config.name,
@@ -74,12 +189,19 @@ class FlowEvaluatorWrapper(BaseEvaluator):
             return self._process_foundry_result(result)
 
         except Exception as e:
-            # Graceful error handling per row
-            return {
-                "error": 1.0,
-                "score": 0.0,
-                "evaluation_error": f"Foundry evaluator failed: {str(e)}",
-            }
+            # Graceful error handling per row; an evaluator that fails on every
+            # row usually fails the same way, so build each distinct result once
+            message = str(e)
+            cached = self._error_results.get(message)
+            if cached is None:
+                if len(self._error_results) >= self._max_error_results:
+                    self._error_results.clear()
+                cached = self._error_results[message] = {
+                    "error": 1.0,
+                    "score": 0.0,
+                    "evaluation_error": f"Foundry evaluator failed: {message}",
+                }
+            return cached
 
     def _build_foundry_inputs(self, row: DataModelRow) -> dict[str, Any]:
         """Build foundry-compatible inputs for a single row."""
@@ -92,21 +214,14 @@ class FlowEvaluatorWrapper(BaseEvaluator):
         # Add all row input data (foundry evaluators expect access to original inputs)
         foundry_inputs.update(row.data_input)
 
-        # Apply explicit data mapping if configured
-        if self.config.data_mapping:
-            # Create a complete view of available data for mapping
-            available_data = {
-                "data_output": row.data_output,
-                "expected_output": row.expected_output,
-                "response": row.data_output,  # Common alias
-                "ground_truth": row.expected_output,  # Common alias
-                **row.data_input,
-            }
-
-            # Apply mappings (this allows flexible field mapping)
-            for foundry_key, platform_key in self.config.data_mapping.items():
-                if platform_key in available_data:
-                    foundry_inputs[foundry_key] = available_data[platform_key]
+        # Apply explicit data mapping if configured (this allows flexible field
+        # mapping); row inputs take precedence over the row field aliases
+        data_input = row.data_input
+        for foundry_key, platform_key, attribute in self._mapping_plan:
+            if platform_key in data_input:
+                foundry_inputs[foundry_key] = data_input[platform_key]
+            elif attribute is not None:
+                foundry_inputs[foundry_key] = getattr(row, attribute)
 
         return foundry_inputs
 
@@ -116,14 +231,11 @@ class FlowEvaluatorWrapper(BaseEvaluator):
             # Handle non-dict results
             return {"score": float(result) if isinstance(result, (int, float, bool)) else 0.0}
 
-        # Process foundry result dictionary
-        row_metrics = {}
-        for key, value in result.items():
-            if isinstance(value, (int, float)):
-                row_metrics[key] = float(value)
-            elif isinstance(value, bool):
-                row_metrics[key] = float(value)
-            # Skip non-numeric fields (like 'notes', 'response_normalized', etc.)
+        # Process foundry result dictionary; bools count as numbers and non-numeric
+        # fields (like 'notes', 'response_normalized', etc.) are skipped
+        row_metrics = {
+            key: float(value) for key, value in result.items() if isinstance(value, int | float)
+        }
 
         # Ensure we always have a 'score' metric for consistency
         if "score" not in row_metrics and len(row_metrics) > 0:
@@ -134,11 +246,23 @@ class FlowEvaluatorWrapper(BaseEvaluator):
 
 
 class EnhancedEvaluatorRegistry:
-    """Enhanced registry supporting both platform and foundry evaluators."""
+    """Enhanced registry supporting both platform and foundry evaluators.
+
+    Loaded flow evaluators are cached per directory and reused until their
+    ``flow.flex.yaml`` or entry module changes on disk; evaluator directories
+    are indexed by name and rescanned only when a search directory changes.
+    """
+
+    _max_cached_flows = 100
 
     def __init__(self):
         self.base_registry = base_registry
-        self._flow_cache: dict[str, tuple[FlowEvaluatorConfig, Any]] = {}
+        # Evaluator directory -> (file stamps, config, instance), least recently used first
+        self._flow_cache: OrderedDict[Path, tuple[_FlowStamp, FlowEvaluatorConfig, Any]] = (
+            OrderedDict()
+        )
+        self._path_index: dict[str, list[Path]] | None = None
+        self._path_index_signature: tuple[Any, ...] | None = None
 
     def _load_flow_evaluator(self, evaluator_path: Path) -> tuple[FlowEvaluatorConfig, Any] | None:
         """Load a foundry-style flow evaluator from directory."""
@@ -147,10 +271,17 @@ class EnhancedEvaluatorRegistry:
             return None
 
         try:
-            # Load flow configuration
-            with flow_file.open("r") as f:
-                flow_data = yaml.safe_load(f)
+            cached = self._flow_cache.get(evaluator_path)
+            if cached is not None:
+                stamps, flow_config, evaluator_instance = cached
+                if stamps.flow == _stamp(flow_file) and stamps.module == _stamp(stamps.module_file):
+                    self._flow_cache.move_to_end(evaluator_path)
+                    return flow_config, evaluator_instance
+
+            flow_stamp = _stamp(flow_file)
 
+            # Load flow configuration
+            flow_data = _read_flow_data(flow_file, flow_stamp)
             flow_config = FlowEvaluatorConfig(**flow_data)
 
             # Parse entry point
@@ -165,6 +296,7 @@ class EnhancedEvaluatorRegistry:
             module_file = evaluator_path / f"{module_name}.py"
             if not module_file.exists():
                 raise FileNotFoundError(f"Module file not found: {module_file}")
+            module_stamp = _stamp(module_file)
 
             spec = importlib.util.spec_from_file_location(module_name, module_file)
             if spec is None or spec.loader is None:
@@ -177,28 +309,41 @@ class EnhancedEvaluatorRegistry:
             evaluator_class = getattr(module, class_name)
             evaluator_instance = evaluator_class()
 
-            return flow_config, evaluator_instance
-
         except Exception as e:
             raise ValueError(f"Failed to load flow evaluator from {evaluator_path}: {e}")
 
-    def _find_evaluator_paths(self) -> list[Path]:
-        """Find all potential evaluator directories."""
-        paths = []
+        self._flow_cache[evaluator_path] = (
+            _FlowStamp(flow_stamp, module_stamp, module_file),
+            flow_config,
+            evaluator_instance,
+        )
+        self._flow_cache.move_to_end(evaluator_path)
+        if len(self._flow_cache) > self._max_cached_flows:
+            self._flow_cache.popitem(last=False)
+        return flow_config, evaluator_instance
 
+    def _evaluator_index(self) -> dict[str, list[Path]]:
+        """Map lowercased evaluator names to the directories that provide them."""
         # Look in common evaluator directories
-        search_dirs = [
-            Path.cwd() / "evaluators",
-            Path.cwd() / "custom_evaluators",
-        ]
+        cwd = Path.cwd()
+        search_dirs = [cwd / "evaluators", cwd / "custom_evaluators"]
+
+        # Adding or removing an evaluator directory bumps its parent's mtime
+        signature = (cwd, *(_dir_mtime(search_dir) for search_dir in search_dirs))
+        if self._path_index is None or self._path_index_signature != signature:
+            index: dict[str, list[Path]] = {}
+            for search_dir in search_dirs:
+                if search_dir.exists():
+                    for item in search_dir.iterdir():
+                        if item.is_dir() and (item / "flow.flex.yaml").exists():
+                            index.setdefault(item.name.lower(), []).append(item)
+            self._path_index = index
+            self._path_index_signature = signature
+        return self._path_index
 
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                for item in search_dir.iterdir():
-                    if item.is_dir() and (item / "flow.flex.yaml").exists():
-                        paths.append(item)
-
-        return paths
+    def _find_evaluator_paths(self) -> list[Path]:
+        """Find all potential evaluator directories."""
+        return [path for paths in self._evaluator_index().values() for path in paths]
 
     def create(self, config: EvaluatorConfig) -> BaseEvaluator | None:
         """Create evaluator instance, trying both registry and flow approaches."""
@@ -220,7 +365,10 @@ class EnhancedEvaluatorRegistry:
         if evaluator is not None:
             return evaluator
 
-        # If not found in platform registry, try foundry evaluator
+        # If not found in platform registry, try foundry evaluator unless that
+        # lookup (and any failed module load) already happened above
+        if config.data_mapping:
+            return None
         return self._try_foundry_evaluator(config, evaluator_name)
 
     def _try_foundry_evaluator(
@@ -228,39 +376,25 @@ class EnhancedEvaluatorRegistry:
     ) -> BaseEvaluator | None:
         """Try to create a foundry-style evaluator."""
 
-        # Check cache first
-        cache_key = evaluator_name.lower()
-        if cache_key in self._flow_cache:
-            flow_config, evaluator_instance = self._flow_cache[cache_key]
-            return FlowEvaluatorWrapper(config, flow_config, evaluator_instance)
-
-        # Search for flow evaluator
-        for evaluator_path in self._find_evaluator_paths():
-            if evaluator_path.name.lower() == cache_key:
-                try:
-                    flow_config, evaluator_instance = self._load_flow_evaluator(evaluator_path)
-
-                    # Cache for future use
-                    self._flow_cache[cache_key] = (flow_config, evaluator_instance)
-
-                    return FlowEvaluatorWrapper(config, flow_config, evaluator_instance)
-
-                except Exception:
-                    # Continue searching if this evaluator failed to load
-                    continue
+        # Look the name up in the directory index; loads are cached per directory
+        for evaluator_path in self._evaluator_index().get(evaluator_name.lower(), ()):
+            try:
+                loaded = self._load_flow_evaluator(evaluator_path)
+            except Exception:
+                # Continue searching if this evaluator failed to load
+                continue
+            if loaded is not None:
+                flow_config, evaluator_instance = loaded
+                return FlowEvaluatorWrapper(config, flow_config, evaluator_instance)
 
         return None
 
-    def available(self) -> Iterable[str]:
-        """List all available evaluators (both platform and flow)."""
-        # Platform evaluators
-        available = list(self.base_registry.available())
-
-        # Flow evaluators
-        for evaluator_path in self._find_evaluator_paths():
-            available.append(evaluator_path.name)
-
-        return available
+    def available(self) -> KeysView[str]:
+        """List all available evaluators (both platform and flow), without duplicates."""
+        # Platform evaluators first, then flow evaluators; a dict keeps order and dedupes
+        available = dict.fromkeys(self.base_registry.available())
+        available.update(dict.fromkeys(path.name for path in self._find_evaluator_paths()))
+        return available.keys()
 
 
 # Create enhanced registry instance
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from ..logger import get_logger
 from ..models import DataModelRow
 from .base import BaseEvaluator, EvaluatorOutput
@@ -10,19 +12,27 @@ from .registry import register_evaluator
 log = get_logger(__name__)
 
 
+def _match(expected: Any, actual: Any) -> float:
+    """1.0 when both are None or equal as stripped, lowercased strings."""
+    if expected is None or actual is None:
+        return 1.0 if expected is actual else 0.0
+    # Convert to strings for comparison to handle mixed types
+    return 1.0 if str(expected).strip().lower() == str(actual).strip().lower() else 0.0
+
+
 @register_evaluator("equivalent")
 class EquivalentEvaluator(BaseEvaluator):
     """Compare ``data_output`` and ``expected_output`` for each row."""
 
     def evaluate(self, rows: list[DataModelRow]) -> EvaluatorOutput:
         """Evaluate each row individually for equivalence."""
-        per_row: dict[str, dict[str, float]] = {}
-        total_matches = 0
-
-        for row in rows:
-            row_result = self._evaluate_single_row(row)
-            per_row[row.id] = row_result
-            total_matches += row_result.get("match", 0.0)
+        matches = [_match(row.expected_output, row.data_output) for row in rows]
+        # Provide score alongside match for consistency with foundry evaluators
+        per_row: dict[str, dict[str, float]] = {
+            row.id: {"match": match, "score": match}
+            for row, match in zip(rows, matches, strict=True)
+        }
+        total_matches = sum(matches)
 
         # Calculate summary metrics
         accuracy = (total_matches / len(rows)) if rows else 0.0
@@ -40,20 +50,7 @@ class EquivalentEvaluator(BaseEvaluator):
 
     def _evaluate_single_row(self, row: DataModelRow) -> dict[str, float]:
         """Evaluate a single row for equivalence - row-by-row processing."""
-        expected = row.expected_output
-        actual = row.data_output
-
-        # Handle different data types consistently
-        if expected is None and actual is None:
-            match = 1.0
-        elif expected is None or actual is None:
-            match = 0.0
-        else:
-            # Convert to strings for comparison to handle mixed types
-            expected_str = str(expected).strip().lower()
-            actual_str = str(actual).strip().lower()
-            match = float(1.0 if expected_str == actual_str else 0.0)
-
+        match = _match(row.expected_output, row.data_output)
         return {
             "match": match,
             "score": match,  # Provide score for consistency with foundry evaluators
@@ -4,28 +4,60 @@ from __future__ import annotations
 
 import importlib.util
 import inspect
+import os
 import sys
 from collections.abc import Callable
 from pathlib import Path
 from types import ModuleType
-from typing import Any
+from typing import Any, ClassVar
 
 from ..constants import PROJECT_ROOT
 from ..logger import get_logger
-from ..models import DataModelRow, ModuleExecutableConfig
+from ..models import DataModelRow, DataModelRowError, ModuleExecutableConfig
 from .base import BaseExecutable
 
 log = get_logger(__name__)
 
+# Module, resolved target and its row parameter name for one processor.
+_LoadedProcessor = tuple[ModuleType, Callable[..., Any], str | None]
+
 
 class ModuleExecutable(BaseExecutable):
-    """Load a module from disk and execute a named callable."""
+    """Load a module from disk and execute a named callable.
+
+    An executable is built per row, but the module is executed and its target
+    resolved once per file and processor: later rows reuse them until the
+    file's mtime or size changes. Module globals and class-based processor
+    instances are therefore shared between rows.
+    """
+
+    # (module path, processor) -> ((mtime_ns, size), loaded processor)
+    _loaded: ClassVar[dict[tuple[str, str], tuple[tuple[int, int], _LoadedProcessor]]] = {}
+    # (cwd, config path, processor) -> module file it resolved to
+    _resolved_paths: ClassVar[dict[tuple[str, str, str], Path]] = {}
+    # python_path directory -> (mtime_ns, module files) as of its last listing
+    _discovered_paths: ClassVar[dict[str, tuple[int, list[Path]]]] = {}
+    # discovered module file -> (mtime_ns, size) it was last imported at
+    _imported_files: ClassVar[dict[str, tuple[int, int]]] = {}
 
     def __init__(self, row: DataModelRow, config: ModuleExecutableConfig) -> None:
         super().__init__(row, config)
         self._original_sys_path = None
-        self._module = self._load_module(config)
-        self._target = self._resolve_target(self._module, config.processor)
+        # Setup custom Python paths if specified (keep them for entire execution)
+        self._setup_python_paths(config)
+
+        module_path, st = self._resolve_module_path(config)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = (str(module_path), config.processor)
+        cached = self._loaded.get(key)
+        if cached is not None and cached[0] == stamp:
+            loaded = cached[1]
+        else:
+            module = self._load_module(module_path)
+            target = self._resolve_target(module, config.processor)
+            loaded = (module, target, self._find_row_parameter(target))
+            self._loaded[key] = (stamp, loaded)
+        self._module, self._target, self._row_parameter = loaded
 
     def execute(self, **kwargs) -> DataModelRow:
         callable_obj = self._target
@@ -36,8 +68,6 @@ class ModuleExecutable(BaseExecutable):
             self._row.data_output = result
             return self._row
         except Exception as exc:  # pragma: no cover - defensive
-            from ..models import DataModelRowError
-
             log.exception("Executable failed", exc_info=exc)
             self._row.error = DataModelRowError(message=str(exc), code=500)
             return self._row
@@ -46,10 +76,20 @@ class ModuleExecutable(BaseExecutable):
             self._cleanup_python_paths()
 
     # ------------------------------------------------------------------
-    def _load_module(self, config: ModuleExecutableConfig) -> ModuleType:
-        # Setup custom Python paths if specified (keep them for entire execution)
-        self._setup_python_paths(config)
-
+    def _resolve_module_path(self, config: ModuleExecutableConfig) -> tuple[Path, os.stat_result]:
+        """Module file for ``config`` and its stat, probing candidates only on a miss."""
+        key = (os.getcwd(), config.path, config.processor)
+        module_path = self._resolved_paths.get(key)
+        if module_path is not None:
+            try:
+                return module_path, module_path.stat()
+            except OSError:
+                del self._resolved_paths[key]  # Moved since it was resolved
+        module_path = self._find_module_path(config)
+        self._resolved_paths[key] = module_path
+        return module_path, module_path.stat()
+
+    def _find_module_path(self, config: ModuleExecutableConfig) -> Path:
         raw_path = Path(config.path)
         if not raw_path.is_absolute():
             # Try current working directory first, then project root
@@ -75,7 +115,9 @@ class ModuleExecutable(BaseExecutable):
             raw_path = raw_path / f"{config.processor}.py"
         if not raw_path.exists():
             raise FileNotFoundError(f"Executable module not found: {raw_path}")
+        return raw_path
 
+    def _load_module(self, raw_path: Path) -> ModuleType:
         spec = importlib.util.spec_from_file_location(raw_path.stem, raw_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Unable to load module from {raw_path}")
@@ -96,41 +138,75 @@ class ModuleExecutable(BaseExecutable):
             raise TypeError(f"Attribute '{attr}' in module '{module.__name__}' is not callable")
         return target
 
+    @staticmethod
+    def _find_row_parameter(target: Callable[..., Any]) -> str | None:
+        """Name of the parameter ``target`` takes the row through, if any.
+
+        Resolved once alongside the target so invoking it needs no reflection.
+        """
+        parameters = inspect.signature(target).parameters
+        if "row" in parameters:
+            return "row"
+        if "data_model_row" in parameters:
+            return "data_model_row"
+        return None
+
     def _invoke_callable(self, target: Callable[..., Any], kwargs: dict[str, Any]) -> Any:
-        signature = inspect.signature(target)
-        bound = {}
-        if "row" in signature.parameters:
-            bound["row"] = self._row
-        elif "data_model_row" in signature.parameters:
-            bound["data_model_row"] = self._row
-        else:
-            # If no row parameter, try passing individual fields and the row via kwargs
-            bound.update(kwargs)
-            bound["row"] = self._row
-            bound["data_model_row"] = self._row
+        if self._row_parameter is not None:
+            return target(**{self._row_parameter: self._row})
+        # If no row parameter, try passing individual fields and the row via kwargs
+        bound = dict(kwargs)
+        bound["row"] = self._row
+        bound["data_model_row"] = self._row
         return target(**bound)
 
     def _discover_and_import_evaluators(self, path: Path) -> None:
-        """Discover and import Python modules in the given path to register evaluators."""
-        try:
-            # Look for Python files in the directory
-            for py_file in path.glob("*.py"):
-                if py_file.name.startswith("__"):
-                    continue  # Skip __init__.py, __pycache__, etc.
+        """Discover and import Python modules in the given path to register evaluators.
 
+        Registration is process-wide, so a module is only imported again once its
+        file's (mtime_ns, size) stamp changes. The directory listing is reused
+        until the directory's own mtime changes (a file is added or removed).
+        """
+        try:
+            path_key = str(path)
+            mtime = path.stat().st_mtime_ns
+            listed = self._discovered_paths.get(path_key)
+            if listed is None or listed[0] != mtime:
+                # Look for Python files in the directory, skipping __init__.py etc.
+                py_files = [f for f in path.glob("*.py") if not f.name.startswith("__")]
+                listed = self._discovered_paths[path_key] = (mtime, py_files)
+
+            for py_file in listed[1]:
                 module_name = py_file.stem
+                try:
+                    st = py_file.stat()
+                except OSError:
+                    continue  # Removed since the directory was listed
+                stamp = (st.st_mtime_ns, st.st_size)
+                file_key = str(py_file)
+                previous = self._imported_files.get(file_key)
+                if previous == stamp:
+                    continue  # Unchanged since it was last imported
+                self._imported_files[file_key] = stamp
+                loaded = sys.modules.get(module_name)
+                if (
+                    previous is None
+                    and loaded is not None
+                    and getattr(loaded, "__file__", None) == file_key
+                ):
+                    continue  # Already imported through sys.path
                 try:
                     # Import the module to trigger evaluator registration
                     spec = importlib.util.spec_from_file_location(module_name, py_file)
                     if spec is not None and spec.loader is not None:
                         module = importlib.util.module_from_spec(spec)
                         spec.loader.exec_module(module)
-                        log.debug(f"Imported evaluator module: {module_name} from {py_file}")
+                        log.debug("Imported evaluator module: %s from %s", module_name, py_file)
                 except Exception as e:
-                    log.debug(f"Failed to import {module_name} from {py_file}: {e}")
+                    log.debug("Failed to import %s from %s: %s", module_name, py_file, e)
 
         except Exception as e:
-            log.debug(f"Error discovering evaluators in {path}: {e}")
+            log.debug("Error discovering evaluators in %s: %s", path, e)
 
     def _setup_python_paths(self, config: ModuleExecutableConfig) -> None:
         """Add custom directories to sys.path for module loading and discover evaluators."""
@@ -156,7 +232,7 @@ class ModuleExecutable(BaseExecutable):
             path_str_resolved = str(path)
             if path.exists() and path.is_dir() and path_str_resolved not in sys.path:
                 sys.path.insert(0, path_str_resolved)
-                log.debug(f"Added to Python path: {path_str_resolved}")
+                log.debug("Added to Python path: %s", path_str_resolved)
 
                 # Auto-discover and import Python modules in this path
                 self._discover_and_import_evaluators(path)
@@ -63,21 +63,28 @@ class ExperimentLogger:
         self._logger.addHandler(handler)
 
     # Delegating helpers -------------------------------------------------
+    # Each helper checks the level first so that disabled messages cost neither
+    # the markup wrapping nor, for the banner, a console render.
     def banner(self, message: str) -> None:
         """Render a decorative banner line for key events."""
-        self.console.rule(f"[banner]{message}[/]")
+        if self._logger.isEnabledFor(logging.INFO):
+            self.console.rule(f"[banner]{message}[/]")
 
     def debug(self, message: str, *args, **kwargs) -> None:
-        self._logger.debug(f"[debug]{message}[/]", *args, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"[debug]{message}[/]", *args, **kwargs)
 
     def info(self, message: str, *args, **kwargs) -> None:
-        self._logger.info(f"[info]{message}[/]", *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(f"[info]{message}[/]", *args, **kwargs)
 
     def success(self, message: str, *args, **kwargs) -> None:
-        self._logger.log(SUCCESS_LEVEL, f"[success]{message}[/]", *args, **kwargs)
+        if self._logger.isEnabledFor(SUCCESS_LEVEL):
+            self._logger.log(SUCCESS_LEVEL, f"[success]{message}[/]", *args, **kwargs)
 
     def warning(self, message: str, *args, **kwargs) -> None:
-        self._logger.warning(f"[warning]{message}[/]", *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(f"[warning]{message}[/]", *args, **kwargs)
 
     def error(self, message: str, *args, **kwargs) -> None:
         self._logger.error(f"[error]{message}[/]", *args, **kwargs)
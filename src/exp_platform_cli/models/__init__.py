@@ -11,6 +11,7 @@ from .data_model import (
     DataModelRowError,
     DatasetModel,
     EvaluationResult,
+    RowColumns,
     SemanticKernelTrace,
     ToolCallDetails,
     ToolCallStatus,
@@ -33,6 +34,7 @@ __all__ = [
     "DataModelRowError",
     "DatasetModel",
     "EvaluationResult",
+    "RowColumns",
     "DataType",
     "ExecutableConfig",
     "ExecutableType",
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import sys
+from collections import Counter
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 from .data_types import DataType
 
+# Tool, function and agent names repeat across every row of a dataset; interning
+# them shares one string per name and lets set/dict lookups match by identity.
+_InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
 
 class AgentFramework(str, Enum):
     """Supported agent frameworks."""
@@ -28,6 +35,10 @@ class ToolCallStatus(str, Enum):
     TIMEOUT = "timeout"
     CANCELLED = "cancelled"
 
+    # Hash like the plain value so tallies keyed by member can also be read
+    # with the raw string, matching ``ToolCallStatus.SUCCESS == "success"``.
+    __hash__ = str.__hash__
+
 
 class AgentRole(str, Enum):
     """Role of an agent in a conversation."""
@@ -38,6 +49,8 @@ class AgentRole(str, Enum):
     TOOL = "tool"
     FUNCTION = "function"
 
+    __hash__ = str.__hash__
+
 
 class DataModelRowError(BaseModel):
     """Describe a structured error encountered while processing a row."""
@@ -49,8 +62,8 @@ class DataModelRowError(BaseModel):
 class ToolCallDetails(BaseModel):
     """Details of a tool/function call made by an agent."""
 
-    tool_name: str
-    function_name: str
+    tool_name: _InternedStr
+    function_name: _InternedStr
     arguments: dict[str, Any] = Field(default_factory=dict)
     result: Any = None
     status: ToolCallStatus = ToolCallStatus.SUCCESS
@@ -65,7 +78,7 @@ class AgentMessage(BaseModel):
     role: AgentRole
     content: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
-    agent_id: str | None = None
+    agent_id: _InternedStr | None = None
     tool_calls: list[ToolCallDetails] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
@@ -116,6 +129,78 @@ class EvaluationResult(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+def _tally_statuses(statuses: tuple[ToolCallStatus, ...]) -> dict[ToolCallStatus, int]:
+    """Count every status in one pass; every member is always present."""
+    counts = dict.fromkeys(ToolCallStatus, 0)
+    for status in statuses:
+        counts[status] += 1
+    return counts
+
+
+class RowColumns:
+    """Column-wise view of a row's tool calls and conversation messages.
+
+    Each column, and the status and role tallies several metrics start from, is
+    built in one pass on first access, so a metric pays only for the columns it
+    reads. The view reflects the row as it was when a column was first read.
+    """
+
+    def __init__(self, row: DataModelRow) -> None:
+        self.row = row
+
+    @classmethod
+    def from_row(cls, row: DataModelRow) -> RowColumns:
+        return cls(row)
+
+    @cached_property
+    def tool_statuses(self) -> tuple[ToolCallStatus, ...]:
+        return tuple(call.status for call in self.row.tool_calls)
+
+    @cached_property
+    def tool_status_counts(self) -> dict[ToolCallStatus, int]:
+        return _tally_statuses(self.tool_statuses)
+
+    @cached_property
+    def tool_names(self) -> tuple[str, ...]:
+        return tuple(call.tool_name for call in self.row.tool_calls)
+
+    @cached_property
+    def function_names(self) -> tuple[str, ...]:
+        return tuple(call.function_name for call in self.row.tool_calls)
+
+    @cached_property
+    def tool_times_ms(self) -> tuple[float | None, ...]:
+        return tuple(call.execution_time_ms for call in self.row.tool_calls)
+
+    @cached_property
+    def message_roles(self) -> tuple[AgentRole, ...]:
+        return tuple(msg.role for msg in self.row.conversation_history)
+
+    @cached_property
+    def message_role_counts(self) -> Counter[AgentRole]:
+        return Counter(self.message_roles)
+
+    @cached_property
+    def message_agent_ids(self) -> tuple[str | None, ...]:
+        return tuple(msg.agent_id for msg in self.row.conversation_history)
+
+    @cached_property
+    def unique_agent_ids(self) -> frozenset[str]:
+        return frozenset(filter(None, self.message_agent_ids))
+
+    @cached_property
+    def message_contents(self) -> tuple[str, ...]:
+        return tuple(msg.content for msg in self.row.conversation_history)
+
+    @cached_property
+    def message_lengths(self) -> tuple[int, ...]:
+        return tuple(map(len, self.message_contents))
+
+    @cached_property
+    def message_has_tools(self) -> tuple[bool, ...]:
+        return tuple(bool(msg.tool_calls) for msg in self.row.conversation_history)
+
+
 class DataModelRow(BaseModel):
     """A single piece of input data alongside outputs and metadata."""
 
@@ -131,6 +216,16 @@ class DataModelRow(BaseModel):
     conversation_history: list[AgentMessage] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    @property
+    def columns(self) -> RowColumns:
+        """Tool call and message attributes gathered into columns.
+
+        Each access returns a new view whose columns are built lazily, so an
+        evaluator takes one view per row per :meth:`evaluate` call and builds
+        only the columns it reads, always from the row's current contents.
+        """
+        return RowColumns.from_row(self)
+
 
 class DataModel(BaseModel):
     """Container for all rows tied to a specific dataset."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Iterable
 from uuid import uuid4
 
@@ -96,9 +97,9 @@ class Orchestrator:
         # Load and validate configuration
         try:
             cfg = ConfigLoader.load_config(config_path)
-            log.info(f"🔧 Configuration loaded: {cfg.describe()}")
+            log.info("🔧 Configuration loaded: %s", cfg.describe())
         except Exception as e:
-            log.error(f"Failed to load configuration from {config_path}: {e}")
+            log.error("Failed to load configuration from %s: %s", config_path, e)
             raise
 
         # Load dataset with retry logic
@@ -111,27 +112,29 @@ class Orchestrator:
         for attempt in range(max_dataset_retries):
             try:
                 log.info(
-                    f"📊 Loading dataset {cfg.dataset.name}:{cfg.dataset.version} (attempt {attempt + 1}/{max_dataset_retries})"
+                    "📊 Loading dataset %s:%s (attempt %s/%s)",
+                    cfg.dataset.name,
+                    cfg.dataset.version,
+                    attempt + 1,
+                    max_dataset_retries,
                 )
                 df = self._dataset_service.load_dataframe(
                     cfg.dataset.name,
                     cfg.dataset.version,
                 )
-                log.success(f"✅ Dataset loaded successfully: {len(df)} rows")
+                log.success("✅ Dataset loaded successfully: %s rows", len(df))
                 break
 
             except Exception as e:
                 last_dataset_error = e
-                log.warning(f"Dataset load attempt {attempt + 1} failed: {e}")
+                log.warning("Dataset load attempt %s failed: %s", attempt + 1, e)
                 if attempt < max_dataset_retries - 1:
-                    log.info(f"Retrying dataset load in {dataset_retry_delay} seconds...")
-                    import time
-
+                    log.info("Retrying dataset load in %s seconds...", dataset_retry_delay)
                     time.sleep(dataset_retry_delay)
                     dataset_retry_delay *= 2  # Exponential backoff
 
         if df is None:
-            log.error(f"Failed to load dataset after {max_dataset_retries} attempts")
+            log.error("Failed to load dataset after %s attempts", max_dataset_retries)
             raise RuntimeError(f"Dataset loading failed: {last_dataset_error}")
 
         # Convert dataframe to data model
@@ -142,9 +145,9 @@ class Orchestrator:
                 dataset_name=cfg.dataset.name,
                 dataset_version=cfg.dataset.version,
             )
-            log.info(f"📋 Data model created: {len(data_model.rows)} rows prepared for execution")
+            log.info("📋 Data model created: %s rows prepared for execution", len(data_model.rows))
         except Exception as e:
-            log.error(f"Failed to create data model from dataset: {e}")
+            log.error("Failed to create data model from dataset: %s", e)
             raise
 
         experiment_id = f"exp{uuid4().hex[:12]}"
@@ -158,20 +161,20 @@ class Orchestrator:
         # Execute rows with comprehensive error handling and progress tracking
         try:
             executable_cls = self._resolve_executable(cfg)
-            log.info(f"🔧 Using executable: {executable_cls.__name__}")
+            log.info("🔧 Using executable: %s", executable_cls.__name__)
         except Exception as e:
-            log.error(f"Failed to resolve executable: {e}")
+            log.error("Failed to resolve executable: %s", e)
             raise
 
         successful_executions = 0
         failed_executions = 0
         total_rows = len(data_model.rows)
 
-        log.info(f"⚡ Executing {total_rows} rows...")
+        log.info("⚡ Executing %s rows...", total_rows)
 
         for i, row in enumerate(data_model.rows, 1):
             try:
-                log.debug(f"Executing row {i}/{total_rows}: {row.id}")
+                log.debug("Executing row %s/%s: %s", i, total_rows, row.id)
                 executable = executable_cls(row, cfg.executable)
 
                 # Execute with timeout and retry logic for critical failures
@@ -182,27 +185,32 @@ class Orchestrator:
 
                     if row.error is None:
                         successful_executions += 1
-                        log.debug(f"✅ Row {row.id} executed successfully")
+                        log.debug("✅ Row %s executed successfully", row.id)
                     else:
                         failed_executions += 1
-                        log.warning(f"⚠️  Row {row.id} completed with error: {row.error}")
+                        log.warning("⚠️  Row %s completed with error: %s", row.id, row.error)
 
                 except Exception as exec_error:
                     failed_executions += 1
                     error_msg = f"Execution failed: {str(exec_error)}"
-                    log.error(f"💥 Row {row.id} execution failed: {error_msg}")
+                    log.error("💥 Row %s execution failed: %s", row.id, error_msg)
                     row.error = DataModelRowError(message=error_msg, code=500)
 
                 # Progress reporting every 10% or at significant milestones
                 if i % max(1, total_rows // 10) == 0 or i == total_rows:
                     progress_pct = (i / total_rows) * 100
                     log.info(
-                        f"📊 Progress: {i}/{total_rows} rows ({progress_pct:.1f}%) - ✅ {successful_executions} success, ❌ {failed_executions} failed"
+                        "📊 Progress: %s/%s rows (%.1f%%) - ✅ %s success, ❌ %s failed",
+                        i,
+                        total_rows,
+                        progress_pct,
+                        successful_executions,
+                        failed_executions,
                     )
 
             except Exception as exc:
                 failed_executions += 1
-                log.exception(f"💥 Critical error executing row {row.id}", exc_info=exc)
+                log.exception("💥 Critical error executing row %s", row.id, exc_info=exc)
                 row.error = DataModelRowError(
                     message=f"Critical execution error: {str(exc)}", code=500
                 )
@@ -210,11 +218,14 @@ class Orchestrator:
         # Execution summary
         success_rate = (successful_executions / total_rows) * 100 if total_rows > 0 else 0
         log.info(
-            f"📈 Execution Summary: {successful_executions}/{total_rows} successful ({success_rate:.1f}%)"
+            "📈 Execution Summary: %s/%s successful (%.1f%%)",
+            successful_executions,
+            total_rows,
+            success_rate,
         )
 
         if failed_executions > 0:
-            log.warning(f"⚠️  {failed_executions} rows failed execution")
+            log.warning("⚠️  %s rows failed execution", failed_executions)
             if failed_executions == total_rows:
                 log.error("❌ All rows failed execution - experiment may have critical issues")
             elif failed_executions > total_rows * 0.5:
@@ -230,9 +241,9 @@ class Orchestrator:
                 rows=data_model.rows,
                 config=cfg,
             )
-            log.success(f"✅ Execution results stored in {artifact_dir}")
+            log.success("✅ Execution results stored in %s", artifact_dir)
         except Exception as e:
-            log.error(f"Failed to store execution results: {e}")
+            log.error("Failed to store execution results: %s", e)
             raise RuntimeError(f"Result storage failed: {e}")
 
         # Run evaluations with comprehensive error handling
@@ -254,16 +265,13 @@ class Orchestrator:
                         log.info("☁️  Initialized cloud evaluation service")
                     except Exception as e:
                         log.warning(
-                            f"Cloud evaluation not available ({e}), falling back to local mode"
+                            "Cloud evaluation not available (%s), falling back to local mode", e
                         )
                         self._evaluation_service = LocalEvaluationService()
 
             # Run evaluation with progress tracking
-            log.info(f"📊 Starting evaluation with {len(cfg.evaluators)} evaluators...")
-            evaluator_names = [e.name for e in cfg.evaluators]
-            log.info(f"📈 Evaluators: {', '.join(evaluator_names)}")
-
-            import time
+            log.info("📊 Starting evaluation with %s evaluators...", len(cfg.evaluators))
+            log.info("📈 Evaluators: %s", ", ".join(e.name for e in cfg.evaluators))
 
             eval_start_time = time.time()
 
@@ -278,13 +286,13 @@ class Orchestrator:
             )
 
             eval_time = time.time() - eval_start_time
-            log.success(f"✅ Evaluation completed successfully in {eval_time:.2f} seconds")
+            log.success("✅ Evaluation completed successfully in %.2f seconds", eval_time)
 
         except Exception as e:
-            log.error(f"💥 Evaluation failed: {e}")
+            log.error("💥 Evaluation failed: %s", e)
             log.warning("⚠️  Experiment execution completed but evaluation failed")
             # Don't fail the entire experiment if evaluation fails
             log.info("💡 Execution results are still available for manual analysis")
 
-        log.success(f"🎉 Experiment {experiment_id} completed successfully!")
+        log.success("🎉 Experiment %s completed successfully!", experiment_id)
         return experiment_id
@@ -1,10 +1,26 @@
 """Service layer exports."""
 
-from .cloud_evaluation import CloudEvaluationService
-from .config_loader import ConfigLoader
-from .dataset_service import DatasetService
-from .evaluation_base import EvaluationService
-from .local_evaluation import LocalEvaluationService
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cloud_evaluation import CloudEvaluationService
+    from .config_loader import ConfigLoader
+    from .dataset_service import DatasetService
+    from .evaluation_base import EvaluationService
+    from .local_evaluation import LocalEvaluationService
+
+# Resolved on first access so that importing ``services.config_loader`` (as the
+# CLI does) does not drag in pandas via ``dataset_service`` and the evaluators.
+_LAZY_EXPORTS: dict[str, str] = {
+    "ConfigLoader": ".config_loader",
+    "DatasetService": ".dataset_service",
+    "EvaluationService": ".evaluation_base",
+    "LocalEvaluationService": ".local_evaluation",
+    "CloudEvaluationService": ".cloud_evaluation",
+}
 
 __all__ = [
     "ConfigLoader",
@@ -13,3 +29,16 @@ __all__ = [
     "LocalEvaluationService",
     "CloudEvaluationService",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
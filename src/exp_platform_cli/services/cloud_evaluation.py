@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from collections.abc import Iterable, Sequence
 from pathlib import Path
@@ -288,8 +289,6 @@ class CloudEvaluationService(EvaluationService):
             ]
         }
 
-        import json
-
         metadata_path = output_dir / "cloud_evaluation_metadata.json"
         metadata_path.write_text(
             json.dumps(cloud_metadata, indent=2),
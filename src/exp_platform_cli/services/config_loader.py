@@ -2,30 +2,223 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import logging
+import os
+import pickle
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
+import pydantic
 import yaml
+from pydantic import TypeAdapter
 
+from .. import models
+from .._version import __version__
+from ..constants import cache_root
 from ..models import ExperimentConfig
+from ..utils import atomic_write_bytes
 
 log = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+    log.warning("PyYAML is not linked against libyaml; config parsing will be slow")
+
+# (mtime_ns, size) of the file a cached config was parsed from.
+_FileStamp = tuple[int, int]
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    """Fingerprint of everything a pickled config depends on.
+
+    Covers the package and pydantic versions plus the stamp of every module in
+    :mod:`..models`, so editing the schema invalidates cached entries.
+    """
+    digest = hashlib.sha256(f"{__version__}:{pydantic.VERSION}".encode())
+    models_dir = Path(models.__file__).parent
+    for source in sorted(models_dir.glob("*.py")):
+        st = source.stat()
+        digest.update(f"{source.name}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _owned_by_current_user(st: os.stat_result) -> bool:
+    """Whether ``st`` belongs to this user; always true without POSIX ownership."""
+    getuid = getattr(os, "getuid", None)
+    return getuid is None or st.st_uid == getuid()
+
+
+def _cache_dir() -> Path | None:
+    """Directory holding pickled configs, shared across CLI invocations.
+
+    The directory is created private to the current user, and tightened to
+    ``0o700`` if an earlier run left it open under a permissive umask. Returns
+    ``None`` (disabling the disk cache) when it belongs to another user, since
+    unpickling a file someone else planted would run their code.
+    """
+    path = cache_root() / "configs"
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = path.stat()
+    except OSError as exc:
+        log.debug("Config cache %s is unavailable: %s", path, exc)
+        return None
+    if not _owned_by_current_user(st):
+        log.warning("Not using config cache %s: owned by another user", path)
+        return None
+    if os.name == "posix" and st.st_mode & 0o077:
+        try:
+            path.chmod(0o700)
+        except OSError:
+            log.warning("Not using config cache %s: not private to the current user", path)
+            return None
+    return path
+
 
 class ConfigLoader:
-    """Load ``ExperimentConfig`` instances from YAML files."""
+    """Load ``ExperimentConfig`` instances from YAML files.
 
-    @staticmethod
-    def load_config(path: str | Path) -> ExperimentConfig:
+    Parsed configs are cached in-process and pickled to disk, keyed by the
+    resolved path and invalidated whenever the file's mtime or size changes or
+    the schema fingerprint (package, pydantic and model sources) moves. When a
+    file does need reading, its bytes are hashed so copies, renames and touched
+    but unchanged files reuse an earlier parse within the process. Both caches
+    keep only the most recently used entries.
+    """
+
+    _max_memory_entries = 128
+    _max_disk_entries = 256
+    _memory_cache: OrderedDict[str, tuple[_FileStamp, ExperimentConfig]] = OrderedDict()
+    _content_cache: OrderedDict[str, ExperimentConfig] = OrderedDict()
+    _adapter: TypeAdapter[ExperimentConfig] | None = None
+
+    @classmethod
+    def _get_adapter(cls) -> TypeAdapter[ExperimentConfig]:
+        if cls._adapter is None:
+            cls._adapter = TypeAdapter(ExperimentConfig)
+        return cls._adapter
+
+    @classmethod
+    def load_config(cls, path: str | Path) -> ExperimentConfig:
         path = Path(path)
         log.info("Loading experiment configuration from %s", path)
-        with path.open("r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle)
-        log.debug("Parsed experiment configuration: %s", payload)
-        config = ExperimentConfig(**payload)
+
+        resolved = path.resolve()
+        st = resolved.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cache_key = str(resolved)
+
+        cached = cls._memory_cache.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            config = cached[1]
+            cls._memory_cache.move_to_end(cache_key)
+        else:
+            config = cls._read_disk_cache(cache_key, stamp)
+            if config is None:
+                config = cls._load_content(resolved)
+                cls._write_disk_cache(cache_key, stamp, config)
+            cls._remember(cls._memory_cache, cache_key, (stamp, config))
+
         log.info(
             "Configured dataset %s:%s",
             config.dataset.name,
             config.dataset.version,
         )
+        # Hand out a copy so callers cannot mutate the cached instance.
+        return config.model_copy(deep=True)
+
+    @classmethod
+    def _load_content(cls, path: Path) -> ExperimentConfig:
+        data = path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        config = cls._content_cache.get(digest)
+        if config is None:
+            config = cls._parse(data, path)
+            cls._remember(cls._content_cache, digest, config)
+        else:
+            cls._content_cache.move_to_end(digest)
+            log.debug("Reusing parsed configuration with identical content for %s", path)
         return config
+
+    @classmethod
+    def _parse(cls, data: bytes, path: Path) -> ExperimentConfig:
+        stream = io.BytesIO(data)
+        stream.name = str(path)  # reported in YAML error marks
+        payload = yaml.load(stream, Loader=_YamlLoader)
+        log.debug("Parsed experiment configuration: %s", payload)
+        return cls._get_adapter().validate_python(payload)
+
+    @classmethod
+    def _remember(cls, cache: OrderedDict, key: str, value: object) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > cls._max_memory_entries:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _disk_cache_path(cache_key: str) -> Path | None:
+        cache_dir = _cache_dir()
+        if cache_dir is None:
+            return None
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        return cache_dir / f"{digest}.pkl"
+
+    @classmethod
+    def _read_disk_cache(cls, cache_key: str, stamp: _FileStamp) -> ExperimentConfig | None:
+        cache_path = cls._disk_cache_path(cache_key)
+        if cache_path is None:
+            return None
+        try:
+            with cache_path.open("rb") as handle:
+                # Entries written while the directory was still open to others
+                if not _owned_by_current_user(os.fstat(handle.fileno())):
+                    return None
+                cached_key, cached_stamp, config = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # corrupt or incompatible entry; fall back to parsing
+            log.debug("Ignoring unreadable config cache for %s: %s", cache_key, exc)
+            return None
+
+        if cached_key != cache_key or cached_stamp != (stamp, _schema_fingerprint()):
+            return None
+        try:
+            os.utime(cache_path)  # mark as recently used for pruning
+        except OSError:
+            pass
+        log.debug("Loaded cached experiment configuration for %s", cache_key)
+        return config
+
+    @classmethod
+    def _write_disk_cache(cls, cache_key: str, stamp: _FileStamp, config: ExperimentConfig) -> None:
+        cache_path = cls._disk_cache_path(cache_key)
+        if cache_path is None:
+            return
+        entry = (cache_key, (stamp, _schema_fingerprint()), config)
+        try:
+            atomic_write_bytes(cache_path, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+            cls._prune_disk_cache(cache_path.parent)
+        except OSError as exc:
+            log.debug("Could not write config cache %s: %s", cache_path, exc)
+
+    @classmethod
+    def _prune_disk_cache(cls, cache_dir: Path) -> None:
+        """Delete the least recently used entries beyond ``_max_disk_entries``."""
+        entries = []
+        for entry_path in cache_dir.glob("*.pkl"):
+            try:
+                entries.append((entry_path.stat().st_mtime_ns, entry_path))
+            except OSError:
+                continue  # removed concurrently
+        if len(entries) <= cls._max_disk_entries:
+            return
+        entries.sort()
+        for _, entry_path in entries[: -cls._max_disk_entries]:
+            entry_path.unlink(missing_ok=True)
@@ -17,6 +17,7 @@ from ..models import (
     EvaluationResult,
     EvaluatorConfig,
     ExperimentConfig,
+    RowColumns,
 )
 from ..utils import ensure_directories
 from .evaluation_base import EvaluationService
@@ -59,6 +60,10 @@ class LocalEvaluationService(EvaluationService):
         rows_list = list(rows)
 
         evaluator_instances = load_evaluators(evaluators)
+        # One lazily built column view per row, shared by the whole evaluator suite
+        features_cache: dict[str, RowColumns] = {}
+        for evaluator in evaluator_instances:
+            evaluator.features_cache = features_cache
         metrics_summary: dict[str, dict[str, float]] = {}
         evaluation_errors: dict[str, dict[str, Any]] = {}
         non_numeric_metrics: dict[str, dict[str, Any]] = {}
@@ -91,18 +96,26 @@ class LocalEvaluationService(EvaluationService):
                 metrics_summary[result.name] = summary_metrics
 
                 # Process per-row metrics with comprehensive error handling
+                metric_keys: dict[str, str] = {}
                 for row in rows_list:
                     metrics = result.per_row.get(row.id)
                     if not metrics:
                         continue
 
                     for metric_name, metric_value in metrics.items():
-                        key = f"{result.name}:{metric_name}"
-
-                        # Convert to numeric with detailed error tracking
-                        numeric_value, error = self._convert_to_numeric(
-                            metric_value, f"{evaluator_name}.{row.id}.{metric_name}"
-                        )
+                        # Every row repeats the same metric names, so format each key once
+                        key = metric_keys.get(metric_name)
+                        if key is None:
+                            key = metric_keys[metric_name] = f"{result.name}:{metric_name}"
+
+                        # Plain numbers convert without error, so skip building their context
+                        if type(metric_value) is float or type(metric_value) is int:
+                            numeric_value, error = float(metric_value), None
+                        else:
+                            # Convert to numeric with detailed error tracking
+                            numeric_value, error = self._convert_to_numeric(
+                                metric_value, f"{evaluator_name}.{row.id}.{metric_name}"
+                            )
 
                         if error:
                             # Track conversion errors
@@ -115,7 +128,10 @@ class LocalEvaluationService(EvaluationService):
                             ev_bucket = mm.setdefault(result.name, {})
                             ev_bucket[metric_name] = metric_value
                             logger.debug(
-                                f"Stored non-numeric metric {key}: {metric_value} ({type(metric_value).__name__})"
+                                "Stored non-numeric metric %s: %s (%s)",
+                                key,
+                                metric_value,
+                                type(metric_value).__name__,
                             )
                         else:
                             # Store numeric metric as evaluation result
@@ -124,13 +140,13 @@ class LocalEvaluationService(EvaluationService):
                                 metric_value=numeric_value,
                                 metadata={"evaluator": result.name},
                             )
-                            logger.debug(f"Stored numeric metric {key}: {numeric_value}")
+                            logger.debug("Stored numeric metric %s: %s", key, numeric_value)
 
             except Exception as e:
                 # Catch and log evaluator execution failures
                 error_msg = f"Evaluator '{evaluator_name}' failed: {str(e)}"
                 logger.error(error_msg)
-                logger.debug(f"Full traceback for {evaluator_name}: {traceback.format_exc()}")
+                logger.debug("Full traceback for %s", evaluator_name, exc_info=True)
 
                 evaluation_errors.setdefault(evaluator_name, {})["execution_error"] = {
                     "error": str(e),
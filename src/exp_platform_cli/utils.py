@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 
 from .constants import DATASET_ROOT, EXPERIMENT_ROOT, refresh_paths
@@ -12,3 +14,20 @@ def ensure_directories() -> None:
     refresh_paths()
     for path in (DATASET_ROOT, EXPERIMENT_ROOT):
         Path(path).mkdir(parents=True, exist_ok=True)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a sibling temp file and a rename.
+
+    Concurrent readers (e.g. parallel run-directory workers) see either the old
+    file or the complete new one, never a partial write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
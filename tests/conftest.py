@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the CLI's on-disk caches out of the developer's home directory."""
+    monkeypatch.setenv("EXP_CLI_CACHE_DIR", str(tmp_path / "cache"))
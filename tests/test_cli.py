@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
-from exp_platform_cli.cli import run_experiment_with_resilience
+import pytest
+from exp_platform_cli import __version__
+from exp_platform_cli.cli import arun_experiment_with_resilience, run_experiment_with_resilience
+from exp_platform_cli.entrypoint import main
 
 
 def _write_config(path: Path, dataset_name: str, version: str) -> None:
@@ -46,6 +50,22 @@ def test_run_dry_run(tmp_path: Path, monkeypatch) -> None:
     run_experiment_with_resilience(config_path, dry_run=True)
 
 
+def test_run_dry_run_uses_preloaded_config(tmp_path: Path, monkeypatch) -> None:
+    from exp_platform_cli.cli import load_and_validate_config
+    from exp_platform_cli.services.config_loader import ConfigLoader
+
+    monkeypatch.setenv("EXP_CLI_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, dataset_name="sample", version="0.1")
+    config = load_and_validate_config(config_path)
+
+    config_path.unlink()
+    monkeypatch.setattr(ConfigLoader, "load_config", pytest.fail)
+    assert run_experiment_with_resilience(config_path, dry_run=True, preloaded_config=config) == (
+        "dry-run"
+    )
+
+
 def test_run_executes_pipeline(tmp_path: Path, monkeypatch) -> None:
     artifact_root = tmp_path / "artifacts"
     dataset_root = artifact_root / "datasets"
@@ -65,3 +85,146 @@ def test_run_executes_pipeline(tmp_path: Path, monkeypatch) -> None:
     experiments_root = artifact_root
     # The actual path structure may vary, so just check something was created
     assert any(experiments_root.rglob("*.jsonl")), "Expected experiment artifacts to be written"
+
+
+def test_async_run_executes_pipeline(tmp_path: Path, monkeypatch) -> None:
+    artifact_root = tmp_path / "artifacts"
+    dataset_root = artifact_root / "datasets"
+    monkeypatch.setenv("EXP_CLI_ARTIFACT_ROOT", str(artifact_root))
+    _write_dataset(dataset_root, "sample", "0.1")
+
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, dataset_name="sample", version="0.1")
+
+    experiment_id = asyncio.run(
+        arun_experiment_with_resilience(config_path, dataset_root=dataset_root)
+    )
+
+    assert experiment_id != "dry-run"
+    assert any(artifact_root.rglob("*.jsonl")), "Expected experiment artifacts to be written"
+
+
+def test_sync_and_async_runs_share_retry_attempts(tmp_path: Path, monkeypatch) -> None:
+    from exp_platform_cli import cli
+    from exp_platform_cli.orchestrator import Orchestrator
+
+    monkeypatch.setenv("EXP_CLI_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    dataset_root = tmp_path / "datasets"
+    _write_dataset(dataset_root, "sample", "0.1")
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, dataset_name="sample", version="0.1")
+
+    outcomes: list[BaseException | str] = []
+    waits: list[float] = []
+
+    def flaky_run(self, path: str) -> str:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    async def record_async_sleep(delay: float) -> None:
+        waits.append(delay)
+
+    monkeypatch.setattr(Orchestrator, "run", flaky_run)
+    monkeypatch.setattr(cli, "_backoff_delay", lambda base, attempt: 0.5 * (attempt + 1))
+    monkeypatch.setattr(cli.time, "sleep", waits.append)
+    monkeypatch.setattr(cli.asyncio, "sleep", record_async_sleep)
+
+    outcomes[:] = [OSError("flaky"), OSError("flaky"), "sync-id"]
+    assert run_experiment_with_resilience(config_path, dataset_root, max_retries=3) == "sync-id"
+    outcomes[:] = [OSError("flaky"), OSError("flaky"), "async-id"]
+    assert (
+        asyncio.run(arun_experiment_with_resilience(config_path, dataset_root, max_retries=3))
+        == "async-id"
+    )
+    assert waits == [0.5, 1.0, 0.5, 1.0]
+
+    for runner in (run_experiment_with_resilience, arun_experiment_with_resilience):
+        outcomes[:] = [ValueError("broken")]
+        with pytest.raises(cli.ExecutionError, match="after 1 attempts: broken"):
+            result = runner(config_path, dataset_root, max_retries=3)
+            if asyncio.iscoroutine(result):
+                asyncio.run(result)
+    assert waits == [0.5, 1.0, 0.5, 1.0]
+
+
+def test_entrypoint_fast_path_version(capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--version"])
+
+    assert excinfo.value.code == 0
+    assert __version__ in capsys.readouterr().out
+
+
+def test_run_directory_is_sequential_by_default(tmp_path: Path, monkeypatch) -> None:
+    from exp_platform_cli import cli
+
+    monkeypatch.setenv("EXP_CLI_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    for name in ("first", "second"):
+        _write_config(tmp_path / f"{name}.yaml", dataset_name=name, version="0.1")
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", pytest.fail)
+
+    cli.run_directory.main([str(tmp_path), "--dry-run"], standalone_mode=False)
+
+
+def test_worker_initializer_restores_module_path_and_level(tmp_path: Path, monkeypatch) -> None:
+    import logging
+    import sys
+
+    from exp_platform_cli import cli
+
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    level = cli.logger.logger.level
+    try:
+        cli._init_worker([str(tmp_path)], logging.WARNING)
+        assert sys.path[0] == str(tmp_path)
+        assert cli.logger.logger.level == logging.WARNING
+    finally:
+        cli.logger.logger.setLevel(level)
+
+
+def test_preload_configs_makes_one_attempt_per_file(tmp_path: Path, monkeypatch) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from exp_platform_cli import cli
+
+    good = tmp_path / "good.yaml"
+    _write_config(good, dataset_name="good", version="0.1")
+    flaky = tmp_path / "flaky.yaml"
+    attempts: list[Path] = []
+    load_config = cli.ConfigLoader.load_config
+
+    def load_or_fail(path):
+        attempts.append(path)
+        if path == flaky:
+            raise OSError("transient")
+        return load_config(path)
+
+    # Threads stand in for worker processes so the patches below apply to them
+    monkeypatch.setattr(cli, "_worker_pool", lambda workers: ThreadPoolExecutor(workers))
+    monkeypatch.setattr(cli.ConfigLoader, "load_config", load_or_fail)
+    sleeps: list[float] = []
+    monkeypatch.setattr(cli.time, "sleep", sleeps.append)
+
+    preloaded = cli._preload_configs([good, flaky], workers=2)
+    assert list(preloaded) == [good]
+    assert attempts.count(flaky) == 1
+    assert not sleeps
+    assert preloaded[good].dataset.name == "good"
+
+
+def test_entrypoint_command_summaries_match_cli() -> None:
+    from exp_platform_cli.cli import cli
+    from exp_platform_cli.entrypoint import _COMMAND_SUMMARIES
+
+    registered = {name: command.help.splitlines()[0] for name, command in cli.commands.items()}
+    assert dict(_COMMAND_SUMMARIES) == registered
+
+
+def test_version_option_after_other_options(capsys) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(["-v", "--version"])
+
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out.strip() == f"exp-cli {__version__}"
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -111,6 +111,17 @@ class TestConfigLoading:
         with pytest.raises(Exception):  # Could be YAML parse error or validation error
             load_and_validate_config(config_file)
 
+    def test_load_invalid_config_is_not_retried(self, tmp_path: Path, monkeypatch):
+        """Parse errors are deterministic, so no backoff sleep should happen."""
+        from exp_platform_cli.cli import ConfigurationError
+
+        config_file = tmp_path / "invalid.yaml"
+        config_file.write_text("invalid: yaml: content:")
+        monkeypatch.setattr("exp_platform_cli.cli.time.sleep", pytest.fail)
+
+        with pytest.raises(ConfigurationError):
+            load_and_validate_config(config_file)
+
 
 class TestDirectoryOperations:
     """Test directory-based operations."""
@@ -138,28 +149,70 @@ class TestDirectoryOperations:
         assert len(yaml_results) == 1
         assert len(json_results) == 1
 
+    def test_discover_config_files_nested(self, tmp_path: Path):
+        """Test that matches in subdirectories are found and sorted."""
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "nested.yaml").write_text("test")
+        (tmp_path / "a.yaml").write_text("test")
+        (tmp_path / "dir.yaml").mkdir()
+
+        results = discover_config_files(tmp_path, "*.yaml")
+        assert results == [tmp_path / "a.yaml", tmp_path / "b" / "nested.yaml"]
+
+    def test_discover_config_files_pattern_with_directory(self, tmp_path: Path):
+        """Test that patterns containing a path separator match at any depth."""
+        (tmp_path / "exp" / "configs").mkdir(parents=True)
+        (tmp_path / "exp" / "configs" / "run.yaml").write_text("test")
+        (tmp_path / "configs").mkdir()
+        (tmp_path / "configs" / "top.yaml").write_text("test")
+        (tmp_path / "other.yaml").write_text("test")
+
+        results = discover_config_files(tmp_path, "configs/*.yaml")
+        assert results == [
+            tmp_path / "configs" / "top.yaml",
+            tmp_path / "exp" / "configs" / "run.yaml",
+        ]
+
     def test_discover_config_files_empty_directory(self, tmp_path: Path):
         """Test discovering config files in empty directory."""
         results = discover_config_files(tmp_path, "*.yaml")
         assert len(results) == 0
 
-    @patch("subprocess.run")
-    def test_install_directory_dependencies_with_requirements(
-        self, mock_subprocess, tmp_path: Path
-    ):
+    @patch("subprocess.Popen")
+    def test_install_directory_dependencies_with_requirements(self, mock_popen, tmp_path: Path):
         """Test installing dependencies when requirements.txt exists."""
         requirements_file = tmp_path / "requirements.txt"
         requirements_file.write_text("numpy==1.21.0\\nrequests>=2.25.0")
 
-        mock_subprocess.return_value = MagicMock(returncode=0)
+        proc = mock_popen.return_value.__enter__.return_value
+        proc.stdout = iter(["Collecting numpy\n"])
+        proc.wait.return_value = 0
 
+        install_directory_dependencies(tmp_path)
+        # Identical requirements are not installed twice
         install_directory_dependencies(tmp_path)
 
-        mock_subprocess.assert_called_once()
-        args = mock_subprocess.call_args[0][0]
+        mock_popen.assert_called_once()
+        args = mock_popen.call_args[0][0]
         assert "pip" in args
         assert "install" in args
 
+    def test_install_command_uses_uv_when_opted_in(self, tmp_path: Path, monkeypatch):
+        """Test that uv is used for installs only when opted into and on PATH."""
+        from exp_platform_cli.cli import _pip_install_command
+
+        requirements_file = tmp_path / "requirements.txt"
+        monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/uv")
+        monkeypatch.delenv("EXP_CLI_USE_UV", raising=False)
+        assert _pip_install_command(requirements_file)[1:4] == ["-m", "pip", "install"]
+
+        monkeypatch.setenv("EXP_CLI_USE_UV", "1")
+        assert _pip_install_command(requirements_file)[:3] == ["/usr/bin/uv", "pip", "install"]
+        assert "--require-hashes" in _pip_install_command(requirements_file, hashed=True)
+
+        monkeypatch.setattr("shutil.which", lambda name: None)
+        assert _pip_install_command(requirements_file)[1:4] == ["-m", "pip", "install"]
+
     def test_install_directory_dependencies_no_requirements(self, tmp_path: Path):
         """Test installing dependencies when no requirements.txt exists."""
         # Should not raise an exception
@@ -175,6 +228,24 @@ class TestDirectoryOperations:
         # Check that path was added to sys.path
         mock_sys_path.insert.assert_called_once_with(0, module_path)
 
+    def test_setup_module_path_does_not_import_parents(self, tmp_path: Path, monkeypatch):
+        """Test that locating a submodule does not run its package __init__."""
+        import sys
+
+        package = tmp_path / "heavy_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("raise RuntimeError('imported')")
+        (package / "runner.py").write_text("")
+        monkeypatch.setattr(sys, "path", list(sys.path))
+
+        setup_module_path(tmp_path, "heavy_pkg.runner")
+        assert "heavy_pkg" not in sys.modules
+
+        from exp_platform_cli.cli import _find_module_spec
+
+        assert _find_module_spec("heavy_pkg.runner").name == "heavy_pkg.runner"
+        assert _find_module_spec("heavy_pkg.missing") is None
+
 
 class TestDatasetService:
     """Test dataset service functionality."""
@@ -284,5 +355,27 @@ class TestIntegration:
         assert result.evaluators[0].name == "conversation_quality"
 
 
+def test_backoff_delay_is_full_jitter_and_capped():
+    """Backoff delays are drawn from [0, min(cap, base * 2**attempt)]."""
+    from exp_platform_cli.cli import _backoff_delay
+
+    for attempt in range(8):
+        delay = _backoff_delay(1.0, attempt, cap=30.0)
+        assert 0 <= delay <= min(30.0, 2**attempt)
+
+
+def test_relative_artifact_root_follows_working_directory(tmp_path: Path, monkeypatch):
+    """A relative artifact root is re-resolved against each working directory."""
+    from exp_platform_cli import constants
+
+    monkeypatch.setenv("EXP_CLI_ARTIFACT_ROOT", "artifacts")
+    for name in ("first", "second"):
+        workdir = tmp_path / name
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+        constants.refresh_paths()
+        assert constants.ARTIFACT_ROOT == workdir.resolve() / "artifacts"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import sys
+from importlib import import_module
 from pathlib import Path
 
 import pytest
@@ -43,6 +45,16 @@ def test_equivalent_evaluator_outputs_accuracy() -> None:
     assert result.per_row["row-bad"]["match"] == 0.0
 
 
+def test_evaluator_output_to_frame() -> None:
+    config = EvaluatorConfig(id="equivalent", name="equivalent", data_mapping={})
+    result = load_evaluators([config])[0].evaluate(_make_rows())
+
+    frame = result.to_frame()
+    assert frame.index.name == "row_id"
+    assert list(frame.index) == ["row-ok", "row-bad"]
+    assert frame["match"].mean() == pytest.approx(result.summary["accuracy"])
+
+
 def test_local_evaluation_writes_metrics(tmp_path: Path, monkeypatch) -> None:
     output_path = tmp_path / "experiments"
 
@@ -75,3 +87,481 @@ def test_local_evaluation_writes_metrics(tmp_path: Path, monkeypatch) -> None:
     assert "equivalent:match" in rows[0].evaluation_results
     assert rows[0].evaluation_results["equivalent:match"].metric_value == 1.0
     assert rows[1].evaluation_results["equivalent:match"].metric_value == 0.0
+
+
+def test_tool_call_accuracy_counts_statuses() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import ToolCallAccuracyEvaluator
+    from exp_platform_cli.models import ToolCallDetails, ToolCallStatus
+
+    calls = [
+        ToolCallDetails(tool_name="math", function_name="add", execution_time_ms=10.0),
+        ToolCallDetails(tool_name="math", function_name="add", execution_time_ms=30.0),
+        ToolCallDetails(tool_name="web", function_name="get", status=ToolCallStatus.FAILED),
+        ToolCallDetails(tool_name="web", function_name="get", status=ToolCallStatus.TIMEOUT),
+    ]
+    rows = [DataModelRow(id="calls", tool_calls=calls), DataModelRow(id="none")]
+    evaluator = ToolCallAccuracyEvaluator(EvaluatorConfig(id="tca", name="tool_call_accuracy"))
+
+    metadata = evaluator._evaluate_single_row(rows[0]).metadata
+    assert metadata["failed_calls"] == 1
+    assert metadata["timeout_calls"] == 1
+    assert metadata["cancelled_calls"] == 0
+    assert sorted(metadata["functions_used"]) == ["math.add", "web.get"]
+    assert rows[0].columns.tool_status_counts["success"] == 2
+    assert set(rows[0].columns.tool_status_counts) == set(ToolCallStatus)
+    assert metadata["average_execution_time_ms"] == 20.0
+
+    result = evaluator.evaluate(rows)
+    assert result.summary["accuracy"] == 0.5
+    assert result.per_row["calls"]["tool_call_accuracy"] == 0.5
+    assert result.per_row["none"]["tool_call_accuracy"] == 1.0
+
+
+def test_row_names_are_interned() -> None:
+    from exp_platform_cli.models import AgentMessage, AgentRole, ToolCallDetails
+
+    first, second = ("".join(["math", suffix]) for suffix in ("_tool", "_tool"))
+    assert first is not second
+    calls = [ToolCallDetails(tool_name=name, function_name="add") for name in (first, second)]
+    assert calls[0].tool_name is calls[1].tool_name
+    message = AgentMessage(role=AgentRole.USER, content="hi", agent_id="".join(["a", "1"]))
+    assert message.agent_id is sys.intern("a1")
+    assert AgentMessage(role=AgentRole.USER, content="hi").agent_id is None
+
+
+def test_conversation_quality_metrics() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import ConversationQualityEvaluator
+    from exp_platform_cli.models import AgentMessage, AgentRole, ToolCallDetails
+
+    call = ToolCallDetails(tool_name="math", function_name="add")
+    messages = [
+        AgentMessage(role=AgentRole.SYSTEM, content="", agent_id="planner"),
+        AgentMessage(role=AgentRole.USER, content="abcd"),
+        AgentMessage(role=AgentRole.ASSISTANT, content="ab", agent_id="solver", tool_calls=[call]),
+        AgentMessage(role=AgentRole.USER, content="abcdef"),
+    ]
+    evaluator = ConversationQualityEvaluator(EvaluatorConfig(id="cq", name="conversation_quality"))
+
+    result = evaluator._evaluate_single_row(DataModelRow(id="chat", conversation_history=messages))
+    assert result.metadata["user_messages"] == 2
+    assert result.metadata["assistant_messages"] == 1
+    assert result.metadata["system_messages"] == 1
+    assert result.metadata["avg_response_length"] == 4.0
+    assert result.metadata["unique_agents"] == 2
+    # 1:2 assistant/user balance and 25% of messages using tools
+    assert result.metric_value == pytest.approx((0.5 + 1.0) / 2)
+
+
+def test_row_columns_follow_in_place_edits() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import ConversationQualityEvaluator
+    from exp_platform_cli.models import AgentMessage, AgentRole
+
+    row = DataModelRow(
+        id="chat",
+        conversation_history=[
+            AgentMessage(role=AgentRole.USER, content="hi"),
+            AgentMessage(role=AgentRole.ASSISTANT, content="hello"),
+        ],
+    )
+    evaluator = ConversationQualityEvaluator(EvaluatorConfig(id="cq", name="conversation_quality"))
+    assert row.columns.message_role_counts[AgentRole.ASSISTANT] == 1
+    assert evaluator._evaluate_single_row(row).metadata["assistant_messages"] == 1
+
+    row.conversation_history[1].role = AgentRole.USER
+    assert row.columns.message_role_counts[AgentRole.ASSISTANT] == 0
+    assert evaluator._evaluate_single_row(row).metadata["assistant_messages"] == 0
+
+    # Only the columns a metric reads are built
+    columns = row.columns
+    assert columns.message_role_counts[AgentRole.USER] == 2
+    assert "message_roles" in vars(columns)
+    assert "tool_statuses" not in vars(columns)
+
+
+def test_evaluators_share_row_columns_through_features_cache() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import (
+        AgentToAgentCommunicationEvaluator,
+        ConversationQualityEvaluator,
+    )
+    from exp_platform_cli.models import AgentMessage, AgentRole
+
+    row = DataModelRow(
+        id="chat",
+        conversation_history=[
+            AgentMessage(role=AgentRole.USER, content="hi", agent_id="a"),
+            AgentMessage(role=AgentRole.ASSISTANT, content="hello", agent_id="b"),
+        ],
+    )
+    features_cache: dict = {}
+    quality = ConversationQualityEvaluator(
+        EvaluatorConfig(id="cq", name="conversation_quality"), features_cache
+    )
+    communication = AgentToAgentCommunicationEvaluator(
+        EvaluatorConfig(id="a2a", name="agent_comm"), features_cache
+    )
+
+    quality.evaluate([row])
+    columns = features_cache["chat"]
+    assert columns.row is row
+    communication.evaluate([row])
+    assert features_cache["chat"] is columns
+    assert "message_agent_ids" in vars(columns)
+
+    # A different row reusing the id gets its own view
+    other = row.model_copy(deep=True)
+    ConversationQualityEvaluator(quality.config, features_cache).evaluate([other])
+    assert features_cache["chat"].row is other
+
+
+def test_local_evaluation_hands_evaluators_one_features_cache(tmp_path: Path, monkeypatch) -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import ToolCallAccuracyEvaluator
+    from exp_platform_cli.services import local_evaluation
+
+    instances = [
+        ToolCallAccuracyEvaluator(EvaluatorConfig(id=name, name="tool_call_accuracy"))
+        for name in ("first", "second")
+    ]
+    monkeypatch.setattr(local_evaluation, "load_evaluators", lambda configs: instances)
+    experiment_cfg = ExperimentConfig(
+        dataset=DatasetConfig(name="sample", version="0.1"),
+        executable=ModuleExecutableConfig(path="sample", processor="run"),
+        output_path=str(tmp_path / "experiments"),
+    )
+
+    LocalEvaluationService().evaluate(
+        experiment_id="exp123",
+        dataset_name="sample",
+        dataset_version="0.1",
+        data_id=None,
+        config=experiment_cfg,
+        evaluators=[],
+        rows=_make_rows(),
+    )
+
+    assert instances[0].features_cache is instances[1].features_cache
+    assert set(instances[0].features_cache) == {"row-ok", "row-bad"}
+
+
+def test_agent_evaluator_reuses_row_scores(monkeypatch) -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import AgentToAgentCommunicationEvaluator
+    from exp_platform_cli.models import AgentMessage, AgentRole
+
+    row = DataModelRow(
+        id="chat",
+        conversation_history=[
+            AgentMessage(role=AgentRole.USER, content="plan the trip", agent_id="planner"),
+            AgentMessage(role=AgentRole.ASSISTANT, content="plan the route", agent_id="solver"),
+        ],
+    )
+    evaluator = AgentToAgentCommunicationEvaluator(EvaluatorConfig(id="a2a", name="agent_comm"))
+    scored: list[str] = []
+    original = evaluator._evaluate_single_row
+    monkeypatch.setattr(
+        evaluator, "_evaluate_single_row", lambda r: scored.append(r.id) or original(r)
+    )
+
+    first = evaluator.evaluate([row])
+    assert first.per_row["chat"]["agent_communication"] > 0
+    assert evaluator.evaluate([row]).per_row == first.per_row
+    assert evaluator.evaluate([row.model_copy(deep=True)]).per_row == first.per_row
+    assert scored == ["chat"]
+
+    # In-place edits that keep every length the same are still picked up
+    row.conversation_history[1].content = "working together on the route"
+    evaluator.evaluate([row])
+    row.conversation_history[1].agent_id = "planner"
+    assert evaluator.evaluate([row]).per_row["chat"]["agent_communication"] == 0.0
+    assert scored == ["chat", "chat", "chat"]
+
+    evaluator.config.data_mapping["content"] = "text"
+    evaluator.evaluate([row])
+    assert scored == ["chat", "chat", "chat", "chat"]
+
+
+def test_cheap_agent_evaluators_score_without_a_cache() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import (
+        ConversationQualityEvaluator,
+        SemanticKernelPerformanceEvaluator,
+    )
+    from exp_platform_cli.models import AgentMessage, AgentRole
+
+    row = DataModelRow(
+        id="chat",
+        conversation_history=[
+            AgentMessage(role=AgentRole.USER, content="hi"),
+            AgentMessage(role=AgentRole.ASSISTANT, content="hello"),
+        ],
+    )
+    evaluator = ConversationQualityEvaluator(EvaluatorConfig(id="cq", name="conversation_quality"))
+    assert evaluator.evaluate([row]).per_row["chat"]["balance_score"] == 1.0
+    row.conversation_history[1].role = AgentRole.USER
+    assert evaluator.evaluate([row]).per_row["chat"]["balance_score"] == 0.0
+
+    for cls in (ConversationQualityEvaluator, SemanticKernelPerformanceEvaluator):
+        assert not hasattr(cls(EvaluatorConfig(id="x", name="x")), "_row_cache")
+
+
+def test_agent_evaluator_shares_result_for_rows_without_data(monkeypatch) -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import AgentToAgentCommunicationEvaluator
+
+    rows = [DataModelRow(id=f"empty-{i}") for i in range(3)]
+    evaluator = AgentToAgentCommunicationEvaluator(EvaluatorConfig(id="a2a", name="agent_comm"))
+    scored: list[str] = []
+    original = evaluator._evaluate_single_row
+    monkeypatch.setattr(
+        evaluator, "_evaluate_single_row", lambda r: scored.append(r.id) or original(r)
+    )
+
+    result = evaluator.evaluate(rows)
+    assert scored == ["empty-0"]
+    assert not evaluator._row_cache
+    assert result.summary["single_agent_conversations"] == 3
+    assert result.per_row["empty-2"] == {
+        "agent_communication": 0.0,
+        "unique_agents": 0,
+        "multi_agent_turns": 0,
+    }
+
+
+def test_agent_communication_handoffs_and_collaboration() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import AgentToAgentCommunicationEvaluator
+    from exp_platform_cli.models import AgentMessage, AgentRole
+
+    messages = [
+        AgentMessage(role=AgentRole.ASSISTANT, content="Let me help with the report", agent_id="a"),
+        AgentMessage(
+            role=AgentRole.ASSISTANT, content="building on the report draft", agent_id="b"
+        ),
+        AgentMessage(role=AgentRole.ASSISTANT, content="unrelated words entirely", agent_id="a"),
+    ]
+    evaluator = AgentToAgentCommunicationEvaluator(EvaluatorConfig(id="a2a", name="agent_comm"))
+    row = DataModelRow(id="team", conversation_history=messages)
+
+    result = evaluator._evaluate_single_row(row)
+    assert result.metadata["handoff_score"] == 0.5
+    assert result.metadata["collaboration_score"] == pytest.approx(min(1.0, 2 / 0.9))
+    assert result.metadata["unique_agents"] == 2
+    assert result.metadata["multi_agent_turns"] == 2
+
+
+def test_semantic_kernel_performance_scoring() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import SemanticKernelPerformanceEvaluator
+    from exp_platform_cli.models import AgentInteraction, SemanticKernelTrace
+
+    trace = SemanticKernelTrace(
+        prompt_tokens=60, completion_tokens=40, total_tokens=100, model_name="GPT-4o"
+    )
+    interaction = AgentInteraction(
+        interaction_id="i1", duration_ms=3000.0, total_cost=0.2, semantic_kernel_trace=trace
+    )
+    evaluator = SemanticKernelPerformanceEvaluator(EvaluatorConfig(id="sk", name="sk_performance"))
+
+    metadata = evaluator._evaluate_single_row(
+        DataModelRow(id="sk", agent_interaction=interaction)
+    ).metadata
+    assert metadata["token_efficiency"] == 1.0
+    assert metadata["execution_efficiency"] == pytest.approx(0.9)
+    # Cost above $0.10 halves the score and GPT-4 models take a further 0.8 factor
+    assert metadata["resource_usage"] == pytest.approx(0.4)
+
+
+def test_semantic_kernel_summary_tolerates_missing_counts() -> None:
+    from exp_platform_cli.evaluators.agent_evaluators import SemanticKernelPerformanceEvaluator
+    from exp_platform_cli.models import AgentInteraction, SemanticKernelTrace
+
+    interaction = AgentInteraction(
+        interaction_id="i1", semantic_kernel_trace=SemanticKernelTrace(model_name="gpt-35")
+    )
+    rows = [DataModelRow(id="sk", agent_interaction=interaction), DataModelRow(id="plain")]
+    evaluator = SemanticKernelPerformanceEvaluator(EvaluatorConfig(id="sk", name="sk_performance"))
+
+    result = evaluator.evaluate(rows)
+    assert result.summary["total_tokens"] == 0
+    assert result.summary["total_duration_ms"] == 0.0
+    assert result.summary["average_performance"] == 0.5
+
+
+def test_flow_evaluator_scores_rows_concurrently() -> None:
+    import threading
+
+    from exp_platform_cli.evaluators.enhanced_registry import (
+        FlowEvaluatorConfig,
+        FlowEvaluatorWrapper,
+    )
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def flow_evaluator(response, ground_truth, **_):
+        barrier.wait()  # only passes when both rows are in flight at once
+        return {"score": float(response == ground_truth)}
+
+    flow_config = FlowEvaluatorConfig(inputs={}, entry="module:Evaluator", max_workers=2)
+    evaluator = FlowEvaluatorWrapper(
+        EvaluatorConfig(id="flow", name="flow"), flow_config, flow_evaluator
+    )
+
+    result = evaluator.evaluate(_make_rows())
+    assert list(result.per_row) == ["row-ok", "row-bad"]
+    assert result.per_row["row-ok"]["score"] == 1.0
+    assert result.summary["score"] == 0.5
+
+
+def test_flow_evaluator_workers_default_from_environment(monkeypatch) -> None:
+    from exp_platform_cli.evaluators.enhanced_registry import FlowEvaluatorConfig
+
+    assert FlowEvaluatorConfig(inputs={}, entry="m:E").max_workers == 1
+    monkeypatch.setenv("EXP_CLI_EVAL_WORKERS", "8")
+    assert FlowEvaluatorConfig(inputs={}, entry="m:E").max_workers == 8
+    assert FlowEvaluatorConfig(inputs={}, entry="m:E", max_workers=2).max_workers == 2
+    monkeypatch.setenv("EXP_CLI_EVAL_WORKERS", "many")
+    assert FlowEvaluatorConfig(inputs={}, entry="m:E").max_workers == 1
+
+
+def test_flow_evaluator_applies_data_mapping() -> None:
+    from exp_platform_cli.evaluators.enhanced_registry import (
+        FlowEvaluatorConfig,
+        FlowEvaluatorWrapper,
+    )
+
+    mapping = {"answer": "response", "query": "question", "truth": "expected_output", "x": "nope"}
+    evaluator = FlowEvaluatorWrapper(
+        EvaluatorConfig(id="flow", name="flow", data_mapping=mapping),
+        FlowEvaluatorConfig(inputs={}, entry="module:Evaluator"),
+        lambda **_: 1.0,
+    )
+    row = DataModelRow(
+        id="r", data_input={"question": "q?"}, expected_output="yes", data_output="no"
+    )
+
+    inputs = evaluator._build_foundry_inputs(row)
+    assert inputs["answer"] == "no"
+    assert inputs["query"] == "q?"
+    assert inputs["truth"] == "yes"
+    assert "x" not in inputs
+
+    # Row inputs shadow the row field aliases
+    row.data_input["response"] = "from input"
+    assert evaluator._build_foundry_inputs(row)["answer"] == "from input"
+
+    # Numeric fields (bools included) become metrics and the first stands in for score
+    metrics = evaluator._process_foundry_result({"exact": True, "notes": "n", "sim": 0.5})
+    assert metrics == {"exact": 1.0, "sim": 0.5, "score": 1.0}
+
+
+def test_flow_evaluator_summary_skips_error_messages() -> None:
+    from exp_platform_cli.evaluators.enhanced_registry import (
+        FlowEvaluatorConfig,
+        FlowEvaluatorWrapper,
+    )
+
+    def flow_evaluator(response, ground_truth, **_):
+        if response == {"value": 3}:
+            raise ValueError("bad row")
+        return {"score": 1.0}
+
+    evaluator = FlowEvaluatorWrapper(
+        EvaluatorConfig(id="flow", name="flow"),
+        FlowEvaluatorConfig(inputs={}, entry="module:Evaluator"),
+        flow_evaluator,
+    )
+
+    result = evaluator.evaluate(_make_rows())
+    assert "bad row" in result.per_row["row-bad"]["evaluation_error"]
+    assert result.summary == {"score": 0.5, "error": 0.5}
+
+    # Rows failing with the same message share one result
+    rows = [DataModelRow(id=f"bad-{i}", data_output={"value": 3}) for i in range(3)]
+    per_row = evaluator.evaluate(rows).per_row
+    assert per_row["bad-0"] is per_row["bad-2"] is result.per_row["row-bad"]
+
+
+def test_flow_evaluator_load_is_cached_until_files_change(tmp_path: Path, monkeypatch) -> None:
+    from exp_platform_cli.evaluators.enhanced_registry import EnhancedEvaluatorRegistry
+
+    evaluator_dir = tmp_path / "evaluators" / "scorer"
+    evaluator_dir.mkdir(parents=True)
+    (evaluator_dir / "flow.flex.yaml").write_text("inputs: {}\nentry: scorer:Scorer\n")
+    module_file = evaluator_dir / "scorer.py"
+    module_file.write_text("class Scorer:\n    def __call__(self, **_):\n        return 1.0\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EXP_CLI_CACHE_DIR", str(tmp_path / "cache"))
+
+    registry = EnhancedEvaluatorRegistry()
+    config = EvaluatorConfig(id="scorer", name="scorer")
+    first = registry.create(config)
+    assert registry.create(config).evaluator_instance is first.evaluator_instance
+
+    module_file.write_text("class Scorer:\n    def __call__(self, **_):\n        return 0.25\n")
+    reloaded = registry.create(config)
+    assert reloaded.evaluator_instance is not first.evaluator_instance
+    assert reloaded.evaluator_instance() == 0.25
+
+
+def test_flow_file_parse_is_reused_across_registries(tmp_path: Path, monkeypatch) -> None:
+    # The package re-exports the registry instance under the module's name
+    registry_module = import_module("exp_platform_cli.evaluators.enhanced_registry")
+
+    evaluator_dir = tmp_path / "evaluators" / "scorer"
+    evaluator_dir.mkdir(parents=True)
+    flow_file = evaluator_dir / "flow.flex.yaml"
+    flow_file.write_text("inputs: {}\nentry: scorer:Scorer\nmax_workers: 2\n")
+    (evaluator_dir / "scorer.py").write_text(
+        "class Scorer:\n    def __call__(self, **_):\n        return 1.0\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("EXP_CLI_CACHE_DIR", str(tmp_path / "cache"))
+    config = EvaluatorConfig(id="scorer", name="scorer")
+
+    parsed: list[object] = []
+    load = registry_module.yaml.load
+    monkeypatch.setattr(
+        registry_module.yaml, "load", lambda f, **kwargs: parsed.append(f) or load(f, **kwargs)
+    )
+
+    registry_module.EnhancedEvaluatorRegistry().create(config)
+    assert list((tmp_path / "cache" / "flows").glob("*.json"))
+    assert not list(evaluator_dir.glob("*.json"))
+
+    # A fresh registry (as in a new CLI run) reads the JSON copy instead of YAML
+    evaluator = registry_module.EnhancedEvaluatorRegistry().create(config)
+    assert evaluator.flow_config.max_workers == 2
+    assert len(parsed) == 1
+
+    flow_file.write_text("inputs: {}\nentry: scorer:Scorer\nmax_workers: 16\n")
+    evaluator = registry_module.EnhancedEvaluatorRegistry().create(config)
+    assert evaluator.flow_config.max_workers == 16
+    assert len(parsed) == 2
+
+
+def test_evaluator_index_rescans_only_when_search_dirs_change(tmp_path: Path, monkeypatch) -> None:
+    from exp_platform_cli.evaluators.enhanced_registry import EnhancedEvaluatorRegistry
+
+    search_dir = tmp_path / "evaluators"
+    (search_dir / "Scorer").mkdir(parents=True)
+    (search_dir / "Scorer" / "flow.flex.yaml").write_text("inputs: {}\nentry: s:S\n")
+    monkeypatch.chdir(tmp_path)
+
+    registry = EnhancedEvaluatorRegistry()
+    index = registry._evaluator_index()
+    assert index == {"scorer": [search_dir / "Scorer"]}
+    assert registry._evaluator_index() is index
+
+    (search_dir / "other").mkdir()
+    (search_dir / "other" / "flow.flex.yaml").write_text("inputs: {}\nentry: s:S\n")
+    assert sorted(registry._evaluator_index()) == ["other", "scorer"]
+
+
+def test_registry_looks_up_flow_evaluators_once_per_create(monkeypatch) -> None:
+    from exp_platform_cli.evaluators.enhanced_registry import EnhancedEvaluatorRegistry
+
+    registry = EnhancedEvaluatorRegistry()
+    lookups: list[str] = []
+    monkeypatch.setattr(
+        registry, "_try_foundry_evaluator", lambda config, name: lookups.append(name)
+    )
+
+    mapped = EvaluatorConfig(id="unknown", name="unknown", data_mapping={"a": "b"})
+    assert registry.create(mapped) is None
+    assert registry.create(EvaluatorConfig(id="unknown", name="unknown")) is None
+    assert registry.create(EvaluatorConfig(id="eq", name="equivalent")) is not None
+    assert lookups == ["unknown", "unknown"]
@@ -0,0 +1,121 @@
+"""Tests for the notebook widget interface helpers."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+pytest.importorskip("ipywidgets")
+
+NOTEBOOKS_DIR = Path(__file__).resolve().parents[1] / "notebooks"
+sys.path.insert(0, str(NOTEBOOKS_DIR))
+
+import experiment_interface  # noqa: E402
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_uses_libyaml_loader_and_dumper():
+    """The interface should pick up the C-accelerated YAML loader and dumper."""
+    assert experiment_interface._YLoader is yaml.CSafeLoader
+    assert experiment_interface._YDumper is yaml.CSafeDumper
+
+
+def test_basic_validation_reports_missing_fields(monkeypatch):
+    """Without the CLI package, validation still checks the required sections."""
+    monkeypatch.setattr(experiment_interface, "DIRECT_IMPORT", False)
+    widget = experiment_interface.ExperimentPlatformWidget()
+
+    widget.config_editor.value = "dataset:\n  name: sample\n"
+    widget._on_validate_config(None)
+    assert "Missing: executable" in widget.validation_output.value
+
+    widget.config_editor.value += "executable:\n  path: module\n"
+    widget._on_validate_config(None)
+    assert "Basic validation passed" in widget.validation_output.value
+
+
+def test_temp_configs_do_not_pin_widgets(monkeypatch):
+    """Temp config files are tracked by path, so closed widgets can be collected."""
+    import gc
+    import weakref
+
+    monkeypatch.setattr(experiment_interface, "_TMP_CONFIG_PATHS", set())
+    widget = experiment_interface.ExperimentPlatformWidget()
+    widget.config_editor.value = "dataset: {}\n"
+    first = widget._materialize_config()
+    assert widget._materialize_config() == first
+
+    widget.config_editor.value = "dataset: {name: edited}\n"
+    second = widget._materialize_config()
+    assert not first.exists()
+    assert experiment_interface._TMP_CONFIG_PATHS == {second}
+
+    experiment_interface._remove_tmp_configs()
+    assert not second.exists()
+    assert not experiment_interface._TMP_CONFIG_PATHS
+
+    third = widget._materialize_config()
+    ref = weakref.ref(widget)
+    widget.close()
+    del widget
+    gc.collect()
+    assert ref() is None
+    assert not third.exists()
+
+
+def test_create_dataset_after_directory_change(tmp_path: Path, monkeypatch):
+    """Datasets are written relative to the current directory, even after a chdir."""
+    widget = experiment_interface.ExperimentPlatformWidget()
+    for name in ("first", "second"):
+        workdir = tmp_path / name
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+        widget._create_dataset("sample", "1.0", [{"input": name}])
+        assert (workdir / "data/datasets/sample/1.0/data.jsonl").exists()
+
+
+def test_ring_output_throttles_renders():
+    """Lines printed in a burst are rendered together rather than one at a time."""
+    output = experiment_interface.RingOutput(max_lines=3, render_interval=60)
+    with output:
+        for index in range(5):
+            print(f"line {index}")
+        assert output.outputs[0]["text"] == "line 0\n"
+    assert output.outputs[0]["text"] == "line 2\nline 3\nline 4\n"
+
+
+def test_ring_output_captures_only_its_own_task(capsys):
+    """Overlapping handlers each capture their own prints, including worker threads'."""
+    import asyncio
+
+    first = experiment_interface.RingOutput(render_interval=0)
+    second = experiment_interface.RingOutput(render_interval=0)
+
+    async def handler(output, label):
+        with output:
+            await asyncio.sleep(0)
+            await asyncio.to_thread(print, f"{label} thread")
+            print(f"{label} task")
+
+    async def main():
+        await asyncio.gather(handler(first, "a"), handler(second, "b"))
+        print("elsewhere")
+
+    asyncio.run(main())
+    assert first.outputs[0]["text"] == "a thread\na task\n"
+    assert second.outputs[0]["text"] == "b thread\nb task\n"
+    assert capsys.readouterr().out == "elsewhere\n"
+
+
+def test_run_directory_in_process_maps_click_errors(tmp_path: Path):
+    """Usage errors become an exit code instead of escaping the handler."""
+    import asyncio
+
+    output = experiment_interface.RingOutput(render_interval=0)
+    missing = str(tmp_path / "missing")
+    returncode = asyncio.run(experiment_interface._run_directory_in_process(missing, False, output))
+    assert returncode == 2
+    assert "Error:" in output.outputs[0]["text"]
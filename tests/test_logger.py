@@ -1,4 +1,4 @@
-from logging import DEBUG, Handler, LogRecord
+from logging import DEBUG, WARNING, Handler, LogRecord
 
 import pytest
 from exp_platform_cli.logger import SUCCESS_LEVEL, ExperimentLogger
@@ -37,3 +37,12 @@ def test_banner_outputs_rule(
     exp_logger.banner("My Banner")
     captured = capsys.readouterr()
     assert "My Banner" in captured.out
+
+
+def test_banner_respects_level(
+    exp_logger: ExperimentLogger, capsys: pytest.CaptureFixture[str]
+) -> None:
+    exp_logger.logger.setLevel(WARNING)
+    exp_logger.banner("Hidden Banner")
+    captured = capsys.readouterr()
+    assert "Hidden Banner" not in captured.out
@@ -133,6 +133,117 @@ class Processor:
 
         assert result.data_output == "class processed: test_data"
 
+    def test_class_processor_instantiated_once(self, tmp_path: Path, monkeypatch):
+        """Test that rows share one processor instance until the module changes."""
+        monkeypatch.chdir(tmp_path)
+
+        module_content = """
+class Processor:
+    instances = 0
+
+    def __init__(self):
+        Processor.instances += 1
+
+    def run(self, **kwargs) -> int:
+        return Processor.instances
+"""
+        module_path = self.create_test_module(tmp_path, "stateful_module", module_content)
+        config = ModuleExecutableConfig(path="stateful_module", processor="Processor")
+
+        rows = [DataModelRow(id=f"row-{i}") for i in range(3)]
+        outputs = [ModuleExecutable(row, config).execute().data_output for row in rows]
+        assert outputs == [1, 1, 1]
+
+        module_path.write_text(module_content + "\n# edited\n")
+        assert ModuleExecutable(rows[0], config).execute().data_output == 1
+        assert ModuleExecutable(rows[0], config)._target.__self__.instances == 1
+
+    def test_row_parameter_resolved_once(self, tmp_path: Path, monkeypatch):
+        """Test that executing does not inspect the processor signature again."""
+        monkeypatch.chdir(tmp_path)
+
+        module_content = """
+def run(data_model_row) -> str:
+    return data_model_row.data_input["input"].upper()
+"""
+        self.create_test_module(tmp_path, "row_module", module_content)
+
+        row = DataModelRow(id="test_row", data_input={"input": "abc"})
+        config = ModuleExecutableConfig(path="row_module", processor="run")
+
+        executable = ModuleExecutable(row, config)
+        monkeypatch.setattr("inspect.signature", pytest.fail)
+        result = executable.execute(**row.data_input)
+
+        assert result.data_output == "ABC"
+
+    def test_module_loaded_once_across_rows(self, tmp_path: Path, monkeypatch):
+        """Test that rows share one module load until the file changes."""
+        monkeypatch.chdir(tmp_path)
+
+        module_content = """
+LOADS = []
+LOADS.append(1)
+
+def run(**kwargs) -> int:
+    return len(LOADS)
+"""
+        module_path = self.create_test_module(tmp_path, "shared_module", module_content)
+        config = ModuleExecutableConfig(path="shared_module", processor="run")
+
+        rows = [DataModelRow(id=f"row-{i}") for i in range(3)]
+        outputs = [ModuleExecutable(row, config).execute().data_output for row in rows]
+        assert outputs == [1, 1, 1]
+        assert (
+            ModuleExecutable(rows[0], config)._module is ModuleExecutable(rows[1], config)._module
+        )
+
+        module_path.write_text(module_content.replace("len(LOADS)", "len(LOADS) + 10"))
+        assert ModuleExecutable(rows[0], config).execute().data_output == 11
+
+    def test_module_path_resolved_once(self, tmp_path: Path, monkeypatch):
+        """Test that later rows reuse the resolved module path until it disappears."""
+        monkeypatch.chdir(tmp_path)
+        module_path = self.create_test_module(
+            tmp_path, "resolved_module", "def run(**kwargs) -> int:\n    return 1\n"
+        )
+        config = ModuleExecutableConfig(path="resolved_module", processor="run")
+        ModuleExecutable(DataModelRow(id="row-0"), config)
+
+        monkeypatch.setattr(ModuleExecutable, "_find_module_path", pytest.fail)
+        assert ModuleExecutable(DataModelRow(id="row-1"), config).execute().data_output == 1
+
+        monkeypatch.undo()
+        monkeypatch.chdir(tmp_path)
+        module_path.unlink()
+        with pytest.raises(FileNotFoundError, match="Executable module not found"):
+            ModuleExecutable(DataModelRow(id="row-2"), config)
+
+    def test_python_path_modules_reimported_only_when_changed(self, tmp_path: Path, monkeypatch):
+        """Test that discovered python_path modules are imported once per version."""
+        monkeypatch.chdir(tmp_path)
+        self.create_test_module(tmp_path, "runner", "def run(**kwargs) -> int:\n    return 1\n")
+        plugins = tmp_path / "plugins"
+        plugins.mkdir()
+        imports = tmp_path / "imports.log"
+        plugin_content = f"open({str(imports)!r}, 'a').write('x')\n"
+        plugin = plugins / "tracked_plugin.py"
+        plugin.write_text(plugin_content)
+        config = ModuleExecutableConfig(path="runner", processor="run", python_path=[str(plugins)])
+
+        for i in range(3):
+            ModuleExecutable(DataModelRow(id=f"row-{i}"), config).execute()
+        assert imports.read_text() == "x"
+
+        # Editing in place leaves the directory's mtime unchanged
+        plugin.write_text(plugin_content + "# edited\n")
+        ModuleExecutable(DataModelRow(id="row-3"), config).execute()
+        assert imports.read_text() == "xx"
+
+        (plugins / "new_plugin.py").write_text(plugin_content.replace("'x'", "'y'"))
+        ModuleExecutable(DataModelRow(id="row-4"), config).execute()
+        assert imports.read_text() == "xxy"
+
     def test_module_execution_with_kwargs(self, tmp_path: Path, monkeypatch):
         """Test module execution with additional kwargs."""
         monkeypatch.chdir(tmp_path)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 from exp_platform_cli.models import ExperimentConfig
 from exp_platform_cli.services import ConfigLoader
@@ -93,3 +95,129 @@ def test_yaml_config_equivalence_with_json(tmp_path: Path):
     assert len(json_config.evaluators) == len(yaml_config.evaluators)
     assert json_config.local_mode == yaml_config.local_mode
     assert json_config.output_path == yaml_config.output_path
+
+
+def test_config_loader_cache_invalidates_on_change(tmp_path: Path, monkeypatch):
+    """Cached configs are reused until the file changes, and callers get copies."""
+    monkeypatch.setenv("EXP_CLI_CACHE_DIR", str(tmp_path / "cache"))
+
+    config_data = {
+        "dataset": {"name": "cached", "version": "1.0"},
+        "executable": {"type": "module", "path": "test_module", "processor": "run"},
+    }
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump(config_data))
+
+    first = ConfigLoader.load_config(config_file)
+    first.dataset.name = "mutated"
+    assert ConfigLoader.load_config(config_file).dataset.name == "cached"
+    assert any((tmp_path / "cache" / "configs").glob("*.pkl"))
+
+    config_data["dataset"]["name"] = "updated_name"
+    config_file.write_text(yaml.dump(config_data))
+    assert ConfigLoader.load_config(config_file).dataset.name == "updated_name"
+
+
+def test_config_loader_reuses_parse_for_identical_content(tmp_path: Path, monkeypatch):
+    """A copy of an already parsed config is not parsed again."""
+    monkeypatch.setenv("EXP_CLI_CACHE_DIR", str(tmp_path / "cache"))
+
+    config_data = {
+        "dataset": {"name": "shared", "version": "1.0"},
+        "executable": {"type": "module", "path": "test_module", "processor": "run"},
+    }
+    original = tmp_path / "original.yaml"
+    original.write_text(yaml.dump(config_data))
+    ConfigLoader.load_config(original)
+
+    copy = tmp_path / "copy.yaml"
+    copy.write_bytes(original.read_bytes())
+    monkeypatch.setattr(ConfigLoader, "_parse", pytest.fail)
+    assert ConfigLoader.load_config(copy).dataset.name == "shared"
+
+
+def test_config_loader_caches_are_bounded(tmp_path: Path, monkeypatch):
+    """Only the most recently used configs stay cached in memory and on disk."""
+    monkeypatch.setattr(ConfigLoader, "_max_memory_entries", 2)
+    monkeypatch.setattr(ConfigLoader, "_max_disk_entries", 2)
+    monkeypatch.setattr(ConfigLoader, "_memory_cache", type(ConfigLoader._memory_cache)())
+    monkeypatch.setattr(ConfigLoader, "_content_cache", type(ConfigLoader._content_cache)())
+
+    for index in range(4):
+        config_data = {
+            "dataset": {"name": f"bounded{index}", "version": "1.0"},
+            "executable": {"type": "module", "path": "test_module", "processor": "run"},
+        }
+        config_file = tmp_path / f"config{index}.yaml"
+        config_file.write_text(yaml.dump(config_data))
+        ConfigLoader.load_config(config_file)
+
+    assert len(ConfigLoader._memory_cache) == 2
+    assert len(ConfigLoader._content_cache) == 2
+    assert len(list((tmp_path / "cache" / "configs").glob("*.pkl"))) == 2
+
+
+def _write_config(path: Path, name: str) -> None:
+    path.write_text(
+        yaml.dump(
+            {
+                "dataset": {"name": name, "version": "1.0"},
+                "executable": {"type": "module", "path": "test_module", "processor": "run"},
+            }
+        )
+    )
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions only")
+def test_config_loader_cache_dir_is_private_under_group_umask(tmp_path: Path, monkeypatch):
+    """A umask of 002 still yields a usable, private cache directory."""
+    from exp_platform_cli.services import config_loader
+
+    monkeypatch.setattr(ConfigLoader, "_memory_cache", type(ConfigLoader._memory_cache)())
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "group_umask")
+
+    previous = os.umask(0o002)
+    try:
+        ConfigLoader.load_config(config_file)
+    finally:
+        os.umask(previous)
+
+    cache_dir = tmp_path / "cache" / "configs"
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert config_loader._cache_dir() == cache_dir
+
+    # An existing directory left open by an earlier run is tightened, not abandoned
+    cache_dir.chmod(0o775)
+    assert config_loader._cache_dir() == cache_dir
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+    ConfigLoader._memory_cache.clear()
+    monkeypatch.setattr(ConfigLoader, "_load_content", pytest.fail)
+    assert ConfigLoader.load_config(config_file).dataset.name == "group_umask"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership only")
+def test_config_loader_skips_cache_dir_owned_by_others(tmp_path: Path, monkeypatch):
+    """A cache directory owned by another user is never unpickled from."""
+    from exp_platform_cli.services import config_loader
+
+    cache_dir = tmp_path / "cache" / "configs"
+    assert config_loader._cache_dir() == cache_dir
+
+    monkeypatch.setattr(os, "getuid", lambda: cache_dir.stat().st_uid + 1)
+    assert config_loader._cache_dir() is None
+
+    config_file = tmp_path / "config.yaml"
+    _write_config(config_file, "shared_dir")
+    assert ConfigLoader.load_config(config_file).dataset.name == "shared_dir"
+    assert not list(cache_dir.iterdir())
+
+
+def test_config_loader_uses_libyaml_when_available():
+    from exp_platform_cli.services import config_loader
+
+    if yaml.__with_libyaml__:
+        assert config_loader._YamlLoader is yaml.CSafeLoader
+    else:
+        assert config_loader._YamlLoader is yaml.SafeLoader